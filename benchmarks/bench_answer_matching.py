@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for per-answer grading cost.
+
+Compares the original _check_answer (lower() on both strings for every
+comparison) with answer keys compiled once by answer_matching.
+
+    python benchmarks/bench_answer_matching.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from educational_ai_agent.answer_matching import compile_answer
+
+# (expected answer, student answer) pairs covering each kind of key
+CASES = [
+    (12, 12),
+    (12, 7),
+    (9.8, 9.8),
+    ('Newton', 'newton'),
+    ("Newton's Second Law", "Newton's Second Law"),
+    ('Carbon dioxide', 'carbon  dioxide'),
+    ('H2O', 'H2O'),
+    ('4 Fe + 3 O2 → 2 Fe2O3', '4 Fe + 3 O2 → 2 Fe2O3'),
+    ('4 Fe + 3 O2 → 2 Fe2O3', '4Fe + 3O2 -> 2Fe2O3'),
+]
+
+
+def legacy_check_answer(question, student_answer) -> bool:
+    """_check_answer as it was before answers were compiled."""
+    if isinstance(question['answer'], str) and isinstance(student_answer, str):
+        return student_answer.lower() == question['answer'].lower()
+    return student_answer == question['answer']
+
+
+def main(repeat: int = 5, number: int = 20000) -> None:
+    questions = [{'answer': expected} for expected, _ in CASES]
+    keys = [compile_answer(expected) for expected, _ in CASES]
+    answers = [answer for _, answer in CASES]
+
+    def before():
+        for question, answer in zip(questions, answers):
+            legacy_check_answer(question, answer)
+
+    def after():
+        for key, answer in zip(keys, answers):
+            key.matches(answer)
+
+    def compile_all():
+        for expected, _ in CASES:
+            compile_answer(expected)
+
+    per_answer = number * len(CASES)
+    for label, func in (('before (_check_answer)', before), ('after (compiled key)', after),
+                        ('compile cost (once per question)', compile_all)):
+        best = min(timeit.repeat(func, repeat=repeat, number=number))
+        print(f"{label:34s} {best / per_answer * 1e9:8.1f} ns/answer")
+
+    print("\nPer-case cost (ns/answer):")
+    for (expected, answer), question, key in zip(CASES, questions, keys):
+        legacy = min(timeit.repeat(lambda: legacy_check_answer(question, answer), repeat=repeat, number=number))
+        compiled = min(timeit.repeat(lambda: key.matches(answer), repeat=repeat, number=number))
+        print(f"  {type(key).__name__:12s} {answer!r:32} before {legacy / number * 1e9:7.1f}"
+              f"  after {compiled / number * 1e9:7.1f}  accepted: {legacy_check_answer(question, answer)} -> {key.matches(answer)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Throughput of streaming profile export and import, in both formats.
+
+Builds a synthetic class with graded quiz history, exports it, imports the
+export into a fresh agent, and reports rows per second and file size. With
+--memory it also reports the peak memory allocated while exporting, which
+stays at about one chunk of records however many students there are.
+
+    python benchmarks/bench_bulk.py --students 100000 --attempts 5
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from educational_ai_agent import EducationalAIAgent, bulk
+
+SUBJECTS = ['math', 'physics', 'chemistry']
+ANSWERS = [12, 7, 60, 9, 25, 'Newton', 9.8, 5, 'H2O', 8, 7, 2]
+
+
+def build_agent(students: int, attempts: int, seed: int) -> EducationalAIAgent:
+    rng = random.Random(seed)
+    agent = EducationalAIAgent()
+    student_ids = [f'student_{i:08d}' for i in range(students)]
+    bulk.import_profiles(agent, ((student_id, {'name': student_id}) for student_id in student_ids))
+    # Issue and grade a chunk of quizzes at a time, so open sessions stay under max_quiz_sessions
+    for _ in range(attempts):
+        for offset in range(0, students, 10000):
+            submissions = []
+            for student_id in student_ids[offset:offset + 10000]:
+                subject = rng.choice(SUBJECTS)
+                quiz = agent.generate_quiz(student_id, subject)
+                submissions.append((student_id, subject, [rng.choice(ANSWERS) for _ in quiz], quiz.session_id))
+            agent.evaluate_quiz_batch(submissions)
+    return agent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--attempts', type=int, default=5, help='graded quizzes per student')
+    parser.add_argument('--chunk', type=int, default=1000)
+    parser.add_argument('--memory', action='store_true', help='also measure peak memory while exporting')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    agent = build_agent(args.students, args.attempts, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in bulk.FORMATS:
+            path = os.path.join(directory, f'profiles.{fmt}')
+            start = time.perf_counter()
+            bulk.export_profiles(agent, path, fmt, chunk_size=args.chunk)
+            export_time = time.perf_counter() - start
+
+            target = EducationalAIAgent(question_store=agent.question_store)
+            start = time.perf_counter()
+            bulk.import_file(target, path, chunk_size=args.chunk)
+            import_time = time.perf_counter() - start
+
+            size = os.path.getsize(path)
+            print(f"{fmt:<7s} export {args.students / export_time:10,.0f} rows/s  "
+                  f"import {args.students / import_time:10,.0f} rows/s  "
+                  f"{size / 2 ** 20:8.1f} MiB ({size / args.students:.0f} B/row)")
+
+            if args.memory:
+                tracemalloc.start()
+                bulk.export_profiles(agent, path, fmt, chunk_size=args.chunk)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"        peak memory while exporting: {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
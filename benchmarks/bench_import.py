@@ -0,0 +1,102 @@
+"""
+Import and startup time of the educational_ai_agent package.
+
+Each case runs in a fresh interpreter, timed from inside it so interpreter
+startup is excluded:
+
+  import_package  import educational_ai_agent
+  import_agent    from educational_ai_agent import EducationalAIAgent
+  first_profile   the above, then an agent and one profile (loads the question bank)
+  cli_help        python -m educational_ai_agent --help, wall clock less a bare interpreter
+
+After import_agent it also lists any modules that should only load on
+demand (SQLite, JSON, storage, the service, the built-in bank) but did.
+
+    python benchmarks/bench_import.py --repeat 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'import_package': 'import educational_ai_agent',
+    'import_agent': 'from educational_ai_agent import EducationalAIAgent',
+    'first_profile': ('from educational_ai_agent import EducationalAIAgent\n'
+                      'EducationalAIAgent().create_student_profile("s", "S")'),
+}
+# Modules that importing the agent must not load
+LAZY_MODULES = (
+    'sqlite3',
+    'json',
+    'educational_ai_agent.persistence',
+    'educational_ai_agent.retention',
+    'educational_ai_agent.service',
+    'educational_ai_agent.default_bank',
+)
+
+_TIMER = '''
+import sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], '<case>', 'exec'))
+print(time.perf_counter() - start)
+print(' '.join(name for name in sys.argv[2:] if name in sys.modules))
+'''
+
+
+def _run(args: List[str]) -> str:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def time_case(statement: str, repeat: int) -> Dict:
+    """Time a statement in repeat fresh interpreters; returns the median, the best and the lazy modules loaded."""
+    _run(['-c', _TIMER, statement])  # writes bytecode caches, so no run pays for compiling
+    seconds = []
+    for _ in range(repeat):
+        elapsed, loaded = _run(['-c', _TIMER, statement, *LAZY_MODULES]).splitlines()
+        seconds.append(float(elapsed))
+    return {'median_ms': statistics.median(seconds) * 1000, 'best_ms': min(seconds) * 1000,
+            'loaded_eagerly': loaded.split()}
+
+
+def time_cli(repeat: int) -> Dict:
+    """Wall-clock time of the CLI's --help, less that of an interpreter doing nothing."""
+    def wall(args: List[str]) -> List[float]:
+        seconds = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _run(args)
+            seconds.append(time.perf_counter() - start)
+        return seconds
+
+    floor = statistics.median(wall(['-c', 'pass']))
+    seconds = [elapsed - floor for elapsed in wall(['-m', 'educational_ai_agent', '--help'])]
+    return {'median_ms': statistics.median(seconds) * 1000, 'best_ms': min(seconds) * 1000}
+
+
+def measure(repeat: int) -> Dict[str, Dict]:
+    results = {case: time_case(statement, repeat) for case, statement in CASES.items()}
+    results['cli_help'] = time_cli(repeat)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='fresh interpreters per case')
+    args = parser.parse_args()
+
+    results = measure(args.repeat)
+    for case, result in results.items():
+        print(f"{case:<16s} {result['median_ms']:8.1f} ms median  {result['best_ms']:8.1f} ms best")
+    loaded = results['import_agent']['loaded_eagerly']
+    if loaded:
+        sys.exit(f"Loaded on import, should be lazy: {', '.join(loaded)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Overhead of agent instrumentation.
+
+Runs the same quiz workload (generate, evaluate, progress report) on an agent
+that was never instrumented, one whose instrumentation was enabled and then
+disabled, one with instrumentation enabled, and one that also samples every
+--profile-every-th call with cProfile. Reports the best of --repeat runs of each.
+
+    python benchmarks/bench_instrumentation.py --students 2000 --rounds 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from educational_ai_agent import EducationalAIAgent
+from educational_ai_agent.instrumentation import AgentInstrumentation
+
+SUBJECTS = ['math', 'physics', 'chemistry']
+ANSWERS = [12, 7, 60, 9, 25, 'Newton', 9.8, 5, 'H2O', 8, 7, 2]
+
+
+def workload(agent: EducationalAIAgent, students: int, rounds: int, seed: int) -> float:
+    rng = random.Random(seed)
+    random.seed(seed)
+    student_ids = [f'student_{i}' for i in range(students)]
+    start = time.perf_counter()
+    for student_id in student_ids:
+        agent.create_student_profile(student_id, student_id)
+    for _ in range(rounds):
+        for student_id in student_ids:
+            subject = rng.choice(SUBJECTS)
+            quiz = agent.generate_quiz(student_id, subject)
+            agent.evaluate_quiz(student_id, subject, [rng.choice(ANSWERS) for _ in quiz], quiz.session_id)
+        for student_id in student_ids:
+            agent.track_progress(student_id)
+    return time.perf_counter() - start
+
+
+def configurations(profile_every: int):
+    yield 'never instrumented', lambda agent: None
+    yield 'enabled, then disabled', lambda agent: AgentInstrumentation(agent).enable().disable()
+    yield 'enabled', lambda agent: AgentInstrumentation(agent).enable()
+    yield f'enabled, profiling 1/{profile_every}', lambda agent: AgentInstrumentation(agent, profile_every).enable()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--profile-every', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Configurations take turns within each repeat so machine noise hits them alike
+    labels = []
+    best = {}
+    for _ in range(args.repeat):
+        for label, setup in configurations(args.profile_every):
+            agent = EducationalAIAgent()
+            setup(agent)
+            elapsed = workload(agent, args.students, args.rounds, args.seed)
+            if label not in best:
+                labels.append(label)
+            best[label] = min(best.get(label, elapsed), elapsed)
+    baseline = best[labels[0]]
+    for label in labels:
+        print(f"{label:<28s} {best[label]:7.3f}s  overhead {100 * (best[label] / baseline - 1):+6.1f}%")
+
+if __name__ == '__main__':
+    main()
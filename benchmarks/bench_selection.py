@@ -0,0 +1,59 @@
+"""
+Cost of adaptive question selection as the question bank grows.
+
+For each pool size, a student answers --history quizzes from one subject
+and level, then the time per quiz selection is measured. A draw is O(log n)
+in the pool size, so the per-quiz cost should grow only slowly.
+
+    python benchmarks/bench_selection.py --sizes 1000 100000 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from educational_ai_agent.question_store import LEVELS, SQLiteQuestionStore, build_question_db
+from educational_ai_agent.records import QuizAttempt, StudentProfile
+from educational_ai_agent.selection import AdaptiveSelector
+
+
+def run(size: int, history: int, quizzes: int, seed: int, directory: str) -> None:
+    path = os.path.join(directory, f'bank-{size}.db')
+    build_question_db(path, {'math': {level: (
+        {'question': f'{level} question {i}', 'answer': i, 'explanation': ''} for i in range(size)
+    ) for level in LEVELS}})
+    store = SQLiteQuestionStore(path)
+    selector = AdaptiveSelector(store, random.Random(seed))
+    profile = StudentProfile.new('Student', store.subjects, 0)
+
+    for timestamp in range(history):
+        question_ids = selector.select('student', profile, 'math', 'easy', 3)
+        attempt = QuizAttempt(timestamp, 0, 0, 0.0, tuple(question_ids), (0, 0, 0), timestamp % 8)
+        profile.attempts.append(attempt)
+        selector.record('student', profile.subjects, attempt)
+
+    start = time.perf_counter()
+    for _ in range(quizzes):
+        selector.select('student', profile, 'math', 'easy', 3)
+    elapsed = time.perf_counter() - start
+    print(f"pool={size:<10,d} {elapsed / quizzes * 1e6:8.1f} us/quiz")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--history', type=int, default=500, help='quizzes answered before timing')
+    parser.add_argument('--quizzes', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            run(size, args.history, args.quizzes, args.seed, directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Throughput of ShardedAgentPool as the number of worker processes grows.
+
+Grades class-wide batches and builds bulk progress reports through the
+router's fan-out, for 1, 2, 4, ... shards up to the CPU count.
+
+    python benchmarks/bench_sharding.py --students 20000 --submissions 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from educational_ai_agent.sharding import ShardedAgentPool
+
+SUBJECTS = ['math', 'physics', 'chemistry']
+ANSWERS = [12, 7, 60, 9, 25, 'Newton', 9.8, 5, 'H2O', 8, 7, 2]
+
+
+def run(shards: int, students: int, submissions: int, chunk: int, seed: int) -> float:
+    rng = random.Random(seed)
+    student_ids = [f'student_{i}' for i in range(students)]
+    work = [(rng.choice(student_ids), rng.choice(SUBJECTS), [rng.choice(ANSWERS) for _ in range(3)])
+            for _ in range(submissions)]
+    with ShardedAgentPool(shards=shards) as pool:
+        pool.fan_out('create_student_profile', [(student_id, {'name': student_id}) for student_id in student_ids])
+        elapsed = 0.0
+        for offset in range(0, len(work), chunk):
+            batch = work[offset:offset + chunk]
+            # Issuing the quizzes is not timed; only grading them is
+            quizzes = pool.fan_out('generate_quiz', [(student_id, {'subject': subject})
+                                                     for student_id, subject, _ in batch])
+            issued = [(*submission, quiz.session_id) for submission, quiz in zip(batch, quizzes)]
+            start = time.perf_counter()
+            pool.evaluate_quiz_batch(issued)
+            elapsed += time.perf_counter() - start
+        start = time.perf_counter()
+        for offset in range(0, students, chunk):
+            pool.track_progress_many(student_ids[offset:offset + chunk])
+        elapsed += time.perf_counter() - start
+    operations = submissions + students
+    print(f"shards={shards:<3d} {elapsed:7.2f}s  {operations / elapsed:10,.0f} ops/s")
+    return operations / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=20000)
+    parser.add_argument('--submissions', type=int, default=100000)
+    parser.add_argument('--chunk', type=int, default=5000, help='submissions per fan-out call')
+    parser.add_argument('--max-shards', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    shard_counts = []
+    shards = 1
+    while shards < args.max_shards:
+        shard_counts.append(shards)
+        shards *= 2
+    shard_counts.append(args.max_shards)
+
+    baseline = None
+    for shards in shard_counts:
+        throughput = run(shards, args.students, args.submissions, args.chunk, args.seed)
+        baseline = baseline or throughput
+        print(f"  speedup vs 1 shard: {throughput / baseline:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
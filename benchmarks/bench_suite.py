@@ -0,0 +1,255 @@
+"""
+Reproducible benchmark suite for the agent's main operations.
+
+Builds a synthetic question bank and student population from --seed, plays
+--attempts quiz attempts (1k to 10M) through the agent and measures:
+
+  generate_quiz        issuing a quiz
+  evaluate_quiz        grading an issued quiz
+  evaluate_quiz_batch  grading the same stream in batches of --chunk; --pause-gc grades them as the CLI does
+  track_progress       a progress report for every student afterwards
+  memory_per_profile   traced bytes per student after --attempts-per-student attempts
+  import_agent         importing EducationalAIAgent in a fresh interpreter
+
+Timed cases keep the best of --repeat runs. Results are printed and, with
+--output, written as JSON. --compare reads an earlier JSON file and exits
+non-zero if any case got slower (or bigger) by more than --threshold.
+
+    python benchmarks/bench_suite.py --attempts 100000 --output before.json
+    python benchmarks/bench_suite.py --attempts 100000 --compare before.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bench_import
+import synthetic
+from educational_ai_agent import EducationalAIAgent
+from educational_ai_agent.question_store import QuestionStore
+
+CASES = ('generate_quiz', 'evaluate_quiz', 'evaluate_quiz_batch', 'track_progress', 'memory_per_profile',
+         'import_agent')
+
+
+def _timing(operations: int, seconds: float) -> Dict:
+    return {
+        'operations': operations,
+        'seconds': seconds,
+        'per_second': operations / seconds if seconds else 0.0,
+        'us_per_op': seconds / operations * 1e6 if operations else 0.0,
+    }
+
+
+def _population(agent: EducationalAIAgent, seed: int, count: int) -> Dict[str, float]:
+    skills = {}
+    for student_id, name, skill in synthetic.students(seed, count):
+        agent.create_student_profile(student_id, name)
+        skills[student_id] = skill
+    return skills
+
+
+def _reseed(seed: int) -> random.Random:
+    # The agent samples through the random module; seed it so runs are reproducible
+    random.seed(seed)
+    return random.Random(seed)
+
+
+def run_interactive(store: QuestionStore, args) -> Dict:
+    """generate_quiz, evaluate_quiz and track_progress, one call at a time."""
+    rng = _reseed(args.seed)
+    agent = EducationalAIAgent(question_store=store)
+    skills = _population(agent, args.seed, args.students)
+    stream = synthetic.attempt_stream(args.seed, list(skills), args.attempts)
+    generate_time = evaluate_time = 0.0
+    perf_counter = time.perf_counter
+    while True:
+        chunk = [request for _, request in zip(range(args.chunk), stream)]
+        if not chunk:
+            break
+        start = perf_counter()
+        quizzes = [agent.generate_quiz(student_id, subject) for student_id, subject in chunk]
+        generate_time += perf_counter() - start
+        answers = [synthetic.answer_quiz(rng, quiz, skills[student_id]) for (student_id, _), quiz in zip(chunk, quizzes)]
+        # Results are kept for the chunk, as evaluate_quiz_batch keeps them, so the two compare like for like
+        start = perf_counter()
+        results = [agent.evaluate_quiz(student_id, subject, student_answers, quiz.session_id)
+                   for (student_id, subject), quiz, student_answers in zip(chunk, quizzes, answers)]
+        evaluate_time += perf_counter() - start
+        del results
+
+    start = perf_counter()
+    for student_id in skills:
+        agent.track_progress(student_id)
+    progress_time = perf_counter() - start
+    return {
+        'generate_quiz': _timing(args.attempts, generate_time),
+        'evaluate_quiz': _timing(args.attempts, evaluate_time),
+        'track_progress': _timing(len(skills), progress_time),
+    }
+
+
+def run_batch(store: QuestionStore, args) -> Dict:
+    """The same attempt stream graded with evaluate_quiz_batch."""
+    rng = _reseed(args.seed)
+    agent = EducationalAIAgent(question_store=store)
+    skills = _population(agent, args.seed, args.students)
+    stream = synthetic.attempt_stream(args.seed, list(skills), args.attempts)
+    batch_time = 0.0
+    while True:
+        chunk = [request for _, request in zip(range(args.chunk), stream)]
+        if not chunk:
+            break
+        submissions = []
+        for student_id, subject in chunk:
+            quiz = agent.generate_quiz(student_id, subject)
+            submissions.append((student_id, subject, synthetic.answer_quiz(rng, quiz, skills[student_id]),
+                                quiz.session_id))
+        start = time.perf_counter()
+        agent.evaluate_quiz_batch(submissions, pause_gc=args.pause_gc)
+        batch_time += time.perf_counter() - start
+    return {'evaluate_quiz_batch': _timing(args.attempts, batch_time)}
+
+
+def run_memory(store: QuestionStore, args) -> Dict:
+    """
+    Traced memory per student after each has taken --attempts-per-student
+    quizzes: the profile plus the agent's per-student selection statistics.
+    """
+    rng = _reseed(args.seed)
+    agent = EducationalAIAgent(question_store=store)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    skills = _population(agent, args.seed, args.memory_students)
+    for student_id, skill in skills.items():
+        for _ in range(args.attempts_per_student):
+            subject = rng.choice(synthetic.SUBJECTS)
+            quiz = agent.generate_quiz(student_id, subject)
+            agent.evaluate_quiz(student_id, subject, synthetic.answer_quiz(rng, quiz, skill), quiz.session_id)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {'memory_per_profile': {
+        'profiles': len(skills),
+        'attempts_per_profile': args.attempts_per_student,
+        'bytes_per_profile': used / len(skills),
+    }}
+
+
+def run_import(args) -> Dict:
+    """Best time to import EducationalAIAgent, over fresh interpreters."""
+    result = bench_import.time_case(bench_import.CASES['import_agent'], max(5, args.repeat))
+    return {'import_agent': _timing(1, result['best_ms'] / 1000)}
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _cost(result: Dict) -> float:
+    """The number compared across runs: time per operation, or bytes per profile."""
+    return result['bytes_per_profile'] if 'bytes_per_profile' in result else result['us_per_op']
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Print a comparison table; return the cases that regressed by more than threshold."""
+    regressions = []
+    print(f"\n{'case':<22s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+    for case, result in current['results'].items():
+        if case not in baseline['results']:
+            continue
+        before, after = _cost(baseline['results'][case]), _cost(result)
+        change = after / before - 1 if before else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(case)
+            flag = '  REGRESSION'
+        print(f"{case:<22s} {before:12.2f} {after:12.2f} {100 * change:+7.1f}%{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--attempts', type=int, default=100000, help='quiz attempts to play, 1k to 10M')
+    parser.add_argument('--students', type=int, help='population size (default: attempts / 10)')
+    parser.add_argument('--questions-per-level', type=int, default=200)
+    parser.add_argument('--chunk', type=int, default=10000, help='requests generated and graded at a time')
+    parser.add_argument('--pause-gc', action='store_true',
+                        help='grade evaluate_quiz_batch chunks with the garbage collector paused, as the CLI does')
+    parser.add_argument('--memory-students', type=int, default=1000)
+    parser.add_argument('--attempts-per-student', type=int, default=50)
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=1, help='run timed cases this many times, keep the best')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown before flagging, 0.10 = 10%%')
+    args = parser.parse_args()
+    args.students = args.students or max(1, args.attempts // 10)
+
+    store = QuestionStore.from_dict(synthetic.question_bank(args.seed, args.questions_per_level))
+    results = {}
+    for _ in range(args.repeat):
+        timings = {}
+        if {'generate_quiz', 'evaluate_quiz', 'track_progress'} & set(args.cases):
+            timings.update(run_interactive(store, args))
+        if 'evaluate_quiz_batch' in args.cases:
+            timings.update(run_batch(store, args))
+        # Keep the fastest run of each case; slower runs measure machine noise
+        for case, timing in timings.items():
+            if case not in results or timing['us_per_op'] < results[case]['us_per_op']:
+                results[case] = timing
+    if 'memory_per_profile' in args.cases:
+        results.update(run_memory(store, args))
+    if 'import_agent' in args.cases:
+        results.update(run_import(args))
+    results = {case: results[case] for case in CASES if case in args.cases}
+
+    for case, result in results.items():
+        if 'bytes_per_profile' in result:
+            print(f"{case:<22s} {result['bytes_per_profile']:12,.0f} bytes/profile "
+                  f"({result['attempts_per_profile']} attempts)")
+        elif result['operations'] == 1:
+            print(f"{case:<22s} {result['us_per_op'] / 1000:12.1f} ms")
+        else:
+            print(f"{case:<22s} {result['per_second']:12,.0f} ops/s  {result['us_per_op']:8.1f} us/op")
+    if 'evaluate_quiz' in results and 'evaluate_quiz_batch' in results:
+        speedup = results['evaluate_quiz']['us_per_op'] / results['evaluate_quiz_batch']['us_per_op']
+        print(f"{'batch vs one at a time':<22s} {speedup:12.2f}x")
+
+    report = {
+        'meta': {
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'parameters': {name: value for name, value in vars(args).items() if name not in ('output', 'compare')},
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressions = compare(json.load(handle), report, args.threshold)
+        if regressions:
+            sys.exit(f"Regressed: {', '.join(regressions)}")
+
+
+if __name__ == '__main__':
+    main()
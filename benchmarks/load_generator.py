@@ -0,0 +1,107 @@
+"""
+Local load generator for service.py.
+
+Starts the service in-process (or targets --port on a running one), opens one
+connection per simulated student and has each run quiz/grade/report cycles.
+Reports client-side p50/p99 latency and overall throughput.
+
+    python benchmarks/load_generator.py --students 500 --requests 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from educational_ai_agent import EducationalAIAgent
+from educational_ai_agent.service import AgentService
+
+SUBJECTS = ['math', 'physics', 'chemistry']
+ANSWERS = [12, 7, 60, 9, 25, 'Newton', 9.8, 5, 'H2O', 8, 7, 2]
+
+
+class Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+
+    async def call(self, method: str, latencies: List[float], **params):
+        self.next_id += 1
+        start = time.perf_counter()
+        self.writer.write(json.dumps({'id': self.next_id, 'method': method, 'params': params}).encode() + b'\n')
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['result']
+
+
+async def simulate_student(host: str, port: int, index: int, requests: int, latencies: List[float], rng: random.Random):
+    reader, writer = await asyncio.open_connection(host, port)
+    client = Client(reader, writer)
+    student_id = f'load_{index}'
+    await client.call('create_student_profile', latencies, student_id=student_id, name=f'Student {index}')
+    for _ in range(requests):
+        subject = rng.choice(SUBJECTS)
+        quiz = await client.call('generate_quiz', latencies, student_id=student_id, subject=subject)
+        answers = [rng.choice(ANSWERS) for _ in quiz['questions']]
+        await client.call('evaluate_quiz', latencies, student_id=student_id, subject=subject,
+                          student_answers=answers, session_id=quiz['session_id'])
+        if rng.random() < 0.2:
+            await client.call('track_progress', latencies, student_id=student_id)
+    writer.close()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(students: int, requests: int, port: Optional[int], seed: int) -> None:
+    service = None
+    host = '127.0.0.1'
+    if port is None:
+        service = AgentService(EducationalAIAgent())
+        server = await service.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        simulate_student(host, port, index, requests, latencies, random.Random(rng.random()))
+        for index in range(students)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Students: {students}, requests: {len(latencies)}, elapsed: {elapsed:.2f}s")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} requests/s")
+    print(f"Latency p50: {percentile(latencies, 0.50) * 1000:.2f} ms, "
+          f"p99: {percentile(latencies, 0.99) * 1000:.2f} ms, max: {latencies[-1] * 1000:.2f} ms")
+    if service is not None:
+        print("Server-side latency by method:")
+        for method, summary in service.stats()['latency'].items():
+            if summary['count']:
+                print(f"  {method:24s} n={summary['count']:<7d} p50={summary['p50_ms']:.2f}ms p99={summary['p99_ms']:.2f}ms")
+        await service.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=200, help='concurrent simulated students')
+    parser.add_argument('--requests', type=int, default=20, help='quiz cycles per student')
+    parser.add_argument('--port', type=int, default=None, help='target a running service instead of starting one')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.students, args.requests, args.port, args.seed))
+
+
+if __name__ == '__main__':
+    main()
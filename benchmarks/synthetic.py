@@ -0,0 +1,63 @@
+"""
+Seeded generators of synthetic benchmark data: question banks, student
+populations and streams of quiz attempts. The same seed always produces the
+same data, so results can be compared across commits.
+"""
+import random
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from educational_ai_agent.question_store import LEVELS
+
+SUBJECTS = ('math', 'physics', 'chemistry')
+_WORDS = ('force', 'energy', 'acid', 'oxygen', 'carbon', 'velocity', 'mass', 'charge', 'atom', 'wave')
+_ELEMENTS = ('H', 'O', 'C', 'N', 'Na', 'Cl', 'Fe', 'Mg')
+
+
+def _answer(rng: random.Random):
+    """An expected answer of one of the kinds the answer matcher compiles: int, float, text or equation."""
+    kind = rng.random()
+    if kind < 0.4:
+        return rng.randrange(1000)
+    if kind < 0.6:
+        return round(rng.uniform(0, 100), rng.randrange(1, 3))
+    if kind < 0.9:
+        return ' '.join(rng.choice(_WORDS) for _ in range(rng.randrange(1, 4))).capitalize()
+    left = ' + '.join(f'{rng.randrange(1, 5)} {rng.choice(_ELEMENTS)}{rng.randrange(1, 3)}' for _ in range(2))
+    return f'{left} → {rng.randrange(1, 5)} {rng.choice(_ELEMENTS)}{rng.choice(_ELEMENTS)}'
+
+
+def question_bank(seed: int, questions_per_level: int,
+                  subjects: Sequence[str] = SUBJECTS) -> Dict[str, Dict[str, List[Dict]]]:
+    """A {subject: {level: [question, ...]}} bank with questions_per_level questions in every pool."""
+    rng = random.Random(seed)
+    return {
+        subject: {
+            level: [
+                {'question': f'{subject} {level} question {i}', 'answer': _answer(rng),
+                 'explanation': f'Explanation of {subject} {level} question {i}'}
+                for i in range(questions_per_level)
+            ]
+            for level in LEVELS
+        }
+        for subject in subjects
+    }
+
+
+def students(seed: int, count: int) -> Iterator[Tuple[str, str, float]]:
+    """Yield (student_id, name, skill) for a population; skill is the chance of answering correctly."""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield f'student_{i:08d}', f'Student {i}', rng.betavariate(4, 2)
+
+
+def attempt_stream(seed: int, student_ids: Sequence[str], count: int,
+                   subjects: Sequence[str] = SUBJECTS) -> Iterator[Tuple[str, str]]:
+    """Yield count (student_id, subject) quiz requests, students and subjects drawn uniformly."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.choice(student_ids), rng.choice(subjects)
+
+
+def answer_quiz(rng: random.Random, quiz: Sequence[Dict], skill: float) -> List:
+    """Answer an issued quiz, getting each question right with probability skill."""
+    return [question['answer'] if rng.random() < skill else 'wrong answer' for question in quiz]
@@ -0,0 +1,72 @@
+"""
+Educational AI agent: student profiles, adaptive quizzes, grading and
+progress reports.
+
+Importing the package runs nothing and loads nothing heavy. Each public name
+is imported from its submodule the first time it is used, so
+``from educational_ai_agent import EducationalAIAgent`` loads neither
+persistence, SQLite, the service nor the built-in question bank; the agent
+loads the bank on first use.
+
+    python -m educational_ai_agent demo
+    python -m educational_ai_agent grade submissions.jsonl
+    python -m educational_ai_agent report roster.txt
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'EducationalAIAgent': 'agent',
+    'ActivityTracker': 'activity',
+    'Clock': 'activity',
+    'LEVELS': 'question_store',
+    'QuestionStore': 'question_store',
+    'SQLiteQuestionStore': 'question_store',
+    'build_question_db': 'question_store',
+    'load_question_store': 'question_store',
+    'QuizAttempt': 'records',
+    'StudentProfile': 'records',
+    'Quiz': 'sessions',
+    'AdaptiveSelector': 'selection',
+    'StorageBackend': 'persistence',
+    'FileStorage': 'persistence',
+    'SQLiteStorage': 'persistence',
+    'AttemptArchive': 'retention',
+    'RetentionPolicy': 'retention',
+    'CohortAnalytics': 'cohorts',
+    'AgentInstrumentation': 'instrumentation',
+    'AgentService': 'service',
+    'ShardedAgentPool': 'sharding',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    # Cache on the package so later lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from .activity import ActivityTracker, Clock
+    from .agent import EducationalAIAgent
+    from .cohorts import CohortAnalytics
+    from .instrumentation import AgentInstrumentation
+    from .persistence import FileStorage, SQLiteStorage, StorageBackend
+    from .question_store import LEVELS, QuestionStore, SQLiteQuestionStore, build_question_db, load_question_store
+    from .records import QuizAttempt, StudentProfile
+    from .retention import AttemptArchive, RetentionPolicy
+    from .selection import AdaptiveSelector
+    from .service import AgentService
+    from .sessions import Quiz
+    from .sharding import ShardedAgentPool
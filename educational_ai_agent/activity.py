@@ -0,0 +1,68 @@
+"""
+Timestamps and student activity.
+
+Every timestamp the agent stores is an integer number of epoch seconds from
+a Clock, and is only formatted when a report is built. A student's
+last_activity is updated in memory whenever they use the agent, but writing
+each update to storage would turn every call, reports included, into a log
+append. ActivityTracker instead collects the latest timestamp per student and
+the agent logs them together, as one 'activity' event, once flush_every
+students are pending or the oldest pending update is flush_interval seconds
+old, and whenever it snapshots or closes. A student active many times
+between flushes costs one entry.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class Clock:
+    """
+    Integer epoch seconds that never go backwards. The monotonic clock is
+    anchored to the wall clock once, when the Clock is created, so later
+    wall clock adjustments do not reorder timestamps.
+    """
+
+    def __init__(self, wall: Callable[[], float] = time.time, monotonic: Callable[[], float] = time.monotonic):
+        self._monotonic = monotonic
+        self._offset = wall() - monotonic()
+
+    def now(self) -> int:
+        return int(self._monotonic() + self._offset)
+
+
+class ActivityTracker:
+    """
+    Pending last_activity updates, waiting to be logged in a batch.
+
+    flush_every: pending students that trigger a flush.
+    flush_interval: seconds a pending update may wait; checked as students are touched.
+    track_reads: when False, read-only calls such as track_progress and
+        provide_explanation leave last_activity unchanged.
+    """
+
+    def __init__(self, flush_every: int = 1000, flush_interval: float = 10.0, track_reads: bool = True):
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.track_reads = track_reads
+        self._pending: Dict[str, int] = {}
+        self._oldest: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def touch(self, student_id: str, timestamp: int) -> bool:
+        """Mark a student active at timestamp; returns True when the pending updates are due to be flushed."""
+        with self._lock:
+            self._pending[student_id] = timestamp
+            if self._oldest is None:
+                self._oldest = timestamp
+            return len(self._pending) >= self.flush_every or timestamp - self._oldest >= self.flush_interval
+
+    def take(self) -> Dict[str, int]:
+        """Remove and return the pending {student_id: last_activity} updates."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._oldest = None
+            return pending
@@ -0,0 +1,668 @@
+import gc
+import threading
+from contextlib import contextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from . import templates
+from .activity import ActivityTracker, Clock
+from .answer_matching import compile_answer
+from .question_store import LEVELS, QuestionStore, load_question_store
+from .records import (MAX_ANSWERS, NOT_ENOUGH_DATA, QuizAttempt, StudentProfile, SubjectAggregate, format_timestamp,
+                      overall_trend)
+from .selection import AdaptiveSelector
+from .sessions import Quiz, QuizSessionCache
+
+if TYPE_CHECKING:
+    # Storage and retention are passed in constructed, so the agent never imports them at runtime
+    from .persistence import StorageBackend
+    from .retention import RetentionPolicy
+
+HARD = LEVELS.index('hard')
+
+# Next level id indexed by [current level id][score band]; bands are
+# 0: score <= 30, 1: in between, 2: score >= 80
+LEVEL_TRANSITIONS = (
+    (0, 0, 1),
+    (0, 1, 2),
+    (0, 2, 2),
+)
+
+# evaluate_quiz_batch grades a round this many submissions at a time, so the
+# attempts and records of a slice are freed young instead of being promoted
+# to older GC generations while the rest of the round is graded
+BATCH_SLICE = 256
+
+
+def check_answers(student_id: str, subject: str, student_answers) -> None:
+    """
+    Raise ValueError unless a submission's answers are a non-empty list of at
+    most MAX_ANSWERS: scores divide by their number, and an attempt's correct
+    mask has one bit per answer.
+    """
+    if not isinstance(student_answers, (list, tuple)) or not student_answers:
+        raise ValueError(f"Answers from {student_id} for {subject} must be a non-empty list")
+    if len(student_answers) > MAX_ANSWERS:
+        raise ValueError(f"Answers from {student_id} for {subject} are more than {MAX_ANSWERS}")
+
+
+def _score_band(score: float) -> int:
+    if score >= 80:
+        return 2
+    if score <= 30:
+        return 0
+    return 1
+
+
+class EducationalAIAgent:
+    def __init__(self, question_store: Optional[QuestionStore] = None,
+                 storage: Optional['StorageBackend'] = None, snapshot_every: int = 10000,
+                 max_quiz_sessions: int = 100000, quiz_session_ttl: float = 3600.0,
+                 lazy_feedback: bool = False, retention: Optional['RetentionPolicy'] = None,
+                 clock: Optional[Clock] = None, activity: Optional[ActivityTracker] = None):
+        self.student_profiles: Dict[str, StudentProfile] = {}
+        # Source of every stored timestamp: integer epoch seconds that never go backwards
+        self.clock = clock or Clock()
+        # last_activity updates waiting to be logged to storage in a batch
+        self.activity = activity if activity is not None else ActivityTracker()
+        # Question banks are shared read-only between agent instances; without
+        # one the built-in bank is loaded on first use
+        if question_store is not None:
+            self.question_store = question_store
+        # Issued quizzes awaiting grading
+        self.quiz_sessions = QuizSessionCache(max_quiz_sessions, quiz_session_ttl)
+        # When set, per-question feedback in quiz results is rendered only when read
+        self.lazy_feedback = lazy_feedback
+        # How much attempt history profiles keep in memory; None keeps all of it
+        self.retention = retention
+        # Profile changes are logged to storage and compacted into a snapshot every snapshot_every events
+        self.storage = storage
+        self.snapshot_every = snapshot_every
+        self._seq = 0
+        self._events_since_snapshot = 0
+        # While positive, reaching snapshot_every does not snapshot; see holding_snapshots
+        self._snapshot_holds = 0
+        # Guards applying a change together with logging it, so snapshots never split the two
+        self._state_lock = threading.RLock()
+        # Called with a student id after that student's levels, mastery or scores change
+        self._change_listeners: List[Callable[[str], None]] = []
+        if storage is not None:
+            self._restore()
+
+    @cached_property
+    def question_store(self) -> QuestionStore:
+        """The built-in question bank, used when none was passed in."""
+        return load_question_store()
+
+    @cached_property
+    def selector(self) -> AdaptiveSelector:
+        """Weighted question selection and per-question statistics, built on first use."""
+        with self._state_lock:
+            # Another thread may have built it while this one waited for the lock
+            return self.__dict__.get('selector') or AdaptiveSelector(self.question_store)
+
+    def create_student_profile(self, student_id: str, name: str) -> None:
+        """Create a new student profile with initial settings."""
+        timestamp = self.clock.now()
+        with self._state_lock:
+            self.student_profiles[student_id] = StudentProfile.new(name, self.question_store.subjects, timestamp)
+            self.selector.forget(student_id)
+            self._log_event('profile', student_id, name=name, timestamp=timestamp)
+            self._notify_change(student_id)
+
+    def assess_learning_style(self, student_id: str, quiz_responses: List[Dict]) -> str:
+        """
+        Analyze quiz responses to determine learning style.
+        Returns: 'visual', 'auditory', or 'kinesthetic'
+        """
+        # Simplified learning style assessment
+        styles = {'visual': 0, 'auditory': 0, 'kinesthetic': 0}
+        
+        for response in quiz_responses:
+            if response.get('preference') == 'diagrams':
+                styles['visual'] += 1
+            elif response.get('preference') == 'verbal_explanation':
+                styles['auditory'] += 1
+            elif response.get('preference') == 'hands_on':
+                styles['kinesthetic'] += 1
+
+        learning_style = max(styles, key=styles.get)
+        timestamp = self.clock.now()
+        with self._state_lock:
+            self.student_profiles[student_id].learning_style = learning_style
+            self.student_profiles[student_id].last_activity = timestamp
+            self._log_event('learning_style', student_id, learning_style=learning_style, timestamp=timestamp)
+        return learning_style
+
+    def generate_quiz(self, student_id: str, subject: str) -> Quiz:
+        """
+        Generate a quiz based on student's current level, favouring questions
+        the student has not seen or keeps missing.
+        The returned list of questions carries a session_id to pass to evaluate_quiz.
+        """
+        profile = self.student_profiles[student_id]
+        current_level = LEVELS[profile.levels[self.question_store.subject_ids[subject]]]
+        question_ids = self.selector.select(student_id, profile, subject, current_level, 3)
+        self._touch(student_id, profile)
+        session_id = self.quiz_sessions.open(student_id, subject, tuple(question_ids))
+        return Quiz([self.question_store.get(question_id) for question_id in question_ids], session_id)
+
+    def _issued_question_ids(self, student_id: str, subject: str,
+                             session_id: Optional[str] = None) -> Tuple[int, ...]:
+        """
+        Return the question ids of the quiz being graded and close its session.
+        Answers mean nothing without the questions they were given for, so a
+        missing or expired session raises KeyError.
+        """
+        return self.quiz_sessions.take_many([(student_id, subject, session_id)])[0].question_ids
+
+    def evaluate_quiz(self, student_id: str, subject: str, student_answers: List,
+                      session_id: Optional[str] = None) -> Dict:
+        """
+        Evaluate quiz responses and provide feedback.
+        Answers are graded against the quiz issued under session_id, or the
+        student's latest quiz in the subject when no session id is given.
+        Returns performance metrics and personalized feedback.
+        """
+        check_answers(student_id, subject, student_answers)
+        profile = self.student_profiles[student_id]
+        subject_id = self.question_store.subject_ids[subject]
+        level_id = profile.levels[subject_id]
+        current_level = LEVELS[level_id]
+        
+        # Look up the quiz that was shown to the student
+        question_ids = self._issued_question_ids(student_id, subject, session_id)
+        quiz = [self.question_store.get(question_id) for question_id in question_ids]
+        correct_count = 0
+        correct_mask = 0
+        flags = []
+        detailed_responses = []
+        
+        for i, (question, answer) in enumerate(zip(quiz, student_answers)):
+            is_correct = self._check_answer(question, answer)
+            flags.append(is_correct)
+            if is_correct:
+                correct_count += 1
+                correct_mask |= 1 << i
+            
+            # Track detailed responses
+            detailed_responses.append({
+                'question': question['question'],
+                'student_answer': answer,
+                'correct_answer': question['answer'],
+                'is_correct': is_correct,
+                'explanation': question['explanation']
+            })
+
+        score = (correct_count / len(student_answers)) * 100
+        
+        # Record quiz attempt; questions are referenced by id rather than copied
+        self._record_attempt(student_id, profile, QuizAttempt(
+            self.clock.now(), subject_id, level_id, score,
+            question_ids, tuple(student_answers), correct_mask
+        ))
+        
+        return {
+            'score': score,
+            'feedback': self._render_feedback(flags, [question['explanation'] for question in quiz]),
+            'previous_level': current_level,
+            'new_level': LEVELS[profile.levels[subject_id]],
+            'detailed_responses': detailed_responses,
+            'recommendations': self.generate_recommendations(student_id, subject, score),
+            'mastered': profile.has_mastered(subject_id)
+        }
+
+    def evaluate_quiz_batch(self, submissions: Iterable[Tuple], pause_gc: bool = False) -> List[Dict]:
+        """
+        Grade many (student_id, subject, student_answers[, session_id]) submissions at once.
+        Returns one result per submission, in order, with the same shape and
+        values as calling evaluate_quiz for each submission in turn.
+
+        Results that agree on a detailed response or on their recommendations
+        share the same dict or list rather than each holding a copy, so treat
+        them as read-only. Every result is held until the batch returns, and
+        on a large heap that sets off full collections. pause_gc turns the
+        cyclic collector off while grading; the collector is process-wide, so
+        only pass it when no other thread is allocating.
+        """
+        submissions = [tuple(submission) if len(submission) == 4 else (*submission, None)
+                       for submission in submissions]
+        # Checked up front so a bad submission fails the call before anything is recorded
+        for student_id, subject, student_answers, _ in submissions:
+            check_answers(student_id, subject, student_answers)
+            if student_id not in self.student_profiles:
+                raise KeyError(student_id)
+            if subject not in self.question_store.subject_ids:
+                raise KeyError(subject)
+        # Every issued quiz is taken at once, or, if any is missing, none are
+        quizzes = [session.question_ids for session in self.quiz_sessions.take_many(
+            [(student_id, subject, session_id) for student_id, subject, _, session_id in submissions])]
+        results: List[Optional[Dict]] = [None] * len(submissions)
+
+        # A student's second submission must see the level set by the first,
+        # so grade in rounds where each student appears at most once
+        rounds: List[List[int]] = []
+        seen: Dict[str, int] = {}
+        for index, (student_id, _, _, _) in enumerate(submissions):
+            occurrence = seen.get(student_id, 0)
+            seen[student_id] = occurrence + 1
+            if occurrence == len(rounds):
+                rounds.append([])
+            rounds[occurrence].append(index)
+
+        # Detailed responses and recommendations built so far, keyed by what they depend on
+        shared: Tuple[Dict, Dict] = ({}, {})
+        paused = pause_gc and gc.isenabled()
+        if paused:
+            gc.disable()
+        try:
+            for batch in rounds:
+                for start in range(0, len(batch), BATCH_SLICE):
+                    self._evaluate_round(submissions, quizzes, batch[start:start + BATCH_SLICE], results, shared)
+        finally:
+            if paused:
+                gc.enable()
+        return results
+
+    def _evaluate_round(self, submissions: List[Tuple], issued: List[Tuple[int, ...]], batch: List[int],
+                        results: List[Optional[Dict]], shared: Tuple[Dict, Dict]) -> None:
+        """Grade a slice of one round of submissions, none of which share a student."""
+        store = self.question_store
+        details, recommendations = shared
+        profiles = [self.student_profiles[submissions[index][0]] for index in batch]
+        subject_ids = [store.subject_ids[submissions[index][1]] for index in batch]
+        level_ids = [profile.levels[subject_id] for profile, subject_id in zip(profiles, subject_ids)]
+
+        # Flatten (question id, student answer) pairs across the round's quizzes
+        offsets = [0]
+        question_ids = []
+        answers = []
+        for index in batch:
+            student_answers = submissions[index][2]
+            quiz = issued[index]
+            question_ids.extend(quiz[:len(student_answers)])
+            answers.extend(student_answers[:len(quiz)])
+            offsets.append(len(question_ids))
+
+        responses = self._detailed_responses(question_ids, answers, details)
+        now = self.clock.now()
+        records = []
+        for i, index in enumerate(batch):
+            student_answers = submissions[index][2]
+            correct_mask = 0
+            correct_count = 0
+            for position, response in enumerate(responses[offsets[i]:offsets[i + 1]]):
+                if response['is_correct']:
+                    correct_mask |= 1 << position
+                    correct_count += 1
+            score = correct_count / len(student_answers) * 100
+            records.append((submissions[index][0], profiles[i], QuizAttempt(
+                now, subject_ids[i], level_ids[i], score, issued[index], tuple(student_answers), correct_mask
+            ), LEVEL_TRANSITIONS[level_ids[i]][_score_band(score)]))
+        self._record_attempts(records)
+
+        for i, index in enumerate(batch):
+            subject = submissions[index][1]
+            _, profile, attempt, new_level = records[i]
+            detailed_responses = responses[offsets[i]:offsets[i + 1]]
+            lines = self._render_feedback([response['is_correct'] for response in detailed_responses],
+                                          [response['explanation'] for response in detailed_responses])
+            band = templates.score_band(attempt.score)
+            recommendation_key = (subject, band, profile.learning_style, new_level == HARD)
+            advice = recommendations.get(recommendation_key)
+            if advice is None:
+                advice = recommendations[recommendation_key] = list(templates.quiz_recommendations(
+                    *recommendation_key))
+            results[index] = {
+                'score': attempt.score,
+                'feedback': lines,
+                'previous_level': LEVELS[attempt.level],
+                'new_level': LEVELS[new_level],
+                'detailed_responses': detailed_responses,
+                'recommendations': advice,
+                'mastered': profile.has_mastered(attempt.subject)
+            }
+
+    def _detailed_responses(self, question_ids: List[int], answers: List, details: Dict[Tuple, Dict]) -> List[Dict]:
+        """
+        Grade answers against their questions' keys, returning the detailed
+        response dict for each. A class tends to give the same few answers to
+        a question, so each distinct (question, answer) pair is matched and
+        its dict built once per batch, and results share that dict.
+        """
+        responses = []
+        for question_id, answer in zip(question_ids, answers):
+            # The type is part of the key: 1, 1.0 and True hash alike but may not match alike
+            pair = (question_id, type(answer), answer)
+            try:
+                response = details.get(pair)
+            except TypeError:
+                # Unhashable answers, such as lists, are matched every time
+                responses.append(self._detailed_response(question_id, answer))
+                continue
+            if response is None:
+                response = details[pair] = self._detailed_response(question_id, answer)
+            responses.append(response)
+        return responses
+
+    def _detailed_response(self, question_id: int, answer) -> Dict:
+        question = self.question_store.get(question_id)
+        return {
+            'question': question['question'],
+            'student_answer': answer,
+            'correct_answer': question['answer'],
+            'is_correct': self.question_store.answer_key(question_id).matches(answer),
+            'explanation': question['explanation']
+        }
+
+    def _render_feedback(self, flags: List[bool], explanations: List[str]):
+        """Per-question feedback lines, or a LazyFeedback that renders them on first read."""
+        if self.lazy_feedback:
+            return templates.LazyFeedback(flags, explanations)
+        return [templates.feedback_line(position, is_correct, text)
+                for position, (is_correct, text) in enumerate(zip(flags, explanations))]
+
+    def _record_attempt(self, student_id: str, profile: StudentProfile, attempt: QuizAttempt,
+                        new_level: Optional[int] = None) -> None:
+        """Apply a graded attempt to the profile and log it to storage."""
+        with self._state_lock:
+            self._apply_attempt(student_id, profile, attempt, new_level)
+            self.selector.record(student_id, profile.subjects, attempt)
+            if self.storage is not None:
+                self._log_event('attempt', student_id, attempt=attempt.to_record())
+            self._notify_change(student_id)
+
+    def _record_attempts(self, records: List[Tuple[str, StudentProfile, QuizAttempt, int]]) -> None:
+        """_record_attempt for (student_id, profile, attempt, new_level) records of distinct students."""
+        with self._state_lock:
+            for student_id, profile, attempt, new_level in records:
+                self._apply_attempt(student_id, profile, attempt, new_level)
+                if self.storage is not None:
+                    self._log_event('attempt', student_id, attempt=attempt.to_record())
+                self._notify_change(student_id)
+            self.selector.record_many((student_id, profile.subjects, attempt)
+                                      for student_id, profile, attempt, _ in records)
+
+    def _apply_attempt(self, student_id: str, profile: StudentProfile, attempt: QuizAttempt,
+                       new_level: Optional[int] = None) -> None:
+        """
+        Apply a graded attempt to a profile: level change, mastery, history and
+        aggregates. Callers also count it in the selector's statistics.
+        """
+        subject_id = attempt.subject
+        band = _score_band(attempt.score)
+        # First, so an attempt the history cannot hold changes nothing else
+        profile.attempts.append(attempt)
+        
+        # Update student's level based on performance
+        if new_level is None:
+            new_level = LEVEL_TRANSITIONS[attempt.level][band]
+        profile.levels[subject_id] = new_level
+        
+        # Check if the topic is mastered (completed hard level with high score)
+        if band == 2 and attempt.level == HARD:
+            profile.mastered |= 1 << subject_id
+        
+        if self.retention is not None:
+            self.retention.apply(student_id, profile.attempts)
+        subject = profile.subjects[subject_id]
+        if subject not in profile.subject_stats:
+            profile.subject_stats[subject] = SubjectAggregate()
+        profile.subject_stats[subject].add(attempt.score)
+        
+        profile.last_activity = attempt.timestamp
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a callback run with a student id whenever a profile is created,
+        imported or graded. It runs under the state lock, so it must be quick.
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change(self, student_id: str) -> None:
+        for listener in self._change_listeners:
+            listener(student_id)
+
+    def _touch(self, student_id: str, profile: StudentProfile) -> None:
+        """Mark a student active now: in memory at once, in storage with the next activity flush."""
+        timestamp = self.clock.now()
+        profile.last_activity = timestamp
+        if self.storage is not None and self.activity.touch(student_id, timestamp):
+            self.flush_activity()
+
+    def flush_activity(self) -> None:
+        """Log pending last_activity updates to storage as a single event."""
+        with self._state_lock:
+            pending = self.activity.take()
+            if pending:
+                self._log_event('activity', None, last_activity=pending)
+
+    def _log_event(self, event_type: str, student_id: Optional[str], **fields) -> None:
+        """Append a state change to the storage log, snapshotting when the log tail gets long."""
+        if self.storage is None:
+            return
+        self._seq += 1
+        self.storage.append(dict(fields, seq=self._seq, type=event_type, student_id=student_id))
+        self._events_since_snapshot += 1
+        if self._events_since_snapshot >= self.snapshot_every and not self._snapshot_holds:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """Write a compacted snapshot of every profile, replacing the logged events."""
+        if self.storage is None:
+            return
+        with self._state_lock:
+            # The snapshot holds every profile's current last_activity, pending updates included
+            self.activity.take()
+            if self.retention is not None and self.retention.archive is not None:
+                # Once the log is truncated, the archive holds the only copy of demoted attempts
+                self.retention.archive.flush()
+            profiles = list(self.student_profiles.items())
+            self.storage.write_snapshot(
+                self._seq, {'subjects': self.question_store.subjects},
+                ((student_id, profile.to_record()) for student_id, profile in profiles)
+            )
+            self._events_since_snapshot = 0
+
+    @contextmanager
+    def holding_snapshots(self) -> Iterator[None]:
+        """
+        Defer the snapshots that logged events come due for until the block
+        exits, then take at most one. Every snapshot rewrites all profiles, so
+        a bulk import that snapshotted every snapshot_every rows would be
+        quadratic.
+        """
+        with self._state_lock:
+            self._snapshot_holds += 1
+        try:
+            yield
+        finally:
+            with self._state_lock:
+                self._snapshot_holds -= 1
+                if self.storage is not None and not self._snapshot_holds \
+                        and self._events_since_snapshot >= self.snapshot_every:
+                    self.snapshot()
+
+    def import_profiles(self, rows: Iterable[Tuple[str, Dict]]) -> None:
+        """
+        Load (student_id, profile record) rows, replacing existing profiles
+        with the same id, and log each to storage. A record holding only a
+        name creates a new profile, as create_student_profile would.
+        """
+        subjects = self.question_store.subjects
+        timestamp = self.clock.now()
+        records = [(student_id, record if 'levels' in record else
+                    StudentProfile.new(record['name'], subjects, timestamp).to_record())
+                   for student_id, record in rows]
+        # Built outside the lock; only installing them must happen together with logging
+        profiles = [StudentProfile.from_record(record, subjects) for _, record in records]
+        with self._state_lock:
+            for (student_id, record), profile in zip(records, profiles):
+                self.student_profiles[student_id] = profile
+                self.selector.add_history(student_id, profile)
+                self._log_event('import', student_id, profile=record)
+                self._notify_change(student_id)
+
+    def profile_records(self, student_ids: Iterable[str]) -> List[Tuple[str, Dict]]:
+        """
+        (student_id, profile record) for each of student_ids that has a
+        profile. Records are built under the state lock, so each is
+        consistent with the event log.
+        """
+        with self._state_lock:
+            return [(student_id, self.student_profiles[student_id].to_record())
+                    for student_id in student_ids if student_id in self.student_profiles]
+
+    def _restore(self) -> None:
+        """Load the newest snapshot and replay the events logged after it."""
+        snapshot, events = self.storage.load()
+        subjects = self.question_store.subjects
+        if snapshot is not None:
+            header, profiles = snapshot
+            if header['subjects'] != subjects:
+                raise ValueError(f"Snapshot subjects {header['subjects']} do not match the question bank {subjects}")
+            for student_id, record in profiles:
+                profile = self.student_profiles[student_id] = StudentProfile.from_record(record, subjects)
+                self.selector.add_history(student_id, profile)
+            self._seq = header['seq']
+        for event in events:
+            self._replay(event)
+            self._seq = event['seq']
+            self._events_since_snapshot += 1
+
+    def _replay(self, event: Dict) -> None:
+        """Reapply a logged event to in-memory state."""
+        student_id = event['student_id']
+        if event['type'] == 'profile':
+            self.student_profiles[student_id] = StudentProfile.new(
+                event['name'], self.question_store.subjects, event['timestamp'])
+            self.selector.forget(student_id)
+        elif event['type'] == 'learning_style':
+            profile = self.student_profiles[student_id]
+            profile.learning_style = event['learning_style']
+            profile.last_activity = event['timestamp']
+        elif event['type'] == 'import':
+            profile = self.student_profiles[student_id] = StudentProfile.from_record(
+                event['profile'], self.question_store.subjects)
+            self.selector.add_history(student_id, profile)
+        elif event['type'] == 'attempt':
+            profile = self.student_profiles[student_id]
+            attempt = QuizAttempt.from_record(event['attempt'])
+            self._apply_attempt(student_id, profile, attempt)
+            self.selector.record(student_id, profile.subjects, attempt)
+        elif event['type'] == 'activity':
+            for active_id, timestamp in event['last_activity'].items():
+                profile = self.student_profiles.get(active_id)
+                # An attempt logged after the touch but before the flush may be more recent
+                if profile is not None and timestamp > profile.last_activity:
+                    profile.last_activity = timestamp
+        else:
+            raise ValueError(f"Unknown event type: {event['type']}")
+
+    def close(self) -> None:
+        """Flush pending events to storage and release it."""
+        if self.storage is not None:
+            self.flush_activity()
+            self.storage.close()
+        if self.retention is not None and self.retention.archive is not None:
+            self.retention.archive.close()
+
+    def attempt_history(self, student_id: str) -> Iterator[QuizAttempt]:
+        """
+        Yield a student's attempts, oldest first. Attempts that lost their
+        detail are read lazily from the retention archive when there is one;
+        otherwise they are yielded as the summaries still held in memory.
+        """
+        attempts = self.student_profiles[student_id].attempts
+        archive = self.retention.archive if self.retention is not None else None
+        first = 0
+        if archive is not None:
+            # The archive holds every attempt older than the first detailed row
+            yield from archive.attempts(student_id, before=attempts.archived + attempts.summarized)
+            first = attempts.summarized
+        for index in range(first, len(attempts)):
+            yield attempts[index]
+
+    def _check_answer(self, question: Dict, student_answer) -> bool:
+        """Helper method to check if an answer is correct against its compiled answer key."""
+        if 'id' in question:
+            return self.question_store.answer_key(question['id']).matches(student_answer)
+        # Questions not drawn from the store have no precompiled key
+        return compile_answer(question['answer']).matches(student_answer)
+
+    def generate_recommendations(self, student_id: str, subject: str, score: float) -> List[str]:
+        """Generate personalized learning recommendations based on performance."""
+        profile = self.student_profiles[student_id]
+        at_hardest_level = profile.levels[self.question_store.subject_ids[subject]] == HARD
+        return list(templates.quiz_recommendations(
+            subject, templates.score_band(score), profile.learning_style, at_hardest_level))
+
+    def provide_explanation(self, topic: str, concept: str, student_id: str) -> str:
+        """
+        Provide personalized explanations based on the student's learning style.
+        """
+        profile = self.student_profiles[student_id]
+        if self.activity.track_reads:
+            self._touch(student_id, profile)
+        return templates.explanation(topic, concept, profile.learning_style)
+
+    def track_progress(self, student_id: str) -> Dict:
+        """Generate a progress report for the student."""
+        profile = self.student_profiles[student_id]
+        if self.activity.track_reads:
+            self._touch(student_id, profile)
+        
+        return {
+            'name': profile.name,
+            'learning_style': profile.learning_style,
+            'current_levels': profile.current_level,
+            'topics_mastered': profile.topics_mastered,
+            'total_quizzes_taken': profile.attempts.total,
+            'average_scores': self._calculate_average_scores(profile),
+            'performance_trend': self._calculate_performance_trend(profile.subject_stats),
+            'last_activity': format_timestamp(profile.last_activity),
+            'recommendations': self._generate_progress_recommendations(profile)
+        }
+
+    def _calculate_average_scores(self, profile: StudentProfile) -> Dict:
+        """Calculate average scores per subject."""
+        return {subject: stats.average for subject, stats in profile.subject_stats.items()}
+
+    def _calculate_performance_trend(self, subject_stats: Dict[str, SubjectAggregate]) -> Dict:
+        if not subject_stats:
+            return {"overall": NOT_ENOUGH_DATA}
+        
+        trends = {subject: stats.trend for subject, stats in subject_stats.items()}
+        
+        # Add overall trend
+        trends["overall"] = overall_trend(trends.values())
+        return trends
+
+    def _generate_progress_recommendations(self, profile: StudentProfile) -> List[str]:
+        """Generate overall progress recommendations."""
+        recommendations = []
+        
+        # Look at mastered topics
+        topics_mastered = profile.topics_mastered
+        if topics_mastered:
+            recommendations.append(templates.congratulations(tuple(topics_mastered)))
+        
+        # Find subjects that need attention or are excelling
+        for subject, stats in profile.subject_stats.items():
+            avg_score = stats.average
+            if avg_score < 60:
+                recommendations.append(templates.FOCUS_ON_SUBJECT(subject=subject, score=avg_score))
+            elif avg_score > 80:
+                recommendations.append(templates.EXCELLING_IN_SUBJECT(subject=subject, score=avg_score))
+        
+        # Encourage mastery
+        if not topics_mastered:
+            recommendations.append(templates.ENCOURAGE_MASTERY)
+        
+        # Encourage utilizing learning style
+        style_line = templates.continue_learning_style(profile.learning_style)
+        if style_line:
+            recommendations.append(style_line)
+        
+        return recommendations
+
@@ -0,0 +1,142 @@
+import re
+from functools import lru_cache
+from decimal import Decimal, InvalidOperation
+from typing import Optional, Tuple
+
+# Arrows accepted between the two sides of a chemical equation; not '=', which
+# would turn formula-like text answers such as 'V = IR' into equations
+_ARROW = re.compile(r'\s*(?:→|⟶|->)\s*')
+_TERM = re.compile(r'^(\d*)\s*([A-Z(\[][A-Za-z0-9()\[\]]*)$')
+
+
+# Student answers repeat heavily across a class, so canonical forms are memoized
+@lru_cache(maxsize=65536)
+def canonical_text(text: str) -> str:
+    """Casefold a string and collapse runs of whitespace to single spaces."""
+    return ' '.join(text.casefold().split())
+
+
+def _parse_number(text: str) -> Optional[Decimal]:
+    try:
+        value = Decimal(text.strip())
+    except InvalidOperation:
+        return None
+    return value if value.is_finite() else None
+
+
+def _parse_side(side: str) -> Optional[Tuple[Tuple[str, int], ...]]:
+    terms = []
+    for term in side.split('+'):
+        match = _TERM.match(term.strip())
+        if match is None:
+            return None
+        coefficient, formula = match.groups()
+        terms.append((formula, int(coefficient) if coefficient else 1))
+    return tuple(sorted(terms))
+
+
+@lru_cache(maxsize=16384)
+def parse_equation(text: str) -> Optional[Tuple[Tuple, Tuple]]:
+    """Parse '4 Fe + 3 O2 → 2 Fe2O3' into sorted (formula, coefficient) terms per side."""
+    sides = _ARROW.split(text.strip())
+    if len(sides) != 2:
+        return None
+    reactants, products = _parse_side(sides[0]), _parse_side(sides[1])
+    if reactants is None or products is None:
+        return None
+    return reactants, products
+
+
+class AnswerKey:
+    """Canonical form of a question's answer, compiled once when the bank is loaded."""
+    __slots__ = ()
+
+    def matches(self, student_answer) -> bool:
+        raise NotImplementedError
+
+
+class ExactKey(AnswerKey):
+    """Fallback for answers that are neither text nor numbers."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def matches(self, student_answer) -> bool:
+        return student_answer == self.value
+
+
+class TextKey(AnswerKey):
+    """Case- and whitespace-insensitive text answer."""
+    __slots__ = ('raw', 'text')
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.text = canonical_text(raw)
+
+    def matches(self, student_answer) -> bool:
+        if type(student_answer) is not str:
+            return False
+        return student_answer == self.raw or canonical_text(student_answer) == self.text
+
+
+class NumericKey(AnswerKey):
+    """
+    Numeric answer compared with a tolerance of half a unit in the last
+    decimal place given, so 9.8 accepts 9.81 but 12 only accepts 12.
+    """
+    __slots__ = ('value', 'tolerance')
+
+    def __init__(self, value: Decimal):
+        exponent = value.as_tuple().exponent
+        self.value = float(value)
+        # Widened by a hair so answers exactly half a unit off, such as 9.75 for
+        # 9.8, are not lost to binary rounding of the difference
+        self.tolerance = 0.5 * 10.0 ** exponent * (1 + 1e-9) if exponent < 0 else 0.0
+
+    def matches(self, student_answer) -> bool:
+        kind = type(student_answer)
+        if kind is int or kind is float:
+            return abs(student_answer - self.value) <= self.tolerance
+        if kind is str:
+            parsed = _parse_number(student_answer)
+            return parsed is not None and abs(float(parsed) - self.value) <= self.tolerance
+        return False
+
+
+class EquationKey(AnswerKey):
+    """
+    Chemical equation compared by its coefficients and formulas, ignoring
+    spacing and term order, or else as text, ignoring case and spacing.
+    """
+    __slots__ = ('raw', 'text', 'equation')
+
+    def __init__(self, raw: str, equation: Tuple[Tuple, Tuple]):
+        self.raw = raw
+        self.text = canonical_text(raw)
+        self.equation = equation
+
+    def matches(self, student_answer) -> bool:
+        if type(student_answer) is not str:
+            return False
+        return (student_answer == self.raw or parse_equation(student_answer) == self.equation
+                or canonical_text(student_answer) == self.text)
+
+
+def compile_answer(answer) -> AnswerKey:
+    """Compile a question's expected answer into the matching AnswerKey."""
+    kind = type(answer)
+    if kind is int:
+        return NumericKey(Decimal(answer))
+    if kind is float:
+        # repr gives the shortest decimal form, which carries the precision the author wrote
+        return NumericKey(Decimal(repr(answer)))
+    if kind is str:
+        equation = parse_equation(answer)
+        if equation is not None:
+            return EquationKey(answer, equation)
+        number = _parse_number(answer)
+        if number is not None:
+            return NumericKey(number)
+        return TextKey(answer)
+    return ExactKey(answer)
@@ -0,0 +1,211 @@
+"""
+Streaming bulk import and export of student profiles, including their attempt
+history.
+
+Profiles are written in student id order so an interrupted transfer can resume
+after the last student id it completed. Two formats are supported:
+
+- NDJSON: a header line, then one [student_id, profile record] line per student.
+- Binary: a magic line and header line, then zlib-compressed frames of
+  chunk_size NDJSON lines, each prefixed with its compressed length.
+
+Readers and writers hold at most one chunk of records in memory, whatever
+the number of students; an export also holds the sorted list of student ids.
+A roster import can give just {"name": ...} as the profile record.
+"""
+import json
+import os
+import struct
+import zlib
+from itertools import islice
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+FORMAT_NAME = 'educational-ai-agent/profiles'
+FORMAT_VERSION = 1
+BINARY_MAGIC = b'EAAPROF1\n'
+FORMATS = ('ndjson', 'binary')
+
+_FRAME_LENGTH = struct.Struct('>I')
+
+# (student_id, profile record) pairs as written to and read from export files
+ProfileRows = Iterator[Tuple[str, Dict]]
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _chunks(rows: Iterable, chunk_size: int) -> Iterator[List]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_profiles(agent, after: Optional[str] = None, chunk_size: int = 1000) -> ProfileRows:
+    """
+    Yield (student_id, profile record) for every student with an id greater
+    than after, in id order. Records are built one chunk at a time, each
+    consistent with the agent's event log. The ids to export are sorted up
+    front, which costs one list entry per student on top of the profiles the
+    agent already holds.
+    """
+    student_ids = sorted(student_id for student_id in agent.student_profiles
+                         if after is None or student_id > after)
+    for chunk in _chunks(student_ids, chunk_size):
+        yield from agent.profile_records(chunk)
+
+
+def _header(agent) -> Dict:
+    return {'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'subjects': agent.question_store.subjects}
+
+
+def write_profiles(handle: IO[bytes], header: Dict, rows: Iterable[Tuple[str, Dict]], fmt: str = 'ndjson',
+                   chunk_size: int = 1000, write_header: bool = True) -> Tuple[int, Optional[str]]:
+    """
+    Stream rows to a binary file handle, flushing after every chunk.
+    Returns the number of rows written and the last student id written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {FORMATS}")
+    if write_header:
+        if fmt == 'binary':
+            handle.write(BINARY_MAGIC)
+        handle.write((_dumps(header) + '\n').encode('utf-8'))
+    written = 0
+    cursor = None
+    for chunk in _chunks(rows, chunk_size):
+        payload = ''.join(_dumps(row) + '\n' for row in chunk).encode('utf-8')
+        if fmt == 'binary':
+            payload = zlib.compress(payload)
+            handle.write(_FRAME_LENGTH.pack(len(payload)))
+        handle.write(payload)
+        handle.flush()
+        written += len(chunk)
+        cursor = chunk[-1][0]
+    return written, cursor
+
+
+def export_profiles(agent, path: str, fmt: str = 'ndjson', resume: bool = False,
+                    chunk_size: int = 1000) -> Tuple[int, Optional[str]]:
+    """
+    Export every profile to path. With resume set and path already present,
+    the export continues after the last complete row in the file, dropping
+    any partly written line or frame left by an interrupted run.
+    Returns the number of profiles written and the last student id written.
+    """
+    after, offset = _resume_point(path, fmt) if resume and os.path.exists(path) else (None, 0)
+    with open(path, 'r+b' if offset else 'wb') as handle:
+        if offset:
+            handle.truncate(offset)
+            handle.seek(offset)
+        return write_profiles(handle, _header(agent), iter_profiles(agent, after, chunk_size),
+                              fmt, chunk_size, write_header=not offset)
+
+
+def _read_ndjson(handle: IO[bytes]) -> Iterator[Tuple[List, int]]:
+    while True:
+        line = handle.readline()
+        if not line.endswith(b'\n'):
+            # End of file, or a torn final line from an interrupted export
+            return
+        student_id, record = json.loads(line)
+        yield [(student_id, record)], handle.tell()
+
+
+def _read_binary(handle: IO[bytes]) -> Iterator[Tuple[List, int]]:
+    while True:
+        prefix = handle.read(_FRAME_LENGTH.size)
+        if len(prefix) < _FRAME_LENGTH.size:
+            return
+        (length,) = _FRAME_LENGTH.unpack(prefix)
+        payload = handle.read(length)
+        if len(payload) < length:
+            return
+        yield [tuple(json.loads(line)) for line in zlib.decompress(payload).splitlines()], handle.tell()
+
+
+def _open_reader(handle: IO[bytes], path: str):
+    """Read the header of an export file; returns its format, header and the matching row reader."""
+    first = handle.readline()
+    if first == BINARY_MAGIC:
+        fmt, header, reader = 'binary', handle.readline(), _read_binary
+    else:
+        fmt, header, reader = 'ndjson', first, _read_ndjson
+    try:
+        header = json.loads(header)
+    except ValueError:
+        header = {}
+    if header.get('format') != FORMAT_NAME or header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} profile export")
+    return fmt, header, reader
+
+
+def _resume_point(path: str, fmt: str) -> Tuple[Optional[str], int]:
+    """The last student id completely written to path and the file offset just after it."""
+    with open(path, 'rb') as handle:
+        try:
+            existing, _, reader = _open_reader(handle, path)
+        except ValueError:
+            # Not even the header was written; start over
+            return None, 0
+        if existing != fmt:
+            raise ValueError(f"Cannot resume {path}: it is in {existing} format, not {fmt}")
+        cursor, offset = None, handle.tell()
+        for rows, offset in reader(handle):
+            cursor = rows[-1][0]
+        return cursor, offset
+
+
+def read_profiles(path: str, after: Optional[str] = None) -> Tuple[Dict, ProfileRows]:
+    """
+    Open an export file of either format. Returns its header and a generator
+    of (student_id, profile record) rows with ids greater than after.
+    """
+    handle = open(path, 'rb')
+    try:
+        _, header, reader = _open_reader(handle, path)
+    except ValueError:
+        handle.close()
+        raise
+
+    def rows() -> ProfileRows:
+        with handle:
+            for chunk, _ in reader(handle):
+                for student_id, record in chunk:
+                    if after is None or student_id > after:
+                        yield student_id, record
+
+    return header, rows()
+
+
+def import_profiles(agent, rows: Iterable[Tuple[str, Dict]], subjects: Optional[List[str]] = None,
+                    chunk_size: int = 1000) -> Tuple[int, Optional[str]]:
+    """
+    Load (student_id, profile record) rows into the agent, replacing existing
+    profiles with the same id. A record holding only a name creates a new
+    profile, as create_student_profile would. Each profile is logged to the
+    agent's storage, and the snapshot that the log tail comes due for is
+    taken once, when the import ends. Returns the number of profiles imported
+    and the last student id imported, which a retried import can pass as
+    after.
+    """
+    agent_subjects = agent.question_store.subjects
+    if subjects is not None and list(subjects) != list(agent_subjects):
+        raise ValueError(f"Export subjects {subjects} do not match the question bank {agent_subjects}")
+    imported = 0
+    cursor = None
+    with agent.holding_snapshots():
+        for chunk in _chunks(rows, chunk_size):
+            agent.import_profiles(chunk)
+            imported += len(chunk)
+            cursor = chunk[-1][0]
+    return imported, cursor
+
+
+def import_file(agent, path: str, after: Optional[str] = None, chunk_size: int = 1000) -> Tuple[int, Optional[str]]:
+    """Import an export file of either format, skipping student ids up to and including after."""
+    header, rows = read_profiles(path, after)
+    return import_profiles(agent, rows, header['subjects'], chunk_size)
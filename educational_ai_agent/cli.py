@@ -0,0 +1,201 @@
+"""
+Command line interface.
+
+    python -m educational_ai_agent demo
+    python -m educational_ai_agent grade submissions.jsonl [--storage DIR] [--profiles export.ndjson]
+    python -m educational_ai_agent report roster.txt [--storage DIR] [--profiles export.ndjson]
+
+grade reads one submission per line of JSON,
+{"student_id": "s1", "subject": "math", "answers": [12, 7], "question_ids": [0, 1], "name": "Sam"},
+where question_ids are the ids of the subject's questions that were
+answered, and name is optional: students without a profile get one. Each
+line is graded against its own quiz session. report reads one student id
+per line. Both write one JSON result per input line, in input order, a
+chunk at a time, so any size of input runs in bounded memory. A line that
+cannot be processed gets {"line": n, "error": "..."} instead of a result,
+and the command then exits with status 1.
+"""
+import argparse
+import json
+import os
+import sys
+from itertools import islice
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .agent import EducationalAIAgent
+
+
+def _open_agent(args) -> 'EducationalAIAgent':
+    # Imported here so --help and argument errors return without loading the agent
+    from .activity import ActivityTracker
+    from .agent import EducationalAIAgent
+    storage = None
+    if args.storage:
+        if args.storage.endswith(('.db', '.sqlite')):
+            from .persistence import SQLiteStorage
+            storage = SQLiteStorage(args.storage)
+        else:
+            from .persistence import FileStorage
+            storage = FileStorage(args.storage)
+    question_store = None
+    if args.question_bank:
+        from .question_store import load_question_store
+        question_store = load_question_store(args.question_bank)
+    # Printing reports is not student activity; leave last_activity alone
+    activity = ActivityTracker(track_reads=args.command != 'report')
+    agent = EducationalAIAgent(question_store=question_store, storage=storage, activity=activity)
+    if args.profiles:
+        from . import bulk
+        bulk.import_file(agent, args.profiles)
+    return agent
+
+
+def _lines(handle: IO[str]) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, text) for the non-blank, non-comment lines of an input file."""
+    for number, line in enumerate(handle, 1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield number, line
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write(output: IO[str], rows: Iterable[Dict]) -> None:
+    output.writelines(json.dumps(row, default=list) + '\n' for row in rows)
+    # Each chunk is visible downstream as soon as it is done
+    output.flush()
+
+
+def _parse_submission(agent: 'EducationalAIAgent', line: str) -> Tuple:
+    """Turn an input line into an evaluate_quiz_batch submission, creating the student if needed."""
+    submission = json.loads(line)
+    student_id = submission['student_id']
+    subject = submission['subject']
+    answers = submission['answers']
+    if subject not in agent.question_store.subject_ids:
+        raise ValueError(f"unknown subject {subject!r}")
+    if not isinstance(answers, list) or not answers:
+        raise ValueError("answers must be a non-empty list")
+    if not isinstance(submission['question_ids'], list):
+        raise ValueError("question_ids must be a list")
+    question_ids = tuple(submission['question_ids'])
+    for question_id in question_ids:
+        if not isinstance(question_id, int) or not agent.question_store.in_subject(subject, question_id):
+            raise ValueError(f"unknown {subject} question id {question_id!r}")
+    if student_id not in agent.student_profiles:
+        agent.create_student_profile(student_id, submission.get('name', student_id))
+    # Every line grades against its own session, never another line's quiz
+    return student_id, subject, answers, agent.quiz_sessions.open(student_id, subject, question_ids)
+
+
+def grade(agent: 'EducationalAIAgent', source: IO[str], output: IO[str], chunk_size: int = 1000) -> int:
+    """Grade a file of submissions; returns the number of lines that failed."""
+    failed = 0
+    for chunk in _chunks(_lines(source), chunk_size):
+        rows: List[Optional[Dict]] = [None] * len(chunk)
+        submissions = []
+        positions = []
+        for position, (number, line) in enumerate(chunk):
+            try:
+                submissions.append(_parse_submission(agent, line))
+                positions.append(position)
+            except (ValueError, KeyError, TypeError) as error:
+                rows[position] = {'line': number, 'error': _describe(error)}
+                failed += 1
+        try:
+            # Nothing else runs in this process, so the collector can wait until the chunk is graded
+            results = agent.evaluate_quiz_batch(submissions, pause_gc=True)
+        except (ValueError, KeyError, TypeError):
+            # The batch rejected the chunk; grade its lines one at a time so only the bad ones fail
+            results = [_grade_one(agent, submission) for submission in submissions]
+        for position, submission, result in zip(positions, submissions, results):
+            number = chunk[position][0]
+            if isinstance(result, Exception):
+                rows[position] = {'line': number, 'error': _describe(result)}
+                failed += 1
+            else:
+                rows[position] = {'line': number, 'student_id': submission[0], 'subject': submission[1], **result}
+        _write(output, rows)
+    return failed
+
+
+def _grade_one(agent: 'EducationalAIAgent', submission: Tuple):
+    """evaluate_quiz for one submission, returning the error instead of raising it."""
+    try:
+        return agent.evaluate_quiz(*submission)
+    except (ValueError, KeyError, TypeError) as error:
+        return error
+
+
+def report(agent: 'EducationalAIAgent', roster: IO[str], output: IO[str], chunk_size: int = 1000) -> int:
+    """Write a progress report for every student in a roster; returns the number of unknown students."""
+    failed = 0
+    for chunk in _chunks(_lines(roster), chunk_size):
+        rows = []
+        for number, student_id in chunk:
+            if student_id in agent.student_profiles:
+                rows.append({'line': number, 'student_id': student_id, **agent.track_progress(student_id)})
+            else:
+                rows.append({'line': number, 'student_id': student_id, 'error': 'unknown student'})
+                failed += 1
+        _write(output, rows)
+    return failed
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f"missing or unknown {error.args[0]!r}"
+    return str(error)
+
+
+def _open_input(path: str) -> IO[str]:
+    return sys.stdin if path == '-' else open(path, encoding='utf-8')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m educational_ai_agent',
+                                     description='Educational AI agent command line.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('demo', help='run the example session')
+    for name, help_text, input_help in (
+            ('grade', 'grade a file of submissions', 'JSON lines of submissions, - for stdin'),
+            ('report', 'print progress reports for a roster', 'student ids, one per line, - for stdin')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('input', help=input_help)
+        command.add_argument('--output', '-o', help='write results here instead of stdout')
+        command.add_argument('--storage', help='FileStorage directory, or a .db/.sqlite file for SQLiteStorage')
+        command.add_argument('--profiles', help='import profiles from a bulk export file first')
+        command.add_argument('--question-bank', help='SQLite question bank built with build_question_db')
+        command.add_argument('--chunk', type=int, default=1000, help='lines processed and written at a time')
+    args = parser.parse_args(argv)
+
+    if args.command == 'demo':
+        from .demo import run
+        run()
+        return 0
+
+    agent = _open_agent(args)
+    source = _open_input(args.input)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        failed = (grade if args.command == 'grade' else report)(agent, source, output, args.chunk)
+    except BrokenPipeError:
+        # The reader went away, e.g. piped into head; point stdout at devnull
+        # so the flush at interpreter exit does not fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        agent.close()
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failed else 0
@@ -0,0 +1,199 @@
+"""
+Cohort analytics: class- and school-wide summaries over any set of students.
+
+Each student's report inputs (per-subject average, trend and level, mastery
+and overall trend) are kept as one row of per-subject columns and refreshed
+whenever the agent records a change for that student. A cohort summary is a
+sum over its members' rows. Summaries are cached per cohort and, when a
+member changes, adjusted by the difference between the member's old and new
+row instead of being recomputed. Averages are the exception: floats added
+and taken away drift, so they are summed from the average column with
+math.fsum when a report is read.
+"""
+from array import array
+from collections import Counter, OrderedDict
+from math import fsum
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+from .question_store import LEVELS
+from .records import (COLLECTING_DATA, IMPROVING, NEEDS_ATTENTION, NOT_ENOUGH_DATA, STABLE,
+                     StudentProfile, overall_trend)
+
+# Trend labels by code, as stored in the trend columns
+TRENDS = (IMPROVING, STABLE, NEEDS_ATTENTION, COLLECTING_DATA)
+OVERALL_TRENDS = (IMPROVING, STABLE, NEEDS_ATTENTION, NOT_ENOUGH_DATA)
+_TREND_CODES = {trend: code for code, trend in enumerate(TRENDS)}
+_OVERALL_CODES = {trend: code for code, trend in enumerate(OVERALL_TRENDS)}
+# Trend code of a subject the student has no scores in
+_NO_SCORES = -1
+
+
+class _CohortTotals:
+    """
+    A cohort's rows and per-subject counts over them; every count is
+    additive, so members can be added or removed.
+    """
+    __slots__ = ('rows', 'students', 'scored', 'trend_counts', 'level_counts', 'mastered', 'overall_counts')
+
+    def __init__(self, rows: List[int], subject_count: int):
+        self.rows = rows
+        self.students = 0
+        self.scored = [0] * subject_count
+        self.trend_counts = [[0] * len(TRENDS) for _ in range(subject_count)]
+        self.level_counts = [[0] * len(LEVELS) for _ in range(subject_count)]
+        self.mastered = [0] * subject_count
+        self.overall_counts = [0] * len(OVERALL_TRENDS)
+
+
+class CohortAnalytics:
+    """
+    Attach to an agent to get cohort reports. Reports for the most recent
+    max_cohorts distinct cohorts are cached, and kept current as their
+    members are graded.
+    """
+
+    def __init__(self, agent, max_cohorts: int = 256):
+        self.agent = agent
+        self.subjects = agent.question_store.subjects
+        self.max_cohorts = max_cohorts
+        self.hits = 0
+        self.misses = 0
+        subject_count = len(self.subjects)
+        self._rows: Dict[str, int] = {}
+        self._averages = [array('d') for _ in range(subject_count)]
+        self._trends = [array('b') for _ in range(subject_count)]
+        self._levels = [array('B') for _ in range(subject_count)]
+        self._mastered = array('Q')
+        self._overall = array('b')
+        self._cohorts: 'OrderedDict[FrozenSet[str], _CohortTotals]' = OrderedDict()
+        # student_id -> cached cohorts it belongs to
+        self._memberships: Dict[str, Set[FrozenSet[str]]] = {}
+        with agent._state_lock:
+            for student_id, profile in agent.student_profiles.items():
+                self._store_row(student_id, profile)
+            agent.add_change_listener(self._on_change)
+
+    def _store_row(self, student_id: str, profile: StudentProfile) -> int:
+        """Write the profile's report inputs into its row, appending a row for a new student."""
+        row = self._rows.get(student_id)
+        if row is None:
+            row = self._rows[student_id] = len(self._mastered)
+            for column in (*self._averages, *self._trends, *self._levels, self._mastered, self._overall):
+                column.append(0)
+        trends = []
+        for subject_id, subject in enumerate(self.subjects):
+            self._levels[subject_id][row] = profile.levels[subject_id]
+            stats = profile.subject_stats.get(subject)
+            if stats is None:
+                self._averages[subject_id][row] = 0.0
+                self._trends[subject_id][row] = _NO_SCORES
+                continue
+            trend = stats.trend
+            trends.append(trend)
+            self._averages[subject_id][row] = stats.average
+            self._trends[subject_id][row] = _TREND_CODES[trend]
+        self._mastered[row] = profile.mastered
+        self._overall[row] = _OVERALL_CODES[overall_trend(trends) if trends else NOT_ENOUGH_DATA]
+        return row
+
+    def _accumulate(self, totals: _CohortTotals, row: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one row's contribution to a cohort's totals."""
+        totals.students += sign
+        mastered = self._mastered[row]
+        for subject_id in range(len(self.subjects)):
+            totals.level_counts[subject_id][self._levels[subject_id][row]] += sign
+            trend = self._trends[subject_id][row]
+            if trend != _NO_SCORES:
+                totals.scored[subject_id] += sign
+                totals.trend_counts[subject_id][trend] += sign
+            if mastered >> subject_id & 1:
+                totals.mastered[subject_id] += sign
+        totals.overall_counts[self._overall[row]] += sign
+
+    def _on_change(self, student_id: str) -> None:
+        cohorts = [self._cohorts[cohort] for cohort in self._memberships.get(student_id, ())]
+        row = self._rows.get(student_id)
+        if row is not None:
+            for totals in cohorts:
+                self._accumulate(totals, row, -1)
+        row = self._store_row(student_id, self.agent.student_profiles[student_id])
+        for totals in cohorts:
+            self._accumulate(totals, row, 1)
+
+    def _compute(self, rows: List[int]) -> _CohortTotals:
+        """Sum a cohort's rows one subject column at a time."""
+        totals = _CohortTotals(rows, len(self.subjects))
+        totals.students = len(rows)
+        for subject_id in range(len(self.subjects)):
+            trends = self._trends[subject_id]
+            scored = [row for row in rows if trends[row] != _NO_SCORES]
+            totals.scored[subject_id] = len(scored)
+            for trend, count in Counter(trends[row] for row in scored).items():
+                totals.trend_counts[subject_id][trend] = count
+            levels = self._levels[subject_id]
+            for level, count in Counter(levels[row] for row in rows).items():
+                totals.level_counts[subject_id][level] = count
+            mastered = self._mastered
+            totals.mastered[subject_id] = sum(mastered[row] >> subject_id & 1 for row in rows)
+        for trend, count in Counter(self._overall[row] for row in rows).items():
+            totals.overall_counts[trend] = count
+        return totals
+
+    def _totals(self, student_ids: Iterable[str]) -> _CohortTotals:
+        cohort = frozenset(student_ids)
+        totals = self._cohorts.get(cohort)
+        if totals is not None:
+            self.hits += 1
+            self._cohorts.move_to_end(cohort)
+            return totals
+        self.misses += 1
+        missing = [student_id for student_id in cohort if student_id not in self._rows]
+        if missing:
+            raise KeyError(f"Unknown students: {', '.join(sorted(missing)[:5])}")
+        totals = self._cohorts[cohort] = self._compute([self._rows[student_id] for student_id in cohort])
+        for student_id in cohort:
+            self._memberships.setdefault(student_id, set()).add(cohort)
+        while len(self._cohorts) > self.max_cohorts:
+            evicted, _ = self._cohorts.popitem(last=False)
+            for student_id in evicted:
+                memberships = self._memberships[student_id]
+                memberships.discard(evicted)
+                if not memberships:
+                    del self._memberships[student_id]
+        return totals
+
+    def report(self, student_ids: Iterable[str]) -> Dict:
+        """
+        Summarize a cohort: per-subject average of student averages, counts
+        of each trend (by the rules of track_progress), level histograms and
+        mastery rates. Subjects nobody in the cohort has taken a quiz in are
+        left out of the averages and trends.
+        """
+        with self.agent._state_lock:
+            totals = self._totals(student_ids)
+            subjects = self.subjects
+            trends = {
+                subject: dict(zip(TRENDS, totals.trend_counts[subject_id]))
+                for subject_id, subject in enumerate(subjects) if totals.scored[subject_id]
+            }
+            trends['overall'] = dict(zip(OVERALL_TRENDS, totals.overall_counts))
+            return {
+                'students': totals.students,
+                # Rows without scores hold 0.0, so every row can be summed
+                'average_scores': {
+                    subject: fsum(self._averages[subject_id][row] for row in totals.rows) / totals.scored[subject_id]
+                    for subject_id, subject in enumerate(subjects) if totals.scored[subject_id]
+                },
+                'performance_trends': trends,
+                'level_histogram': {
+                    subject: dict(zip(LEVELS, totals.level_counts[subject_id]))
+                    for subject_id, subject in enumerate(subjects)
+                },
+                'mastery_rates': {
+                    subject: totals.mastered[subject_id] / totals.students if totals.students else 0.0
+                    for subject_id, subject in enumerate(subjects)
+                },
+            }
+
+    def stats(self) -> Dict:
+        return {'cohorts': len(self._cohorts), 'hits': self.hits, 'misses': self.misses}
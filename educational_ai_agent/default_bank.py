@@ -0,0 +1,46 @@
+"""The built-in question bank, loaded by load_question_store() when no bank file is given."""
+
+DEFAULT_QUESTION_BANK = {
+    'math': {
+        'easy': [
+            {'question': 'What is 5 + 7?', 'answer': 12, 'explanation': 'Adding 5 and 7 equals 12'},
+            {'question': 'What is 10 - 3?', 'answer': 7, 'explanation': 'Subtracting 3 from 10 equals 7'}
+        ],
+        'medium': [
+            {'question': 'What is 15 × 4?', 'answer': 60, 'explanation': 'Multiplying 15 by 4 equals 60'},
+            {'question': 'What is 72 ÷ 8?', 'answer': 9, 'explanation': 'Dividing 72 by 8 equals 9'}
+        ],
+        'hard': [
+            {'question': 'What is the square root of 144?', 'answer': 12, 'explanation': '12 × 12 = 144'},
+            {'question': 'What is 3² + 4²?', 'answer': 25, 'explanation': '3² (9) + 4² (16) = 25'}
+        ]
+    },
+    'physics': {
+        'easy': [
+            {'question': 'What is the SI unit of force?', 'answer': 'Newton', 'explanation': 'Force is measured in Newtons (N)'},
+            {'question': 'What does the formula F = ma represent?', 'answer': "Newton's Second Law", 'explanation': 'F = ma is Newton\'s Second Law of Motion'}
+        ],
+        'medium': [
+            {'question': 'Calculate the velocity of an object that traveled 50 meters in 10 seconds', 'answer': 5, 'explanation': 'Velocity = distance/time = 50m/10s = 5 m/s'},
+            {'question': 'What is the gravitational acceleration on Earth?', 'answer': 9.8, 'explanation': 'Gravitational acceleration on Earth is approximately 9.8 m/s²'}
+        ],
+        'hard': [
+            {'question': 'Calculate the kinetic energy of a 2kg object moving at 5 m/s', 'answer': 25, 'explanation': 'KE = 0.5 × mass × velocity² = 0.5 × 2 × 5² = 25 Joules'},
+            {'question': 'If work done is 100J and distance is 20m, what is the force applied?', 'answer': 5, 'explanation': 'Work = Force × Distance, so Force = Work/Distance = 100J/20m = 5N'}
+        ]
+    },
+    'chemistry': {
+        'easy': [
+            {'question': 'What is the chemical symbol for water?', 'answer': 'H2O', 'explanation': 'Water is composed of 2 hydrogen atoms and 1 oxygen atom'},
+            {'question': 'What is the atomic number of oxygen?', 'answer': 8, 'explanation': 'Oxygen has 8 protons in its nucleus'}
+        ],
+        'medium': [
+            {'question': 'What is the pH of pure water at 25°C?', 'answer': 7, 'explanation': 'Pure water has a neutral pH of 7'},
+            {'question': 'What gas is produced when an acid reacts with a carbonate?', 'answer': 'Carbon dioxide', 'explanation': 'Acid + Carbonate → Salt + Water + Carbon Dioxide'}
+        ],
+        'hard': [
+            {'question': 'Balance this equation: __ Fe + __ O2 → __ Fe2O3', 'answer': '4 Fe + 3 O2 → 2 Fe2O3', 'explanation': 'Balanced equation requires 4 iron atoms and 3 oxygen molecules'},
+            {'question': 'Calculate the molarity of a solution with 4 moles of solute in 2 liters of solution', 'answer': 2, 'explanation': 'Molarity = moles of solute/volume of solution in liters = 4 moles/2 L = 2 M'}
+        ]
+    }
+}
@@ -0,0 +1,138 @@
+"""Example session: three students take quizzes and get progress reports."""
+from .agent import EducationalAIAgent
+
+
+def run() -> None:
+    agent = EducationalAIAgent()
+
+    # Create student profiles
+    agent.create_student_profile('john_doe', 'John Doe')
+    agent.create_student_profile('jane_smith', 'Jane Smith')
+    agent.create_student_profile('alex_johnson', 'Alex Johnson')
+
+    # John Doe's interactions
+    print("Generated math quiz for John Doe:")
+    quiz_john_math = agent.generate_quiz('john_doe', 'math')
+    for i, question in enumerate(quiz_john_math):
+        print(f"Question {i+1}: {question['question']}")
+    student_answers_john_math = [12, 7]
+    print("Student answers:", student_answers_john_math)
+    quiz_results_john_math = agent.evaluate_quiz('john_doe', 'math', student_answers_john_math)
+    print("Quiz Results:")
+    print(f"Score: {quiz_results_john_math['score']}%")
+    print("Feedback:")
+    for feedback in quiz_results_john_math['feedback']:
+        print(f"  {feedback}")
+    print("Detailed responses:")
+    for response in quiz_results_john_math['detailed_responses']:
+        print(f"  Question: {response['question']}")
+        print(f"    Student answer: {response['student_answer']}")
+        print(f"    Correct answer: {response['correct_answer']}")
+        print(f"    Correct: {'Yes' if response['is_correct'] else 'No'}")
+    print(f"Level change: {quiz_results_john_math['previous_level']} → {quiz_results_john_math['new_level']}")
+    print("Recommendations:")
+    for recommendation in quiz_results_john_math['recommendations']:
+        print(f"  {recommendation}")
+
+    print("\nGenerated chemistry quiz for John Doe:")
+    quiz_john_chem = agent.generate_quiz('john_doe', 'chemistry')
+    for i, question in enumerate(quiz_john_chem):
+        print(f"Question {i+1}: {question['question']}")
+    student_answers_john_chem = ['H2O', 7]
+    print("Student answers:", student_answers_john_chem)
+    quiz_results_john_chem = agent.evaluate_quiz('john_doe', 'chemistry', student_answers_john_chem)
+    print("Quiz Results:")
+    print(f"Score: {quiz_results_john_chem['score']}%")
+    print("Feedback:")
+    for feedback in quiz_results_john_chem['feedback']:
+        print(f"  {feedback}")
+    print("Detailed responses:")
+    for response in quiz_results_john_chem['detailed_responses']:
+        print(f"  Question: {response['question']}")
+        print(f"    Student answer: {response['student_answer']}")
+        print(f"    Correct answer: {response['correct_answer']}")
+        print(f"    Correct: {'Yes' if response['is_correct'] else 'No'}")
+    print(f"Level change: {quiz_results_john_chem['previous_level']} → {quiz_results_john_chem['new_level']}")
+    print("Recommendations:")
+    for recommendation in quiz_results_john_chem['recommendations']:
+        print(f"  {recommendation}")
+
+    # Jane Smith's interactions
+    print("\nGenerated physics quiz for Jane Smith:")
+    quiz_jane_physics = agent.generate_quiz('jane_smith', 'physics')
+    for i, question in enumerate(quiz_jane_physics):
+        print(f"Question {i+1}: {question['question']}")
+    student_answers_jane_physics = ['Wrong answer', 'Newton']
+    print("Student answers:", student_answers_jane_physics)
+    quiz_results_jane_physics = agent.evaluate_quiz('jane_smith', 'physics', student_answers_jane_physics)
+    print("Quiz Results:")
+    print(f"Score: {quiz_results_jane_physics['score']}%")
+    print("Feedback:")
+    for feedback in quiz_results_jane_physics['feedback']:
+        print(f"  {feedback}")
+    print("Detailed responses:")
+    for response in quiz_results_jane_physics['detailed_responses']:
+        print(f"  Question: {response['question']}")
+        print(f"    Student answer: {response['student_answer']}")
+        print(f"    Correct answer: {response['correct_answer']}")
+        print(f"    Correct: {'Yes' if response['is_correct'] else 'No'}")
+    print(f"Level change: {quiz_results_jane_physics['previous_level']} → {quiz_results_jane_physics['new_level']}")
+    print("Recommendations:")
+    for recommendation in quiz_results_jane_physics['recommendations']:
+        print(f"  {recommendation}")
+
+    # Alex Johnson's interactions: assessing learning style with a quiz
+    print("\nAssessing learning style for Alex Johnson:")
+    learning_style_quiz_responses = [
+        {'preference': 'hands_on'},
+        {'preference': 'verbal_explanation'},
+        {'preference': 'hands_on'}
+    ]
+    learning_style = agent.assess_learning_style('alex_johnson', learning_style_quiz_responses)
+    print(f"Learning Style: {learning_style}")
+
+    #Progress Reports
+    print("\nProgress Report for John Doe:")
+    progress_report_john = agent.track_progress('john_doe')
+    print(f"Learning Style: {progress_report_john['learning_style']}")
+    print(f"Current Levels: {progress_report_john['current_levels']}")
+    print(f"Topics Mastered: {progress_report_john['topics_mastered']}")
+    print(f"Total Quizzes Taken: {progress_report_john['total_quizzes_taken']}")
+    if progress_report_john['average_scores']:
+        print("Average Scores by Subject:")
+        for subject, score in progress_report_john['average_scores'].items():
+            print(f"  {subject}: {score:.1f}%")
+    print(f"Performance Trends: {progress_report_john['performance_trend']}")
+    print("Overall Recommendations:")
+    for recommendation in progress_report_john['recommendations']:
+        print(f"  {recommendation}")
+
+    print("\nProgress Report for Jane Smith:")
+    progress_report_jane = agent.track_progress('jane_smith')
+    print(f"Learning Style: {progress_report_jane['learning_style']}")
+    print(f"Current Levels: {progress_report_jane['current_levels']}")
+    print(f"Topics Mastered: {progress_report_jane['topics_mastered']}")
+    print(f"Total Quizzes Taken: {progress_report_jane['total_quizzes_taken']}")
+    if progress_report_jane['average_scores']:
+        print("Average Scores by Subject:")
+        for subject, score in progress_report_jane['average_scores'].items():
+            print(f"  {subject}: {score:.1f}%")
+    print(f"Performance Trends: {progress_report_jane['performance_trend']}")
+    print("Overall Recommendations:")
+    for recommendation in progress_report_jane['recommendations']:
+        print(f"  {recommendation}")
+
+    print("\nProgress Report for Alex Johnson:")
+    progress_report_alex = agent.track_progress('alex_johnson')
+    print(f"Learning Style: {progress_report_alex['learning_style']}")
+    print(f"Current Levels: {progress_report_alex['current_levels']}")
+    print(f"Topics Mastered: {progress_report_alex['topics_mastered']}")
+    print(f"Total Quizzes Taken: {progress_report_alex['total_quizzes_taken']}")
+    if progress_report_alex['average_scores']:
+        print("Average Scores by Subject:")
+        for subject, score in progress_report_alex['average_scores'].items():
+            print(f"  {subject}: {score:.1f}%")
+    print(f"Performance Trends: {progress_report_alex['performance_trend']}")
+    print("Overall Recommendations:")
+    for recommendation in progress_report_alex['recommendations']:
+        print(f"  {recommendation}")
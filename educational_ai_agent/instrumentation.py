@@ -0,0 +1,331 @@
+"""
+Instrumentation for EducationalAIAgent: call counters and latency
+histograms for the public methods and the grading path, profile size gauges,
+and an opt-in sampling profiler.
+
+Instrumentation wraps the agent's methods on the instance when enabled and
+removes the wrappers when disabled, so a disabled agent runs exactly the
+uninstrumented code. Metrics are exported as Prometheus text or JSON, to a
+string or a file; no server is needed.
+
+    instrumentation = AgentInstrumentation(agent).enable()
+    ...
+    instrumentation.write('agent.prom')
+"""
+import bisect
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .records import StudentProfile
+
+# Agent methods timed while instrumentation is enabled
+PUBLIC_METHODS = (
+    'create_student_profile',
+    'assess_learning_style',
+    'generate_quiz',
+    'evaluate_quiz',
+    'evaluate_quiz_batch',
+    'generate_recommendations',
+    'provide_explanation',
+    'track_progress',
+    'snapshot',
+)
+# Internal steps of grading, timed under their own names
+GRADING_STEPS = {
+    '_check_answer': 'grade_answer',
+    '_evaluate_round': 'grade_batch_round',
+    '_record_attempt': 'record_attempt',
+    '_record_attempts': 'record_attempts',
+}
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; buckets grow by about 25% from 1us to 10s."""
+
+    BOUNDS = [1e-6 * 1.25 ** i for i in range(73)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of samples."""
+        if not self.total:
+            return 0.0
+        rank = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.BOUNDS[min(index, len(self.BOUNDS) - 1)]
+        return self.BOUNDS[-1]
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.total,
+            'mean_ms': self.sum / self.total * 1000 if self.total else 0.0,
+            'p50_ms': self.percentile(0.50) * 1000,
+            'p90_ms': self.percentile(0.90) * 1000,
+            'p99_ms': self.percentile(0.99) * 1000,
+        }
+
+
+def attempt_bytes(profile: StudentProfile) -> int:
+    """Approximate memory held by a profile's attempt history."""
+    attempts = profile.attempts
+    size = sum(column.itemsize * len(column) for column in (
+        attempts.subjects, attempts.levels, attempts.scores, attempts.timestamps, attempts.correct))
+    size += sys.getsizeof(attempts.question_ids) + sys.getsizeof(attempts.student_answers)
+    size += sum(sys.getsizeof(ids) for ids in attempts.question_ids)
+    size += sum(sys.getsizeof(answers) for answers in attempts.student_answers)
+    return size
+
+
+def profile_gauges(profile: StudentProfile) -> Dict[str, int]:
+    """Size gauges for one student: history length, attempts held in memory and their bytes."""
+    return {
+        'history_length': profile.attempts.total,
+        'attempts_in_memory': len(profile.attempts),
+        'attempt_bytes': attempt_bytes(profile),
+    }
+
+
+class AgentInstrumentation:
+    """
+    Counters, timers and gauges for one agent. Pass profile_every=N to run
+    every Nth top-level instrumented call under cProfile; the samples are
+    accumulated and available from profile_stats().
+    """
+
+    # Histogram buckets exported to Prometheus: every fourth bound, about 2.4x apart
+    EXPORTED_BOUNDS = LatencyHistogram.BOUNDS[::4]
+    # Recorded samples are folded into the histograms once a method has this many
+    FOLD_EVERY = 1024
+
+    def __init__(self, agent, profile_every: int = 0, largest_profiles: int = 10):
+        self.agent = agent
+        self.profile_every = profile_every
+        self.largest_profiles = largest_profiles
+        self.enabled = False
+        self.timers: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+        # Raw durations and answer counts, folded into timers and counters in batches
+        self._samples: Dict[str, List[float]] = {}
+        self._answer_counts: List[int] = []
+        self._attempts_recorded = 0
+        self._answers_graded = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._calls = 0
+        self._profile: Optional[pstats.Stats] = None
+
+    def enable(self) -> 'AgentInstrumentation':
+        """Wrap the agent's methods; returns self."""
+        if not self.enabled:
+            for name in PUBLIC_METHODS:
+                setattr(self.agent, name, self._timed(name, getattr(self.agent, name)))
+            for name, metric in GRADING_STEPS.items():
+                setattr(self.agent, name, self._timed(metric, getattr(self.agent, name)))
+            self.enabled = True
+        return self
+
+    def disable(self) -> None:
+        """Remove the wrappers; the agent goes back to its plain class methods."""
+        if self.enabled:
+            for name in (*PUBLIC_METHODS, *GRADING_STEPS):
+                self.agent.__dict__.pop(name, None)
+            self.enabled = False
+
+    def _timed(self, name: str, method: Callable) -> Callable:
+        self.timers.setdefault(name, LatencyHistogram())
+        self.errors.setdefault(name, 0)
+        # list.append is atomic, so the hot path records without taking a lock
+        samples = self._samples.setdefault(name, [])
+        record = samples.append
+        count_answers = self._answer_counter(name)
+        perf_counter = time.perf_counter
+
+        if self.profile_every:
+            local = self._local
+
+            def call(*args, **kwargs):
+                # Only the outermost instrumented call is profiled; cProfile cannot nest
+                depth = getattr(local, 'depth', 0)
+                local.depth = depth + 1
+                try:
+                    if depth == 0 and self._sample():
+                        return self._profiled(method, args, kwargs)
+                    return method(*args, **kwargs)
+                finally:
+                    local.depth = depth
+        else:
+            call = method
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return call(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self.errors[name] += 1
+                raise
+            finally:
+                record(perf_counter() - start)
+                if count_answers is not None:
+                    count_answers(args)
+                if len(samples) >= self.FOLD_EVERY:
+                    self._fold()
+
+        return wrapper
+
+    def _answer_counter(self, name: str) -> Optional[Callable]:
+        """For the steps that record attempts, a function adding their answer counts given the call's args."""
+        answer_counts = self._answer_counts
+        if name == 'record_attempt':
+            def count_answers(args):
+                answer_counts.append(len(args[2].student_answers))
+        elif name == 'record_attempts':
+            def count_answers(args):
+                answer_counts.extend(len(attempt.student_answers) for _, _, attempt, _ in args[0])
+        else:
+            return None
+        return count_answers
+
+    def _fold(self) -> None:
+        """Move recorded samples into the histograms and counters."""
+        with self._lock:
+            for name, samples in self._samples.items():
+                # Appends made while folding land after the first count entries and are kept
+                count = len(samples)
+                histogram = self.timers[name]
+                for seconds in samples[:count]:
+                    histogram.record(seconds)
+                del samples[:count]
+            answer_counts = self._answer_counts
+            count = len(answer_counts)
+            self._attempts_recorded += count
+            self._answers_graded += sum(answer_counts[:count])
+            del answer_counts[:count]
+
+    def _sample(self) -> bool:
+        with self._lock:
+            self._calls += 1
+            return self._calls % self.profile_every == 0
+
+    def _profiled(self, method: Callable, args: Tuple, kwargs: Dict):
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(method, *args, **kwargs)
+        finally:
+            with self._lock:
+                if self._profile is None:
+                    self._profile = pstats.Stats(profiler)
+                else:
+                    self._profile.add(profiler)
+
+    def profile_stats(self) -> Optional[pstats.Stats]:
+        """Accumulated profiler samples, or None if nothing was sampled yet."""
+        return self._profile
+
+    def profile_report(self, limit: int = 25, sort: str = 'cumulative') -> str:
+        """The top functions of the sampled calls, as pstats prints them."""
+        if self._profile is None:
+            return ''
+        stream = io.StringIO()
+        with self._lock:
+            stats = pstats.Stats(stream=stream)
+            stats.add(self._profile)
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def gauges(self) -> Dict:
+        """Profile size gauges, totalled over all students plus the largest profiles individually."""
+        with self.agent._state_lock:
+            sizes = [(student_id, profile_gauges(profile)) for student_id, profile in self.agent.student_profiles.items()]
+        sizes.sort(key=lambda item: item[1]['attempt_bytes'], reverse=True)
+        return {
+            'students': len(sizes),
+            'history_length_total': sum(gauges['history_length'] for _, gauges in sizes),
+            'attempts_in_memory_total': sum(gauges['attempts_in_memory'] for _, gauges in sizes),
+            'attempt_bytes_total': sum(gauges['attempt_bytes'] for _, gauges in sizes),
+            'largest_profiles': dict(sizes[:self.largest_profiles]),
+        }
+
+    def counters(self) -> Dict[str, int]:
+        self._fold()
+        with self._lock:
+            return {'attempts_recorded': self._attempts_recorded, 'answers_graded': self._answers_graded}
+
+    def to_json(self) -> Dict:
+        counters = self.counters()
+        with self._lock:
+            timers = {name: histogram.summary() for name, histogram in self.timers.items()}
+            errors = dict(self.errors)
+        return {'timers': timers, 'errors': errors, 'counters': counters, 'gauges': self.gauges()}
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        counters = self.counters()
+        with self._lock:
+            lines += ['# HELP agent_call_seconds Time spent in agent methods and grading steps.',
+                      '# TYPE agent_call_seconds histogram']
+            for name, histogram in self.timers.items():
+                cumulative = 0
+                bucket = 0
+                for bound in self.EXPORTED_BOUNDS:
+                    # Counts up to and including the exported bound's bucket
+                    while bucket < len(histogram.BOUNDS) and histogram.BOUNDS[bucket] <= bound:
+                        cumulative += histogram.counts[bucket]
+                        bucket += 1
+                    lines.append(f'agent_call_seconds_bucket{{method="{name}",le="{bound:.6g}"}} {cumulative}')
+                lines.append(f'agent_call_seconds_bucket{{method="{name}",le="+Inf"}} {histogram.total}')
+                lines.append(f'agent_call_seconds_sum{{method="{name}"}} {histogram.sum:.9g}')
+                lines.append(f'agent_call_seconds_count{{method="{name}"}} {histogram.total}')
+            lines += ['# HELP agent_call_errors_total Calls that raised an exception.',
+                      '# TYPE agent_call_errors_total counter']
+            lines += [f'agent_call_errors_total{{method="{name}"}} {count}' for name, count in self.errors.items()]
+            for name, value in counters.items():
+                lines += [f'# TYPE agent_{name}_total counter', f'agent_{name}_total {value}']
+        gauges = self.gauges()
+        for name in ('students', 'history_length_total', 'attempts_in_memory_total', 'attempt_bytes_total'):
+            lines += [f'# TYPE agent_{name} gauge', f'agent_{name} {gauges[name]}']
+        for name in ('history_length', 'attempts_in_memory', 'attempt_bytes'):
+            lines.append(f'# TYPE agent_profile_{name} gauge')
+            lines += [f'agent_profile_{name}{{student_id="{_escape(student_id)}"}} {values[name]}'
+                      for student_id, values in gauges['largest_profiles'].items()]
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str, fmt: str = 'prometheus') -> None:
+        """
+        Write metrics to a file, replacing it atomically, e.g. for the
+        Prometheus node exporter's textfile collector.
+        """
+        if fmt == 'prometheus':
+            text = self.to_prometheus()
+        elif fmt == 'json':
+            text = json.dumps(self.to_json(), indent=2)
+        else:
+            raise ValueError(f"Unknown metrics format {fmt!r}; expected 'prometheus' or 'json'")
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            handle.write(text)
+        os.replace(temp_path, path)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
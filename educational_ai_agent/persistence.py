@@ -0,0 +1,247 @@
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+# A snapshot is a header dict followed by (student_id, profile record) pairs
+Snapshot = Tuple[Dict, Iterator[Tuple[str, Dict]]]
+
+
+class StorageBackend:
+    """
+    Durable storage for agent state: an append-only event log plus periodic
+    snapshots. Events carry a monotonically increasing 'seq'; a snapshot taken
+    at seq N replaces every event up to and including N.
+    """
+
+    def append(self, event: Dict) -> None:
+        """Add an event to the log. It is durable after the next flush."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Force buffered events to stable storage."""
+        raise NotImplementedError
+
+    def write_snapshot(self, seq: int, header: Dict, profiles: Iterable[Tuple[str, Dict]]) -> None:
+        """Persist full profile state as of seq and drop the events it covers."""
+        raise NotImplementedError
+
+    def load(self) -> Tuple[Optional[Snapshot], Iterator[Dict]]:
+        """Return the newest snapshot (or None) and the events logged after it."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.flush()
+
+
+class FileStorage(StorageBackend):
+    """
+    Local-file backend. Events go to JSON-lines log segments and are fsynced
+    in batches of fsync_batch events or every fsync_interval seconds,
+    whichever comes first. Each snapshot starts a new segment and removes the
+    segments and snapshots it supersedes, so startup replays only the tail.
+    """
+
+    def __init__(self, directory: str, fsync_batch: int = 256, fsync_interval: float = 1.0):
+        self.directory = directory
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        segments = self._segments()
+        if segments:
+            # A crash may have left a partial line; appending after it would merge it with the next event
+            self._truncate_torn_tail(segments[-1][1])
+        self._log = open(segments[-1][1] if segments else self._segment_path(0), 'a', encoding='utf-8')
+
+    @staticmethod
+    def _truncate_torn_tail(path: str, block_size: int = 65536) -> None:
+        """Cut a log segment back to the end of its last complete line."""
+        with open(path, 'r+b') as segment:
+            end = segment.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - block_size)
+                segment.seek(start)
+                newline = segment.read(position - start).rfind(b'\n')
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                segment.truncate(position)
+                segment.flush()
+                os.fsync(segment.fileno())
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self.directory, f'log-{seq:012d}.jsonl')
+
+    def _snapshot_path(self, seq: int) -> str:
+        return os.path.join(self.directory, f'snapshot-{seq:012d}.jsonl')
+
+    def _listing(self, prefix: str):
+        paths = glob.glob(os.path.join(self.directory, f'{prefix}-*.jsonl'))
+        return sorted((int(os.path.basename(path)[len(prefix) + 1:-6]), path) for path in paths)
+
+    def _segments(self):
+        return self._listing('log')
+
+    def append(self, event: Dict) -> None:
+        line = json.dumps(event, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._log.write(line)
+            self._pending += 1
+            if self._pending >= self.fsync_batch or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def _sync(self) -> None:
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._sync()
+
+    def write_snapshot(self, seq: int, header: Dict, profiles: Iterable[Tuple[str, Dict]]) -> None:
+        with self._lock:
+            self._sync()
+            # Later events go to a fresh segment so older segments can be dropped
+            self._log.close()
+            self._log = open(self._segment_path(seq + 1), 'a', encoding='utf-8')
+
+        path = self._snapshot_path(seq)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as snapshot:
+            snapshot.write(json.dumps(dict(header, seq=seq), separators=(',', ':')) + '\n')
+            for student_id, record in profiles:
+                snapshot.write(json.dumps([student_id, record], separators=(',', ':')) + '\n')
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temp_path, path)
+
+        for snapshot_seq, old_path in self._listing('snapshot'):
+            if snapshot_seq < seq:
+                os.remove(old_path)
+        for segment_seq, old_path in self._segments():
+            if segment_seq <= seq:
+                os.remove(old_path)
+
+    def load(self) -> Tuple[Optional[Snapshot], Iterator[Dict]]:
+        snapshots = self._listing('snapshot')
+        snapshot = self._read_snapshot(snapshots[-1][1]) if snapshots else None
+        after = snapshot[0]['seq'] if snapshot else 0
+        return snapshot, self._read_events(after)
+
+    def _read_snapshot(self, path: str) -> Snapshot:
+        handle = open(path, encoding='utf-8')
+        header = json.loads(handle.readline())
+
+        def profiles():
+            with handle:
+                for line in handle:
+                    student_id, record = json.loads(line)
+                    yield student_id, record
+
+        return header, profiles()
+
+    def _read_events(self, after: int) -> Iterator[Dict]:
+        for segment_seq, path in self._segments():
+            with open(path, encoding='utf-8') as segment:
+                for line in segment:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line torn by a crash; later lines were written after a restart and are intact
+                        continue
+                    if event['seq'] > after:
+                        yield event
+
+    def close(self) -> None:
+        with self._lock:
+            self._sync()
+            self._log.close()
+
+
+class SQLiteStorage(StorageBackend):
+    """
+    SQLite backend. Events are committed in batches of commit_batch; a
+    snapshot is stored in the same file and deletes the events it covers.
+    A file belongs to one agent at a time: each agent numbers events from
+    its own in-memory sequence and never reads events another agent logs,
+    so two agents writing the same file conflict. Give each process its own
+    file, as ShardedAgentPool does with FileStorage directories.
+    """
+
+    def __init__(self, path: str, commit_batch: int = 256):
+        self.path = path
+        self.commit_batch = commit_batch
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=FULL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS events (seq INTEGER PRIMARY KEY, payload TEXT NOT NULL)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS snapshots (seq INTEGER PRIMARY KEY, header TEXT NOT NULL)')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS snapshot_profiles '
+            '(seq INTEGER NOT NULL, student_id TEXT NOT NULL, payload TEXT NOT NULL, PRIMARY KEY (seq, student_id))'
+        )
+        self._conn.commit()
+
+    def append(self, event: Dict) -> None:
+        with self._lock:
+            self._conn.execute('INSERT INTO events VALUES (?, ?)',
+                               (event['seq'], json.dumps(event, separators=(',', ':'))))
+            self._pending += 1
+            if self._pending >= self.commit_batch:
+                self._conn.commit()
+                self._pending = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def write_snapshot(self, seq: int, header: Dict, profiles: Iterable[Tuple[str, Dict]]) -> None:
+        with self._lock:
+            conn = self._conn
+            conn.commit()
+            # A second snapshot at the same seq, e.g. with no events since the last,
+            # replaces the first in the same transaction
+            conn.execute('DELETE FROM snapshot_profiles WHERE seq >= ?', (seq,))
+            conn.execute('DELETE FROM snapshots WHERE seq >= ?', (seq,))
+            conn.executemany('INSERT INTO snapshot_profiles VALUES (?, ?, ?)', (
+                (seq, student_id, json.dumps(record, separators=(',', ':'))) for student_id, record in profiles
+            ))
+            conn.execute('INSERT INTO snapshots VALUES (?, ?)', (seq, json.dumps(dict(header, seq=seq))))
+            conn.execute('DELETE FROM snapshot_profiles WHERE seq < ?', (seq,))
+            conn.execute('DELETE FROM snapshots WHERE seq < ?', (seq,))
+            conn.execute('DELETE FROM events WHERE seq <= ?', (seq,))
+            conn.commit()
+            self._pending = 0
+
+    def load(self) -> Tuple[Optional[Snapshot], Iterator[Dict]]:
+        row = self._conn.execute('SELECT seq, header FROM snapshots ORDER BY seq DESC LIMIT 1').fetchone()
+        snapshot = None
+        after = 0
+        if row is not None:
+            after = row[0]
+            profiles = ((student_id, json.loads(payload)) for student_id, payload in self._conn.execute(
+                'SELECT student_id, payload FROM snapshot_profiles WHERE seq = ?', (after,)))
+            snapshot = (json.loads(row[1]), profiles)
+        events = (json.loads(payload) for (payload,) in self._conn.execute(
+            'SELECT payload FROM events WHERE seq > ? ORDER BY seq', (after,)))
+        return snapshot, events
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
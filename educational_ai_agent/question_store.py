@@ -0,0 +1,169 @@
+import os
+import random
+import threading
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .answer_matching import AnswerKey, compile_answer
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Difficulty levels in progression order
+LEVELS = ('easy', 'medium', 'hard')
+
+
+class QuestionStore:
+    """
+    Read-only question bank indexed by (subject, level).
+    Every question gets an integer id; quizzes are sampled by id so the
+    underlying lists are never copied. A store is safe to share between agents.
+    """
+
+    def __init__(self, questions: List[Dict], index: Dict[Tuple[str, str], Sequence[int]]):
+        self._questions = questions
+        # Answers are compiled once, so grading is a compare against a canonical key
+        self._answer_keys = [compile_answer(question['answer']) for question in questions]
+        self._index = index
+        self.subjects = list(dict.fromkeys(subject for subject, _ in index))
+        self.subject_ids = {subject: i for i, subject in enumerate(self.subjects)}
+
+    @classmethod
+    def from_dict(cls, bank: Dict[str, Dict[str, List[Dict]]]) -> 'QuestionStore':
+        """Build an in-memory store from a nested {subject: {level: [question, ...]}} dict."""
+        questions = []
+        index = {}
+        for subject, levels in bank.items():
+            for level, items in levels.items():
+                ids = array('l')
+                for item in items:
+                    ids.append(len(questions))
+                    questions.append(dict(item, id=len(questions)))
+                index[(subject, level)] = ids
+        return cls(questions, index)
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._index.values())
+
+    def question_ids(self, subject: str, level: str) -> Sequence[int]:
+        """Return the ids of all questions for a subject at a given level."""
+        return self._index.get((subject, level), ())
+
+    def in_subject(self, subject: str, question_id: int) -> bool:
+        """Whether a question id is one of the subject's questions, at any level."""
+        return any(question_id in self.question_ids(subject, level) for level in LEVELS)
+
+    def get(self, question_id: int) -> Dict:
+        """Return the question with the given id."""
+        return self._questions[question_id]
+
+    def answer_key(self, question_id: int) -> AnswerKey:
+        """Return the compiled answer key for a question."""
+        return self._answer_keys[question_id]
+
+    def sample(self, subject: str, level: str, k: int) -> List[int]:
+        """Randomly pick up to k question ids for a subject and level."""
+        ids = self.question_ids(subject, level)
+        return random.sample(ids, min(k, len(ids)))
+
+
+class SQLiteQuestionStore(QuestionStore):
+    """
+    Question store backed by a SQLite file written with build_question_db.
+    Only the (subject, level) index is read on open; question rows and their
+    compiled answer keys are fetched lazily by id and kept in bounded caches.
+    """
+
+    def __init__(self, path: str, cache_size: int = 4096):
+        self.path = path
+        self._local = threading.local()
+        self.get = lru_cache(maxsize=cache_size)(self._fetch)
+        self.answer_key = lru_cache(maxsize=cache_size)(self._compute_answer_key)
+        super().__init__([], self._load_index())
+
+    def _connection(self) -> 'sqlite3.Connection':
+        # Connections must not cross threads or forked processes
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            import sqlite3
+            conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _load_index(self) -> Dict[Tuple[str, str], Sequence[int]]:
+        index = {}
+        rows = self._connection().execute(
+            'SELECT subject, level, MIN(id), MAX(id), COUNT(*) FROM questions '
+            'GROUP BY subject, level ORDER BY MIN(id)'
+        ).fetchall()
+        for subject, level, first, last, count in rows:
+            if last - first + 1 == count:
+                # Rows are written grouped by (subject, level), so ids form a contiguous range
+                index[(subject, level)] = range(first, last + 1)
+            else:
+                index[(subject, level)] = array('l', (row[0] for row in self._connection().execute(
+                    'SELECT id FROM questions WHERE subject = ? AND level = ? ORDER BY id', (subject, level))))
+        return index
+
+    def _fetch(self, question_id: int) -> Dict:
+        row = self._connection().execute(
+            'SELECT question, answer, explanation FROM questions WHERE id = ?', (question_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(question_id)
+        return {'question': row[0], 'answer': row[1], 'explanation': row[2], 'id': question_id}
+
+    def _compute_answer_key(self, question_id: int) -> AnswerKey:
+        return compile_answer(self.get(question_id)['answer'])
+
+
+def build_question_db(path: str, bank: Dict[str, Dict[str, Iterable[Dict]]]) -> None:
+    """
+    Write a question bank to a SQLite file readable by SQLiteQuestionStore.
+    Questions are numbered consecutively per (subject, level) so the store can
+    index them as id ranges.
+    """
+    import sqlite3
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('DROP TABLE IF EXISTS questions')
+        conn.execute(
+            'CREATE TABLE questions (id INTEGER PRIMARY KEY, subject TEXT NOT NULL, '
+            'level TEXT NOT NULL, question TEXT NOT NULL, answer, explanation TEXT)'
+        )
+        next_id = 0
+        for subject, levels in bank.items():
+            for level, items in levels.items():
+                rows = []
+                for item in items:
+                    rows.append((next_id, subject, level, item['question'], item['answer'], item.get('explanation', '')))
+                    next_id += 1
+                conn.executemany('INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?)', rows)
+        conn.execute('CREATE INDEX idx_questions_subject_level ON questions (subject, level, id)')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+_shared_stores: Dict[Optional[str], QuestionStore] = {}
+_shared_lock = threading.Lock()
+
+
+def load_question_store(path: Optional[str] = None) -> QuestionStore:
+    """
+    Return the shared store for a SQLite question bank, or the built-in bank
+    when no path is given. Each bank is loaded once per process.
+    """
+    key = os.path.abspath(path) if path else None
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            if key:
+                store = SQLiteQuestionStore(key)
+            else:
+                from .default_bank import DEFAULT_QUESTION_BANK
+                store = QuestionStore.from_dict(DEFAULT_QUESTION_BANK)
+            _shared_stores[key] = store
+        return store
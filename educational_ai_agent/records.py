@@ -0,0 +1,337 @@
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .question_store import LEVELS, QuestionStore
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Number of most recent scores kept per subject for trend analysis
+TREND_WINDOW = 3
+# Answers a quiz attempt can hold: one bit each in the 64-bit correct mask column
+MAX_ANSWERS = 64
+
+
+@lru_cache(maxsize=4096)
+def format_timestamp(timestamp: int) -> str:
+    """
+    Format an integer epoch timestamp the way reports display it. Students
+    active in the same second share a timestamp, so formatted values are cached.
+    """
+    return datetime.fromtimestamp(timestamp).strftime(TIMESTAMP_FORMAT)
+
+
+# Performance trend labels; a subject needs TREND_WINDOW scores before it has a direction
+IMPROVING = "Improving"
+STABLE = "Stable"
+NEEDS_ATTENTION = "Needs attention"
+COLLECTING_DATA = "Collecting data"
+NOT_ENOUGH_DATA = "Not enough data"
+
+
+def overall_trend(trends: Iterable[str]) -> str:
+    """Combine per-subject trends into the overall trend of a progress report."""
+    improving_count = 0
+    needs_attention_count = 0
+    for trend in trends:
+        if trend == IMPROVING:
+            improving_count += 1
+        elif trend == NEEDS_ATTENTION:
+            needs_attention_count += 1
+    if improving_count > needs_attention_count:
+        return IMPROVING
+    if needs_attention_count > improving_count:
+        return NEEDS_ATTENTION
+    return STABLE
+
+
+class SubjectAggregate:
+    """Running per-subject score aggregate updated on every quiz attempt."""
+    __slots__ = ('count', 'total', 'recent')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        # A short tuple is far smaller than a deque for a three-score window
+        self.recent: Tuple[float, ...] = ()
+
+    def add(self, score: float) -> None:
+        """Record a new score for the subject."""
+        self.count += 1
+        self.total += score
+        self.recent = (self.recent + (score,))[-TREND_WINDOW:]
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count
+
+    @property
+    def trend(self) -> str:
+        """Direction of the most recent scores, averaged over the window."""
+        if self.count < TREND_WINDOW:
+            return COLLECTING_DATA
+        avg_change = (self.recent[-1] - self.recent[0]) / len(self.recent)
+        if avg_change > 5:
+            return IMPROVING
+        if avg_change < -5:
+            return NEEDS_ATTENTION
+        return STABLE
+
+    def to_record(self) -> List:
+        return [self.count, self.total, list(self.recent)]
+
+    @classmethod
+    def from_record(cls, record: List) -> 'SubjectAggregate':
+        aggregate = cls()
+        aggregate.count, aggregate.total, recent = record
+        aggregate.recent = tuple(recent)
+        return aggregate
+
+
+@dataclass(slots=True)
+class QuizAttempt:
+    """A single graded quiz. Subjects and levels are stored as small integer ids."""
+    timestamp: int
+    subject: int
+    level: int
+    score: float
+    question_ids: Tuple[int, ...]
+    student_answers: Tuple
+    correct: int  # bitmask, bit i set when answer i was correct
+
+    def is_correct(self, index: int) -> bool:
+        return bool(self.correct >> index & 1)
+
+    def to_record(self) -> List:
+        """Flatten the attempt into a JSON-serializable list."""
+        return [self.timestamp, self.subject, self.level, self.score,
+                list(self.question_ids), list(self.student_answers), self.correct]
+
+    @classmethod
+    def from_record(cls, record: List) -> 'QuizAttempt':
+        timestamp, subject, level, score, question_ids, student_answers, correct = record
+        return cls(timestamp, subject, level, score, tuple(question_ids), tuple(student_answers), correct)
+
+    def as_dict(self, subjects: Sequence[str], question_store: QuestionStore) -> Dict:
+        """Expand the attempt into the dict shape stored in quiz_attempts before compaction."""
+        questions = [question_store.get(question_id) for question_id in self.question_ids]
+        return {
+            'timestamp': format_timestamp(self.timestamp),
+            'subject': subjects[self.subject],
+            'level': LEVELS[self.level],
+            'score': self.score,
+            'questions': questions,
+            'student_answers': list(self.student_answers),
+            'detailed_responses': [
+                {
+                    'question': question['question'],
+                    'student_answer': answer,
+                    'correct_answer': question['answer'],
+                    'is_correct': self.is_correct(i),
+                    'explanation': question['explanation']
+                }
+                for i, (question, answer) in enumerate(zip(questions, self.student_answers))
+            ]
+        }
+
+
+class AttemptLog:
+    """
+    Column-oriented list of quiz attempts; rows are materialized as QuizAttempt on access.
+    Under a retention policy the oldest rows are kept as summaries, without
+    question ids or answers, and the oldest summaries may be dropped from
+    memory altogether; archived counts those, so total stays exact.
+    """
+    __slots__ = ('subjects', 'levels', 'scores', 'timestamps', 'correct', 'question_ids', 'student_answers',
+                 'archived')
+
+    def __init__(self):
+        self.subjects = array('B')
+        self.levels = array('B')
+        self.scores = array('d')
+        self.timestamps = array('q')
+        self.correct = array('Q')
+        # Question ids and answers of the most recent (detailed) rows only
+        self.question_ids: List[Tuple[int, ...]] = []
+        self.student_answers: List[Tuple] = []
+        # Attempts no longer held in memory
+        self.archived = 0
+
+    def append(self, attempt: QuizAttempt) -> None:
+        """Add a row; a value that does not fit its column raises and leaves every column unchanged."""
+        size = len(self.scores)
+        try:
+            self.subjects.append(attempt.subject)
+            self.levels.append(attempt.level)
+            self.scores.append(attempt.score)
+            self.timestamps.append(attempt.timestamp)
+            self.correct.append(attempt.correct)
+        except (OverflowError, TypeError):
+            for column in (self.subjects, self.levels, self.scores, self.timestamps, self.correct):
+                del column[size:]
+            raise
+        self.question_ids.append(attempt.question_ids)
+        self.student_answers.append(attempt.student_answers)
+
+    def __len__(self) -> int:
+        """Number of attempts held in memory."""
+        return len(self.scores)
+
+    @property
+    def total(self) -> int:
+        """Number of attempts ever recorded, including those no longer in memory."""
+        return self.archived + len(self.scores)
+
+    @property
+    def summarized(self) -> int:
+        """Number of rows in memory kept without question ids and answers."""
+        return len(self.scores) - len(self.question_ids)
+
+    def __getitem__(self, index: int) -> QuizAttempt:
+        if index < 0:
+            index += len(self)
+        detail = index - self.summarized
+        if detail >= 0:
+            question_ids, student_answers = self.question_ids[detail], self.student_answers[detail]
+        else:
+            question_ids = student_answers = ()
+        return QuizAttempt(
+            self.timestamps[index], self.subjects[index], self.levels[index], self.scores[index],
+            question_ids, student_answers, self.correct[index]
+        )
+
+    def __iter__(self) -> Iterator[QuizAttempt]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def compact(self, keep_detailed: int, keep_summaries: Optional[int] = None) -> List[Tuple[int, QuizAttempt]]:
+        """
+        Keep question ids and answers for the keep_detailed most recent
+        attempts only, and at most keep_summaries older rows (None for no
+        limit). Returns (ordinal, attempt) for every attempt that lost its
+        detail, in order, where ordinal is its position in the full history.
+        """
+        demoted = []
+        drop = len(self.question_ids) - keep_detailed
+        if drop > 0:
+            first = self.summarized
+            demoted = [(self.archived + first + i, self[first + i]) for i in range(drop)]
+            del self.question_ids[:drop]
+            del self.student_answers[:drop]
+        if keep_summaries is not None:
+            excess = self.summarized - keep_summaries
+            if excess > 0:
+                for column in (self.subjects, self.levels, self.scores, self.timestamps, self.correct):
+                    del column[:excess]
+                self.archived += excess
+        return demoted
+
+    def to_record(self) -> Dict:
+        """Return the log as JSON-serializable columns."""
+        return {
+            'subjects': self.subjects.tolist(),
+            'levels': self.levels.tolist(),
+            'scores': self.scores.tolist(),
+            'timestamps': self.timestamps.tolist(),
+            'correct': self.correct.tolist(),
+            'question_ids': [list(ids) for ids in self.question_ids],
+            'student_answers': [list(answers) for answers in self.student_answers],
+            'archived': self.archived
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict) -> 'AttemptLog':
+        log = cls()
+        log.subjects.extend(record['subjects'])
+        log.levels.extend(record['levels'])
+        log.scores.extend(record['scores'])
+        log.timestamps.extend(record['timestamps'])
+        log.correct.extend(record['correct'])
+        log.question_ids = [tuple(ids) for ids in record['question_ids']]
+        log.student_answers = [tuple(answers) for answers in record['student_answers']]
+        # Records written before retention existed hold every attempt
+        log.archived = record.get('archived', 0)
+        return log
+
+
+@dataclass(slots=True)
+class StudentProfile:
+    """
+    Compact student profile. Levels are indexes into LEVELS, one byte per subject,
+    and mastered subjects are a bitmask over subject ids.
+    """
+    name: str
+    subjects: Sequence[str]
+    levels: array
+    last_activity: int
+    mastered: int = 0
+    learning_style: Optional[str] = None
+    preferred_topics: Tuple[str, ...] = ()
+    attempts: AttemptLog = field(default_factory=AttemptLog)
+    subject_stats: Dict[str, SubjectAggregate] = field(default_factory=dict)
+
+    @classmethod
+    def new(cls, name: str, subjects: Sequence[str], timestamp: int) -> 'StudentProfile':
+        """Create a profile starting every subject at the easiest level."""
+        return cls(name, subjects, array('B', bytes(len(subjects))), timestamp)
+
+    def has_mastered(self, subject_id: int) -> bool:
+        return bool(self.mastered >> subject_id & 1)
+
+    @property
+    def current_level(self) -> Dict[str, str]:
+        return {subject: LEVELS[level] for subject, level in zip(self.subjects, self.levels)}
+
+    @property
+    def topics_mastered(self) -> List[str]:
+        return [subject for i, subject in enumerate(self.subjects) if self.has_mastered(i)]
+
+    @property
+    def performance_history(self) -> List[Dict]:
+        attempts = self.attempts
+        return [
+            {
+                'subject': self.subjects[attempts.subjects[i]],
+                'score': attempts.scores[i],
+                'level': LEVELS[attempts.levels[i]],
+                'timestamp': format_timestamp(attempts.timestamps[i])
+            }
+            for i in range(len(attempts))
+        ]
+
+    def to_record(self) -> Dict:
+        """Return the profile as a JSON-serializable dict, used for snapshots."""
+        return {
+            'name': self.name,
+            'levels': self.levels.tolist(),
+            'last_activity': self.last_activity,
+            'mastered': self.mastered,
+            'learning_style': self.learning_style,
+            'preferred_topics': list(self.preferred_topics),
+            'attempts': self.attempts.to_record(),
+            'subject_stats': {subject: stats.to_record() for subject, stats in self.subject_stats.items()}
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict, subjects: Sequence[str]) -> 'StudentProfile':
+        return cls(
+            record['name'], subjects, array('B', record['levels']), record['last_activity'],
+            record['mastered'], record['learning_style'], tuple(record['preferred_topics']),
+            AttemptLog.from_record(record['attempts']),
+            {subject: SubjectAggregate.from_record(stats) for subject, stats in record['subject_stats'].items()}
+        )
+
+    def as_dict(self, question_store: QuestionStore) -> Dict:
+        """Expand the profile into the nested dict shape used before compaction."""
+        return {
+            'name': self.name,
+            'performance_history': self.performance_history,
+            'current_level': self.current_level,
+            'topics_mastered': set(self.topics_mastered),
+            'learning_style': self.learning_style,
+            'preferred_topics': set(self.preferred_topics),
+            'quiz_attempts': [attempt.as_dict(self.subjects, question_store) for attempt in self.attempts],
+            'last_activity': format_timestamp(self.last_activity)
+        }
@@ -0,0 +1,105 @@
+"""
+Retention of quiz attempt history.
+
+A profile keeps its most recent attempts in full detail. Older attempts are
+reduced to summary rows (subject, level, score, timestamp and which answers
+were correct) and, past a second limit, dropped from memory. With an
+AttemptArchive configured, every attempt is written there in full detail as it
+leaves the detailed tier, and can be read back lazily. Report totals,
+averages and trends come from running aggregates, so they stay exact.
+"""
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from .records import AttemptLog, QuizAttempt
+
+
+class AttemptArchive:
+    """
+    SQLite file of attempts moved out of memory, keyed by student id and the
+    attempt's position in the student's history. Writing an attempt twice,
+    as replaying the event log does, replaces the earlier copy.
+    """
+
+    def __init__(self, path: str, commit_batch: int = 256, page_size: int = 500):
+        self.path = path
+        self.commit_batch = commit_batch
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS attempts '
+            '(student_id TEXT NOT NULL, ordinal INTEGER NOT NULL, payload TEXT NOT NULL, '
+            'PRIMARY KEY (student_id, ordinal))'
+        )
+        self._conn.commit()
+
+    def append(self, student_id: str, ordinal: int, attempt: QuizAttempt) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO attempts VALUES (?, ?, ?)',
+                               (student_id, ordinal, json.dumps(attempt.to_record(), separators=(',', ':'))))
+            self._pending += 1
+            if self._pending >= self.commit_batch:
+                self._conn.commit()
+                self._pending = 0
+
+    def attempts(self, student_id: str, before: Optional[int] = None) -> Iterator[QuizAttempt]:
+        """Yield a student's archived attempts in order, optionally only those with ordinal < before."""
+        last = -1
+        limit = before if before is not None else 1 << 62
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    'SELECT ordinal, payload FROM attempts WHERE student_id = ? AND ordinal > ? AND ordinal < ? '
+                    'ORDER BY ordinal LIMIT ?', (student_id, last, limit, self.page_size)
+                ).fetchall()
+            for last, payload in rows:
+                yield QuizAttempt.from_record(json.loads(payload))
+            if len(rows) < self.page_size:
+                return
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass(slots=True)
+class RetentionPolicy:
+    """
+    How much attempt history a profile keeps in memory.
+
+    keep_detailed: most recent attempts kept with question ids and answers.
+    keep_summaries: older attempts kept as summary rows; None keeps them all.
+    archive: where attempts are written when they lose their detail; without
+        one the detail is discarded.
+    """
+    keep_detailed: int = 100
+    keep_summaries: Optional[int] = 1000
+    archive: Optional[AttemptArchive] = None
+
+    def apply(self, student_id: str, log: AttemptLog) -> None:
+        """
+        Compact a log that has outgrown the policy. Compaction waits until a
+        tier is a quarter over its limit, so its cost is spread over many attempts.
+        """
+        detailed_limit = self.keep_detailed + max(1, self.keep_detailed // 4)
+        over_detailed = len(log.question_ids) >= detailed_limit
+        over_summaries = (self.keep_summaries is not None and
+                          log.summarized >= self.keep_summaries + max(1, self.keep_summaries // 4))
+        if not (over_detailed or over_summaries):
+            return
+        demoted = log.compact(self.keep_detailed, self.keep_summaries)
+        if self.archive is not None:
+            for ordinal, attempt in demoted:
+                self.archive.append(student_id, ordinal, attempt)
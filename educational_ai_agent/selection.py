@@ -0,0 +1,241 @@
+"""
+Adaptive question selection.
+
+Each quiz question is drawn with probability proportional to a per-student
+weight: unseen questions and questions the student keeps missing weigh the
+most, questions they reliably answer correctly the least. Weights live in a
+Fenwick tree per (student, subject, level) pool. Every unseen question has
+the same weight, so the tree stores only the nodes that differ from it: memory
+grows with the questions a student has seen, and a draw costs O(log n) in the
+size of the pool.
+"""
+import random
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .question_store import LEVELS, QuestionStore
+from .records import QuizAttempt, StudentProfile
+
+UNSEEN_WEIGHT = 1.0
+# A question answered correctly every time it was seen still comes up now and then
+MASTERED_WEIGHT = 0.05
+
+
+def question_weight(seen: int, correct: int) -> float:
+    """Selection weight of a question the student has seen: higher the more often it was missed."""
+    miss_rate = 1 - correct / seen
+    return MASTERED_WEIGHT + (UNSEEN_WEIGHT - MASTERED_WEIGHT) * miss_rate
+
+
+class WeightTree:
+    """
+    Fenwick tree over n positions that all start at the same base weight.
+    Only positions whose weight was changed, and the tree nodes covering
+    them, are stored.
+    """
+    __slots__ = ('size', 'base', '_top', '_nodes', '_weights', '_adjustment')
+
+    def __init__(self, size: int, base: float = UNSEEN_WEIGHT):
+        self.size = size
+        self.base = base
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+        # Fenwick node -> sum of (weight - base) over the positions it covers
+        self._nodes: Dict[int, float] = {}
+        # position -> weight, for positions not at the base weight
+        self._weights: Dict[int, float] = {}
+        self._adjustment = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.base * self.size + self._adjustment
+
+    def weight(self, position: int) -> float:
+        return self._weights.get(position, self.base)
+
+    def set(self, position: int, weight: float) -> None:
+        """Set the weight of a zero-based position in O(log n)."""
+        delta = weight - self.weight(position)
+        if weight == self.base:
+            self._weights.pop(position, None)
+        else:
+            self._weights[position] = weight
+        self._adjustment += delta
+        nodes = self._nodes
+        node = position + 1
+        while node <= self.size:
+            nodes[node] = nodes.get(node, 0.0) + delta
+            node += node & -node
+
+    def find(self, target: float) -> int:
+        """Return the position whose cumulative weight range contains target, in O(log n)."""
+        nodes = self._nodes
+        base = self.base
+        position = 0
+        step = self._top
+        while step:
+            node = position + step
+            if node <= self.size:
+                span = base * step + nodes.get(node, 0.0)
+                if target >= span:
+                    target -= span
+                    position = node
+            step >>= 1
+        # Guards against rounding pushing target past the last position
+        return min(position, self.size - 1)
+
+
+class AdaptiveSelector:
+    """
+    Picks quiz questions for students and keeps per-question and
+    per-student statistics: times seen, times answered correctly and when
+    each question was last seen. A student's statistics are built from their
+    attempt history the first time a quiz is selected for them, then updated
+    as attempts are recorded.
+    """
+
+    def __init__(self, question_store: QuestionStore, rng: Optional[random.Random] = None):
+        self.question_store = question_store
+        self.rng = rng or random
+        count = len(question_store)
+        self._seen = array('L', [0]) * count
+        self._correct = array('L', [0]) * count
+        self._last_seen = array('q', [0]) * count
+        # student_id -> question_id -> [times seen, times correct, last seen]
+        self._student_stats: Dict[str, Dict[int, List[int]]] = {}
+        # student_id -> (subject, level) -> weight tree over that pool
+        self._student_trees: Dict[str, Dict[Tuple[str, str], WeightTree]] = {}
+        # (subject, level) -> question_id -> position, for pools whose ids are not a range
+        self._positions: Dict[Tuple[str, str], Dict[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def _position(self, pool: Tuple[str, str], ids: Sequence[int], question_id: int) -> Optional[int]:
+        """Position of a question in its pool, or None if it is not in the pool."""
+        if isinstance(ids, range):
+            return question_id - ids.start if question_id in ids else None
+        positions = self._positions.get(pool)
+        if positions is None:
+            positions = self._positions[pool] = {qid: position for position, qid in enumerate(ids)}
+        return positions.get(question_id)
+
+    def record(self, student_id: str, subjects: Sequence[str], attempt: QuizAttempt) -> None:
+        """Count a graded attempt in the question statistics and the student's weights."""
+        with self._lock:
+            self._count_global(attempt)
+            stats = self._student_stats.get(student_id)
+            if stats is not None:
+                self._count_student(student_id, stats, subjects, attempt)
+
+    def record_many(self, records: Iterable[Tuple[str, Sequence[str], QuizAttempt]]) -> None:
+        """record() for many (student_id, subjects, attempt) records, taking the lock once."""
+        with self._lock:
+            student_stats = self._student_stats
+            for student_id, subjects, attempt in records:
+                self._count_global(attempt)
+                stats = student_stats.get(student_id)
+                if stats is not None:
+                    self._count_student(student_id, stats, subjects, attempt)
+
+    def add_history(self, student_id: str, profile: StudentProfile) -> None:
+        """
+        Count a loaded or imported profile's attempt history in the question
+        statistics. The student's own statistics are rebuilt on their next quiz.
+        """
+        with self._lock:
+            for attempt in profile.attempts:
+                self._count_global(attempt)
+            self._forget(student_id)
+
+    def forget(self, student_id: str) -> None:
+        """Drop a student's statistics, e.g. when their profile is replaced."""
+        with self._lock:
+            self._forget(student_id)
+
+    def _forget(self, student_id: str) -> None:
+        self._student_stats.pop(student_id, None)
+        self._student_trees.pop(student_id, None)
+
+    def _count_global(self, attempt: QuizAttempt) -> None:
+        seen, correct, last_seen = self._seen, self._correct, self._last_seen
+        correct_mask, timestamp = attempt.correct, attempt.timestamp
+        for index, question_id in enumerate(attempt.question_ids[:len(attempt.student_answers)]):
+            seen[question_id] += 1
+            correct[question_id] += correct_mask >> index & 1
+            last_seen[question_id] = timestamp
+
+    def _count_student(self, student_id: str, stats: Dict[int, List[int]],
+                       subjects: Sequence[str], attempt: QuizAttempt) -> None:
+        pool = (subjects[attempt.subject], LEVELS[attempt.level])
+        tree = self._student_trees[student_id].get(pool)
+        ids = self.question_store.question_ids(*pool)
+        correct_mask, timestamp = attempt.correct, attempt.timestamp
+        for index, question_id in enumerate(attempt.question_ids[:len(attempt.student_answers)]):
+            entry = stats.get(question_id)
+            if entry is None:
+                entry = stats[question_id] = [0, 0, 0]
+            entry[0] += 1
+            entry[1] += correct_mask >> index & 1
+            entry[2] = timestamp
+            position = self._position(pool, ids, question_id) if tree is not None else None
+            if position is not None:
+                tree.set(position, question_weight(entry[0], entry[1]))
+
+    def _student(self, student_id: str, profile: StudentProfile) -> Dict[int, List[int]]:
+        stats = self._student_stats.get(student_id)
+        if stats is None:
+            stats = self._student_stats[student_id] = {}
+            self._student_trees[student_id] = {}
+            for attempt in profile.attempts:
+                self._count_student(student_id, stats, profile.subjects, attempt)
+        return stats
+
+    def _tree(self, student_id: str, stats: Dict[int, List[int]], pool: Tuple[str, str],
+              ids: Sequence[int]) -> WeightTree:
+        trees = self._student_trees[student_id]
+        tree = trees.get(pool)
+        if tree is None:
+            tree = trees[pool] = WeightTree(len(ids))
+            for question_id, (seen, correct, _) in stats.items():
+                position = self._position(pool, ids, question_id)
+                if position is not None:
+                    tree.set(position, question_weight(seen, correct))
+        return tree
+
+    def select(self, student_id: str, profile: StudentProfile, subject: str, level: str, k: int) -> List[int]:
+        """Draw up to k distinct question ids for a subject and level, weighted towards unseen and missed ones."""
+        pool = (subject, level)
+        ids = self.question_store.question_ids(subject, level)
+        with self._lock:
+            stats = self._student(student_id, profile)
+            tree = self._tree(student_id, stats, pool, ids)
+            picked: List[Tuple[int, float]] = []
+            try:
+                for _ in range(min(k, len(ids))):
+                    position = tree.find(self.rng.random() * tree.total)
+                    picked.append((position, tree.weight(position)))
+                    # Drawn without replacement: zero the weight until the quiz is complete
+                    tree.set(position, 0.0)
+            finally:
+                for position, weight in reversed(picked):
+                    tree.set(position, weight)
+        return [ids[position] for position, _ in picked]
+
+    def question_stats(self, question_id: int) -> Dict:
+        """How often a question has been seen and answered correctly, across all students."""
+        seen = self._seen[question_id]
+        return {
+            'times_seen': seen,
+            'correct_rate': self._correct[question_id] / seen if seen else None,
+            'last_seen': self._last_seen[question_id] or None,
+        }
+
+    def student_question_stats(self, student_id: str, profile: StudentProfile, question_id: int) -> Dict:
+        """How often one student has seen and answered a question correctly."""
+        with self._lock:
+            seen, correct, last_seen = self._student(student_id, profile).get(question_id, (0, 0, 0))
+        return {
+            'times_seen': seen,
+            'correct_rate': correct / seen if seen else None,
+            'last_seen': last_seen or None,
+        }
+
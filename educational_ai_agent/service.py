@@ -0,0 +1,185 @@
+"""
+asyncio JSON-lines service in front of EducationalAIAgent.
+
+Each request is one line of JSON, {"id": 1, "method": "evaluate_quiz", "params": {...}},
+and each response is one line, {"id": 1, "result": ...} or {"id": 1, "error": "..."}.
+Responses may arrive out of order; match them by id. generate_quiz returns
+{"session_id": ..., "questions": [...]}; pass the session_id to evaluate_quiz.
+
+    python -m educational_ai_agent.service --port 8765
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .agent import EducationalAIAgent
+from .instrumentation import LatencyHistogram
+from .sessions import Quiz
+
+# Agent methods callable over the wire; all take a student_id, which calls are serialized on
+METHODS = (
+    'create_student_profile',
+    'generate_quiz',
+    'evaluate_quiz',
+    'track_progress',
+    'provide_explanation',
+)
+
+
+class AgentService:
+    """
+    Serves agent methods to many concurrent clients. Calls run on a thread
+    pool; calls for the same student are serialized with a per-student lock so
+    concurrent submissions cannot interleave level updates or attempt records.
+    At most max_in_flight requests are processed at once. When that limit is
+    reached the server stops reading from clients, which pushes back through TCP.
+    """
+
+    def __init__(self, agent: EducationalAIAgent, max_in_flight: int = 256, workers: int = 8):
+        self.agent = agent
+        self.max_in_flight = max_in_flight
+        self.latency: Dict[str, LatencyHistogram] = {method: LatencyHistogram() for method in METHODS}
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='agent')
+        self._slots: Optional[asyncio.Semaphore] = None
+        # student_id -> [lock, number of requests holding or waiting for it]
+        self._student_locks: Dict[str, List] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict:
+        return {
+            'latency': {method: histogram.summary() for method, histogram in self.latency.items()},
+            'rejected': self.rejected,
+            'active_students': len(self._student_locks),
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                # Take a slot before reading so a saturated server stops draining the socket
+                await self._slots.acquire()
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit: the request cannot be framed, so answer and hang up
+                    self._slots.release()
+                    self.rejected += 1
+                    async with write_lock:
+                        writer.write(json.dumps({'id': None, 'error': 'Request line too long'}).encode() + b'\n')
+                    break
+                except BaseException:
+                    # No request was read, so nothing else will release this slot
+                    self._slots.release()
+                    raise
+                if not line:
+                    self._slots.release()
+                    break
+                task = asyncio.create_task(self._serve_line(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_line(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock) -> None:
+        try:
+            response = await self.handle_request(line)
+            async with write_lock:
+                # default=list renders lazily built feedback as a plain list
+                writer.write(json.dumps(response, default=list).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._slots.release()
+
+    async def handle_request(self, line: bytes) -> Dict:
+        """Decode one request line, run it and return the response dict."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as error:
+            self.rejected += 1
+            return {'id': None, 'error': f'Invalid JSON: {error}'}
+        if not isinstance(request, dict):
+            self.rejected += 1
+            return {'id': None, 'error': 'Request must be a JSON object'}
+
+        request_id = request.get('id')
+        method = request.get('method')
+        params = request.get('params') or {}
+        if not isinstance(params, dict):
+            self.rejected += 1
+            return {'id': request_id, 'error': 'params must be a JSON object'}
+        if method == 'stats':
+            return {'id': request_id, 'result': self.stats()}
+        if method not in METHODS or 'student_id' not in params:
+            self.rejected += 1
+            return {'id': request_id, 'error': f'Unknown method or missing student_id: {method}'}
+
+        start = time.perf_counter()
+        try:
+            result = await self._call_for_student(params['student_id'], method, params)
+            if isinstance(result, Quiz):
+                # JSON would drop the session id carried by the list subclass
+                result = {'session_id': result.session_id, 'questions': list(result)}
+            response = {'id': request_id, 'result': result}
+        except Exception as error:
+            response = {'id': request_id, 'error': f'{type(error).__name__}: {error}'}
+        self.latency[method].record(time.perf_counter() - start)
+        return response
+
+    async def _call_for_student(self, student_id: str, method: str, params: Dict):
+        entry = self._student_locks.get(student_id)
+        if entry is None:
+            entry = self._student_locks[student_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, lambda: getattr(self.agent, method)(**params))
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                # Drop idle locks so the table only holds students with requests in flight
+                del self._student_locks[student_id]
+
+
+async def serve(host: str, port: int, max_in_flight: int, workers: int) -> None:
+    service = AgentService(EducationalAIAgent(), max_in_flight=max_in_flight, workers=workers)
+    server = await service.start(host, port)
+    print(f"Serving on {', '.join(str(sock.getsockname()) for sock in server.sockets)}")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serve EducationalAIAgent over JSON lines.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--max-in-flight', type=int, default=256)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.max_in_flight, args.workers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class Quiz(list):
+    """The questions issued to a student, plus the session id evaluate_quiz grades against."""
+
+    def __init__(self, questions: List[Dict], session_id: str):
+        super().__init__(questions)
+        self.session_id = session_id
+
+
+@dataclass(slots=True)
+class QuizSession:
+    """A quiz that was issued but not yet graded."""
+    student_id: str
+    subject: str
+    question_ids: Tuple[int, ...]
+    expires_at: float
+
+
+class QuizSessionCache:
+    """
+    Bounded store of open quiz sessions. Sessions expire ttl seconds after
+    they are issued, and the oldest open session is evicted once
+    max_sessions are open, so abandoned quizzes cannot accumulate.
+    """
+
+    def __init__(self, max_sessions: int = 100000, ttl: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._sessions: 'OrderedDict[str, QuizSession]' = OrderedDict()
+        # Most recent open session per (student_id, subject), for callers that don't pass a session id
+        self._latest: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, student_id: str, subject: str, question_ids: Tuple[int, ...]) -> str:
+        """Store a newly issued quiz and return its session id."""
+        # os.urandom is what secrets.token_hex draws from, without importing hmac and hashlib
+        session_id = os.urandom(8).hex()
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            self._sessions[session_id] = QuizSession(student_id, subject, question_ids, now + self.ttl)
+            self._latest[(student_id, subject)] = session_id
+            while len(self._sessions) > self.max_sessions:
+                self._drop(*self._sessions.popitem(last=False))
+                self.evictions += 1
+        return session_id
+
+    def take(self, session_id: str, student_id: Optional[str] = None,
+             subject: Optional[str] = None) -> Optional[QuizSession]:
+        """
+        Remove and return an open session, or None if it is unknown or expired.
+        Given a student_id and subject, a session issued for another student or
+        subject raises ValueError and stays open for its owner.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None and student_id is not None \
+                    and (session.student_id != student_id or session.subject != subject):
+                raise ValueError(f"Quiz session {session_id} was not issued to {student_id} for {subject}")
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                self._drop(session_id, session)
+                if session.expires_at <= self.clock():
+                    self.expirations += 1
+                    session = None
+            if session is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return session
+
+    def take_many(self, requests: List[Tuple[str, str, Optional[str]]]) -> List[QuizSession]:
+        """
+        Remove and return the session for each (student_id, subject, session_id),
+        taking the student's latest one for the subject when session_id is None.
+        All or none: if any session is unknown, expired, taken twice or issued
+        to someone else, raises KeyError or ValueError and leaves the others open.
+        """
+        with self._lock:
+            now = self.clock()
+            session_ids: Dict[str, None] = {}
+            for student_id, subject, session_id in requests:
+                if session_id is None:
+                    session_id = self._latest.get((student_id, subject))
+                    if session_id is None or session_id in session_ids:
+                        self.misses += 1
+                        raise KeyError(f"No open {subject} quiz for {student_id}")
+                session = self._sessions.get(session_id)
+                if session is not None and session.expires_at <= now:
+                    del self._sessions[session_id]
+                    self._drop(session_id, session)
+                    self.expirations += 1
+                    session = None
+                if session is None or session_id in session_ids:
+                    self.misses += 1
+                    raise KeyError(f"Unknown or expired quiz session: {session_id}")
+                if session.student_id != student_id or session.subject != subject:
+                    raise ValueError(f"Quiz session {session_id} was not issued to {student_id} for {subject}")
+                session_ids[session_id] = None
+            sessions = []
+            for session_id in session_ids:
+                session = self._sessions.pop(session_id)
+                self._drop(session_id, session)
+                sessions.append(session)
+            self.hits += len(sessions)
+            return sessions
+
+    def take_latest(self, student_id: str, subject: str) -> Optional[QuizSession]:
+        """Remove and return the student's most recent open session for a subject."""
+        session_id = self._latest.get((student_id, subject))
+        if session_id is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return self.take(session_id, student_id, subject)
+
+    def _drop(self, session_id: str, session: QuizSession) -> None:
+        key = (session.student_id, session.subject)
+        if self._latest.get(key) == session_id:
+            del self._latest[key]
+
+    def _expire(self, now: float) -> None:
+        # Every session gets the same ttl, so insertion order is expiry order
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.expires_at > now:
+                break
+            del self._sessions[session_id]
+            self._drop(session_id, session)
+            self.expirations += 1
+
+    def stats(self) -> Dict:
+        return {
+            'open': len(self._sessions),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
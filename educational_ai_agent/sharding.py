@@ -0,0 +1,170 @@
+"""
+Sharded execution mode: student profiles are hash-partitioned across worker
+processes, each running its own EducationalAIAgent over its shard.
+"""
+import multiprocessing
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .agent import EducationalAIAgent, check_answers
+from .persistence import FileStorage
+from .question_store import load_question_store
+from .sessions import Quiz
+
+
+def shard_for(student_id: str, shards: int) -> int:
+    """Stable shard index for a student; unlike hash() it is the same in every process."""
+    return zlib.crc32(student_id.encode('utf-8')) % shards
+
+
+def _serve_shard(conn, question_bank: Optional[str], storage_dir: Optional[str]) -> None:
+    """Worker loop: run agent calls sent by the router until told to stop."""
+    storage = FileStorage(storage_dir) if storage_dir else None
+    agent = EducationalAIAgent(question_store=load_question_store(question_bank), storage=storage)
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            method, calls = message
+            results = []
+            for args, kwargs in calls:
+                try:
+                    results.append((True, getattr(agent, method)(*args, **kwargs)))
+                except Exception as error:
+                    results.append((False, error))
+            conn.send(results)
+    finally:
+        agent.close()
+        conn.close()
+
+
+class ShardedAgentPool:
+    """
+    Router over a pool of agent worker processes. Calls for a student go to
+    the shard that owns it; class-wide operations are split by shard, sent to
+    every shard at once and reassembled in the caller's order.
+    """
+
+    def __init__(self, shards: Optional[int] = None, question_bank: Optional[str] = None,
+                 storage_dir: Optional[str] = None):
+        self.shards = shards or os.cpu_count() or 1
+        self._connections = []
+        self._processes = []
+        self._locks = []
+        for index in range(self.shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            shard_storage = os.path.join(storage_dir, f'shard-{index}') if storage_dir else None
+            process = multiprocessing.Process(
+                target=_serve_shard, args=(child_conn, question_bank, shard_storage), daemon=True)
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+            self._locks.append(threading.Lock())
+
+    def _dispatch(self, method: str, per_shard: Dict[int, List[Tuple[Tuple, Dict]]]) -> Dict[int, List]:
+        """Send each shard its (args, kwargs) calls, then collect; shards run concurrently."""
+        shards = sorted(per_shard)
+        for index in shards:
+            self._locks[index].acquire()
+        try:
+            for index in shards:
+                self._connections[index].send((method, per_shard[index]))
+            replies = {index: self._connections[index].recv() for index in shards}
+        finally:
+            for index in shards:
+                self._locks[index].release()
+        results = {}
+        for index, reply in replies.items():
+            for ok, result in reply:
+                if not ok:
+                    raise result
+            results[index] = [result for _, result in reply]
+        return results
+
+    def call(self, student_id: str, method: str, **kwargs):
+        """Run an agent method on the shard owning student_id; arguments are passed by keyword."""
+        index = shard_for(student_id, self.shards)
+        return self._dispatch(method, {index: [((), dict(kwargs, student_id=student_id))]})[index][0]
+
+    def _partition(self, student_ids: Iterable[str]) -> Dict[int, List[int]]:
+        """Group positions in student_ids by owning shard."""
+        by_shard: Dict[int, List[int]] = {}
+        for position, student_id in enumerate(student_ids):
+            by_shard.setdefault(shard_for(student_id, self.shards), []).append(position)
+        return by_shard
+
+    def fan_out(self, method: str, calls: Sequence[Tuple[str, Dict]]) -> List:
+        """
+        Run many (student_id, kwargs) calls, with every shard working on its
+        share in parallel. Results come back in the order of calls.
+        """
+        by_shard = self._partition(student_id for student_id, _ in calls)
+        replies = self._dispatch(method, {
+            index: [((), dict(calls[position][1], student_id=calls[position][0])) for position in positions]
+            for index, positions in by_shard.items()
+        })
+        results = [None] * len(calls)
+        for index, positions in by_shard.items():
+            for position, result in zip(positions, replies[index]):
+                results[position] = result
+        return results
+
+    def create_student_profile(self, student_id: str, name: str) -> None:
+        return self.call(student_id, 'create_student_profile', name=name)
+
+    def assess_learning_style(self, student_id: str, quiz_responses: List[Dict]) -> str:
+        return self.call(student_id, 'assess_learning_style', quiz_responses=quiz_responses)
+
+    def generate_quiz(self, student_id: str, subject: str) -> Quiz:
+        return self.call(student_id, 'generate_quiz', subject=subject)
+
+    def evaluate_quiz(self, student_id: str, subject: str, student_answers: List,
+                      session_id: Optional[str] = None) -> Dict:
+        return self.call(student_id, 'evaluate_quiz', subject=subject, student_answers=student_answers,
+                         session_id=session_id)
+
+    def provide_explanation(self, topic: str, concept: str, student_id: str) -> str:
+        return self.call(student_id, 'provide_explanation', topic=topic, concept=concept)
+
+    def track_progress(self, student_id: str) -> Dict:
+        return self.call(student_id, 'track_progress')
+
+    def track_progress_many(self, student_ids: Iterable[str]) -> List[Dict]:
+        """Progress reports for many students, built by all shards in parallel."""
+        return self.fan_out('track_progress', [(student_id, {}) for student_id in student_ids])
+
+    def evaluate_quiz_batch(self, submissions: Iterable[Tuple]) -> List[Dict]:
+        """Grade submissions on their owning shards in parallel; each shard grades its share as one batch."""
+        submissions = list(submissions)
+        # Rejected here, as a single agent would, rather than after the other shards have graded theirs
+        for student_id, subject, student_answers, *_ in submissions:
+            check_answers(student_id, subject, student_answers)
+        by_shard = self._partition(submission[0] for submission in submissions)
+        replies = self._dispatch('evaluate_quiz_batch', {
+            index: [(([submissions[position] for position in positions],), {})]
+            for index, positions in by_shard.items()
+        })
+        results = [None] * len(submissions)
+        for index, positions in by_shard.items():
+            for position, result in zip(positions, replies[index][0]):
+                results[position] = result
+        return results
+
+    def close(self) -> None:
+        """Stop the workers, letting each flush its storage."""
+        for index, conn in enumerate(self._connections):
+            with self._locks[index]:
+                conn.send(None)
+                conn.close()
+        for process in self._processes:
+            process.join()
+
+    def __enter__(self) -> 'ShardedAgentPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
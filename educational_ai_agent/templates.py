@@ -0,0 +1,131 @@
+"""
+Precompiled text for feedback, recommendations and explanations.
+
+Every message is a format string bound once at import. Rendered output is
+memoized on the inputs it depends on, in bounded caches, so the grading path
+formats each distinct message once instead of once per call.
+"""
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Score bands used by quiz recommendations
+NEEDS_REVIEW, PROGRESSING, EXCELLING = 0, 1, 2
+
+_REVIEW_BASICS = "Review the basics of {subject} before proceeding.".format
+_STYLE_TIPS = {
+    'visual': "Try using diagrams and visual aids to understand the concepts better.",
+    'auditory': "Consider watching video explanations or using verbal reasoning.",
+}
+_KINESTHETIC_TIP = "Practice with hands-on exercises and interactive problems."
+_PROGRESSING = (
+    "You're doing well! Practice more to master these concepts.",
+    "Try solving similar problems with different variations.",
+)
+_EXCELLENT = "Excellent work! You're ready for more challenging problems."
+_NEXT_LEVEL = "Consider moving to the next difficulty level."
+_MASTERED_LEVEL = "You've mastered the {subject} content at this level!".format
+
+_EXPLANATIONS = {
+    'visual': "Here's a visual representation of {concept} in {topic}...".format,
+    'auditory': "Let me explain {concept} in {topic} step by step...".format,
+    'kinesthetic': "Let's work through {concept} in {topic} with some hands-on examples...".format,
+}
+_GENERAL_EXPLANATION = "Here's a general explanation..."
+
+_CORRECT = "Question {number}: Correct!".format
+_INCORRECT = "Question {number}: Incorrect. {explanation}".format
+
+_CONGRATULATIONS = "Congratulations! You've mastered: {subjects}".format
+FOCUS_ON_SUBJECT = "Consider focusing more on {subject}, your average score is {score:.1f}%".format
+EXCELLING_IN_SUBJECT = "You're excelling in {subject} with an average of {score:.1f}%".format
+ENCOURAGE_MASTERY = "Focus on mastering at least one topic to build confidence"
+_CONTINUE_STYLE = {
+    style: f"Continue utilizing your {style} learning style" for style in ('visual', 'auditory', 'kinesthetic')
+}
+
+
+def score_band(score: float) -> int:
+    if score < 60:
+        return NEEDS_REVIEW
+    if score < 80:
+        return PROGRESSING
+    return EXCELLING
+
+
+@lru_cache(maxsize=4096)
+def quiz_recommendations(subject: str, band: int, learning_style: Optional[str], at_hardest_level: bool) -> Tuple[str, ...]:
+    """Recommendations after a quiz, keyed by subject, score band, learning style and level."""
+    if band == NEEDS_REVIEW:
+        return _REVIEW_BASICS(subject=subject), _STYLE_TIPS.get(learning_style, _KINESTHETIC_TIP)
+    if band == PROGRESSING:
+        return _PROGRESSING
+    return _EXCELLENT, _MASTERED_LEVEL(subject=subject) if at_hardest_level else _NEXT_LEVEL
+
+
+@lru_cache(maxsize=4096)
+def explanation(topic: str, concept: str, learning_style: Optional[str]) -> str:
+    """The explanation for one learning style; the other styles are never formatted."""
+    render = _EXPLANATIONS.get(learning_style)
+    return render(concept=concept, topic=topic) if render else _GENERAL_EXPLANATION
+
+
+@lru_cache(maxsize=16384)
+def feedback_line(position: int, is_correct: bool, explanation_text: str) -> str:
+    """Feedback for the answer at a zero-based position in a quiz."""
+    if is_correct:
+        return _CORRECT(number=position + 1)
+    return _INCORRECT(number=position + 1, explanation=explanation_text)
+
+
+@lru_cache(maxsize=256)
+def congratulations(subjects: Tuple[str, ...]) -> str:
+    return _CONGRATULATIONS(subjects=", ".join(subjects))
+
+
+def continue_learning_style(learning_style: Optional[str]) -> Optional[str]:
+    return _CONTINUE_STYLE.get(learning_style)
+
+
+class LazyFeedback(Sequence):
+    """
+    Per-question feedback that is only rendered when read. Holds the
+    correctness flags and explanations, and compares equal to the list of
+    lines evaluate_quiz would otherwise return.
+    """
+    __slots__ = ('_flags', '_explanations', '_lines')
+
+    def __init__(self, flags: List[bool], explanations: List[str]):
+        self._flags = flags
+        self._explanations = explanations
+        self._lines: Optional[List[str]] = None
+
+    def _render(self) -> List[str]:
+        if self._lines is None:
+            self._lines = [feedback_line(position, is_correct, text)
+                           for position, (is_correct, text) in enumerate(zip(self._flags, self._explanations))]
+        return self._lines
+
+    def __getitem__(self, index):
+        return self._render()[index]
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyFeedback)):
+            return self._render() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._render())
+
+
+def cache_info() -> Dict[str, Tuple]:
+    """Hit/miss counts of the template memo caches."""
+    return {
+        'quiz_recommendations': quiz_recommendations.cache_info(),
+        'explanation': explanation.cache_info(),
+        'feedback_line': feedback_line.cache_info(),
+        'congratulations': congratulations.cache_info(),
+    }
@@ -0,0 +1,9 @@
+import tempfile
+import unittest
+
+
+def temporary_directory(test: unittest.TestCase) -> str:
+    """A fresh directory that is removed, with everything in it, when the test ends."""
+    directory = tempfile.TemporaryDirectory()
+    test.addCleanup(directory.cleanup)
+    return directory.name
@@ -0,0 +1,114 @@
+import unittest
+
+from educational_ai_agent import ActivityTracker, Clock, EducationalAIAgent, FileStorage
+
+from support import temporary_directory
+
+START = 1700000000
+
+
+class ClockTest(unittest.TestCase):
+
+    def test_wall_clock_changes_do_not_reorder_timestamps(self):
+        wall = [START + 0.5]
+        ticks = [100.0]
+        clock = Clock(wall=lambda: wall[0], monotonic=lambda: ticks[0])
+        self.assertEqual(clock.now(), START)
+        wall[0] -= 3600
+        ticks[0] += 2
+        self.assertEqual(clock.now(), START + 2)
+
+
+class ActivityTrackerTest(unittest.TestCase):
+
+    def test_touches_coalesce_per_student(self):
+        tracker = ActivityTracker(flush_every=3, flush_interval=60)
+        self.assertFalse(tracker.touch('s0', 10))
+        self.assertFalse(tracker.touch('s0', 20))
+        self.assertFalse(tracker.touch('s1', 30))
+        self.assertEqual(len(tracker), 2)
+        self.assertTrue(tracker.touch('s2', 30))
+        self.assertEqual(tracker.take(), {'s0': 20, 's1': 30, 's2': 30})
+        self.assertEqual(len(tracker), 0)
+
+    def test_oldest_update_sets_the_interval(self):
+        tracker = ActivityTracker(flush_every=100, flush_interval=60)
+        self.assertFalse(tracker.touch('s0', 10))
+        self.assertFalse(tracker.touch('s0', 69))
+        self.assertTrue(tracker.touch('s1', 70))
+        tracker.take()
+        self.assertFalse(tracker.touch('s1', 71))
+
+
+class AgentActivityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = temporary_directory(self)
+        self.ticks = 0.0
+        self.clock = Clock(wall=lambda: START, monotonic=lambda: self.ticks)
+
+    def _agent(self, **kwargs):
+        storage = FileStorage(self.directory)
+        events = []
+        append = storage.append
+        storage.append = lambda event: events.append(event) or append(event)
+        return EducationalAIAgent(storage=storage, clock=self.clock, **kwargs), events
+
+    def _activity(self, events):
+        return [event['last_activity'] for event in events if event['type'] == 'activity']
+
+    def test_reads_are_logged_as_one_event_per_flush(self):
+        agent, events = self._agent()
+        agent.create_student_profile('s0', 'S0')
+        agent.create_student_profile('s1', 'S1')
+        for tick in range(3):
+            self.ticks = tick
+            agent.track_progress('s0')
+        agent.provide_explanation('math', 'addition', 's1')
+        self.assertEqual(self._activity(events), [])
+        agent.flush_activity()
+        self.assertEqual(self._activity(events), [{'s0': START + 2, 's1': START + 2}])
+        agent.close()
+
+    def test_untracked_reads_log_nothing(self):
+        agent, events = self._agent(activity=ActivityTracker(track_reads=False))
+        agent.create_student_profile('s0', 'S0')
+        self.ticks = 30
+        agent.track_progress('s0')
+        agent.provide_explanation('math', 'addition', 's0')
+        self.assertEqual(agent.student_profiles['s0'].last_activity, START)
+        logged = len(events)
+        agent.close()
+        self.assertEqual(len(events), logged)
+
+    def test_last_activity_survives_a_restart(self):
+        agent, _ = self._agent(activity=ActivityTracker(track_reads=False))
+        agent.create_student_profile('s0', 'S0')
+        agent.create_student_profile('s1', 'S1')
+        self.ticks = 50
+        agent.generate_quiz('s0', 'math')
+        agent.close()
+
+        restored, _ = self._agent()
+        self.assertEqual(restored.student_profiles['s0'].last_activity, START + 50)
+        self.assertEqual(restored.student_profiles['s1'].last_activity, START)
+        restored.close()
+
+    def test_replay_keeps_a_later_attempt(self):
+        agent, events = self._agent()
+        agent.create_student_profile('s0', 'S0')
+        self.ticks = 10
+        quiz = agent.generate_quiz('s0', 'math')
+        self.ticks = 20
+        agent.evaluate_quiz('s0', 'math', [question['answer'] for question in quiz], quiz.session_id)
+        agent.close()
+        # The touch from generate_quiz is flushed after the attempt that follows it
+        self.assertEqual([event['type'] for event in events][-2:], ['attempt', 'activity'])
+
+        restored, _ = self._agent()
+        self.assertEqual(restored.student_profiles['s0'].last_activity, START + 20)
+        restored.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
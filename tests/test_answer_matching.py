@@ -0,0 +1,80 @@
+import unittest
+
+from educational_ai_agent.answer_matching import EquationKey, ExactKey, NumericKey, TextKey, compile_answer
+
+
+class NumericKeyTest(unittest.TestCase):
+
+    def test_tolerance_is_half_a_unit_in_the_last_place(self):
+        key = compile_answer(9.8)
+        self.assertIsInstance(key, NumericKey)
+        for answer in (9.8, 9.75, 9.81, 9.85, '9.8', ' 9.84 ', '9.80'):
+            self.assertTrue(key.matches(answer), answer)
+        for answer in (9.7499, 9.8501, 10, '9.9', 'nine point eight'):
+            self.assertFalse(key.matches(answer), answer)
+
+    def test_integers_match_exactly(self):
+        key = compile_answer(12)
+        for answer in (12, 12.0, '12', '12.0', '1.2e1'):
+            self.assertTrue(key.matches(answer), answer)
+        for answer in (12.01, 11.99, '12.5', 'twelve', None, [12]):
+            self.assertFalse(key.matches(answer), answer)
+
+    def test_numeric_string_answer_keys(self):
+        key = compile_answer('0.25')
+        self.assertIsInstance(key, NumericKey)
+        self.assertTrue(key.matches(0.254))
+        self.assertFalse(key.matches(0.256))
+        self.assertFalse(compile_answer('5').matches('nan'))
+
+
+class TextKeyTest(unittest.TestCase):
+
+    def test_case_and_whitespace_are_ignored(self):
+        key = compile_answer("Newton's Second Law")
+        self.assertIsInstance(key, TextKey)
+        for answer in ("Newton's Second Law", "newton's second law", "  NEWTON'S   second\tlaw "):
+            self.assertTrue(key.matches(answer), answer)
+        for answer in ("Newtons Second Law", 'Newton', 2):
+            self.assertFalse(key.matches(answer), answer)
+
+    def test_equals_sign_is_text_not_an_equation(self):
+        key = compile_answer('V = IR')
+        self.assertIsInstance(key, TextKey)
+        self.assertTrue(key.matches('v = ir'))
+        self.assertTrue(key.matches('V=IR'.replace('=', ' = ')))
+        self.assertFalse(key.matches('V = I'))
+
+
+class EquationKeyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.key = compile_answer('4 Fe + 3 O2 → 2 Fe2O3')
+
+    def test_compiles_to_an_equation(self):
+        self.assertIsInstance(self.key, EquationKey)
+
+    def test_spacing_arrow_and_term_order_are_ignored(self):
+        for answer in ('4 Fe + 3 O2 → 2 Fe2O3', '4Fe+3O2->2Fe2O3', '3 O2 + 4 Fe ⟶ 2 Fe2O3'):
+            self.assertTrue(self.key.matches(answer), answer)
+
+    def test_case_insensitive_as_text(self):
+        self.assertTrue(self.key.matches('4 fe + 3 o2 → 2 fe2o3'))
+        self.assertTrue(self.key.matches('4 FE + 3 O2 → 2 FE2O3'))
+
+    def test_wrong_coefficients_or_sides_are_rejected(self):
+        for answer in ('2 Fe + 3 O2 → 2 Fe2O3', '2 Fe2O3 → 4 Fe + 3 O2', '4 Fe + 3 O2 = 2 Fe2O3', 4):
+            self.assertFalse(self.key.matches(answer), answer)
+
+
+class ExactKeyTest(unittest.TestCase):
+
+    def test_other_answers_compare_equal(self):
+        key = compile_answer([1, 2])
+        self.assertIsInstance(key, ExactKey)
+        self.assertTrue(key.matches([1, 2]))
+        self.assertFalse(key.matches((1, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import unittest
+
+from educational_ai_agent import EducationalAIAgent, FileStorage, bulk
+
+from support import temporary_directory
+
+
+class ImportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = temporary_directory(self)
+
+    def _agent(self):
+        return EducationalAIAgent(storage=FileStorage(os.path.join(self.directory, 'log')), snapshot_every=100)
+
+    def test_import_snapshots_once_at_the_end(self):
+        agent = self._agent()
+        snapshots = []
+        take_snapshot = agent.snapshot
+        agent.snapshot = lambda: snapshots.append(agent._events_since_snapshot) or take_snapshot()
+        rows = [(f's{index:04d}', {'name': f'Student {index}'}) for index in range(1000)]
+        self.assertEqual(bulk.import_profiles(agent, rows, chunk_size=64), (1000, 's0999'))
+        self.assertEqual(snapshots, [1000])
+        # Snapshots are due again as usual once the import is over
+        for index in range(100):
+            agent.create_student_profile(f't{index}', 'T')
+        self.assertEqual(snapshots, [1000, 100])
+        agent.close()
+
+        restored = self._agent()
+        self.assertEqual(len(restored.student_profiles), 1100)
+        restored.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
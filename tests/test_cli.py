@@ -0,0 +1,66 @@
+import io
+import json
+import unittest
+
+from educational_ai_agent import EducationalAIAgent
+from educational_ai_agent.cli import grade
+
+
+def run_grade(agent, submissions):
+    """Grade submissions through the CLI; returns the failed line count and the output rows."""
+    output = io.StringIO()
+    failed = grade(agent, io.StringIO('\n'.join(json.dumps(submission) for submission in submissions)), output)
+    return failed, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class GradeTest(unittest.TestCase):
+
+    def test_bad_answers_fail_their_line_only(self):
+        failed, rows = run_grade(EducationalAIAgent(), [
+            {'student_id': 's0', 'subject': 'math', 'answers': [12, 7], 'question_ids': [0, 1]},
+            {'student_id': 's1', 'subject': 'math', 'answers': [], 'question_ids': [0, 1]},
+            {'student_id': 's1', 'subject': 'math', 'answers': '12', 'question_ids': [0, 1]},
+            {'student_id': 's1', 'subject': 'math', 'answers': [12, 7], 'question_ids': [0, 1]},
+        ])
+        self.assertEqual(failed, 2)
+        self.assertEqual([row['line'] for row in rows], [1, 2, 3, 4])
+        self.assertEqual([row.get('score') for row in rows], [100.0, None, None, 100.0])
+        self.assertEqual(rows[1]['error'], 'answers must be a non-empty list')
+
+    def test_lines_grade_against_their_own_questions(self):
+        agent = EducationalAIAgent()
+        failed, rows = run_grade(agent, [
+            {'student_id': 's0', 'subject': 'math', 'answers': [12, 7]},
+            {'student_id': 's0', 'subject': 'math', 'answers': [60, 9], 'question_ids': [2, 3]},
+            {'student_id': 's0', 'subject': 'math', 'answers': [12, 7], 'question_ids': [6, 7]},
+            {'student_id': 's0', 'subject': 'math', 'answers': [12, 7], 'question_ids': [0, 1]},
+        ])
+        self.assertEqual(failed, 2)
+        self.assertEqual(rows[0]['error'], "missing or unknown 'question_ids'")
+        self.assertEqual(rows[2]['error'], 'unknown math question id 6')
+        self.assertEqual([row.get('score') for row in rows], [None, 100.0, None, 100.0])
+        self.assertEqual(agent.track_progress('s0')['total_quizzes_taken'], 2)
+
+    def test_a_rejected_chunk_is_graded_line_by_line(self):
+        # Sessions expire as soon as they are opened, so the batch refuses the whole chunk
+        failed, rows = run_grade(EducationalAIAgent(quiz_session_ttl=0.0), [
+            {'student_id': 's0', 'subject': 'math', 'answers': [12, 7], 'question_ids': [0, 1]},
+            {'student_id': 's1', 'subject': 'math', 'answers': [12, 7], 'question_ids': [0, 1]},
+        ])
+        self.assertEqual(failed, 2)
+        self.assertEqual([row['line'] for row in rows], [1, 2])
+        self.assertTrue(all('error' in row for row in rows))
+
+    def test_agent_rejects_a_batch_with_empty_answers(self):
+        agent = EducationalAIAgent()
+        agent.create_student_profile('s0', 'S0')
+        with self.assertRaises(ValueError):
+            agent.evaluate_quiz_batch([('s0', 'math', [12, 7]), ('s0', 'math', [])])
+        with self.assertRaises(ValueError):
+            agent.evaluate_quiz('s0', 'math', [])
+        # The valid submission ahead of the bad one was not graded either
+        self.assertEqual(agent.track_progress('s0')['total_quizzes_taken'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from educational_ai_agent import CohortAnalytics, EducationalAIAgent
+
+
+class CohortAnalyticsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = EducationalAIAgent()
+        self.student_ids = [f's{index}' for index in range(30)]
+        for student_id in self.student_ids:
+            self.agent.create_student_profile(student_id, student_id.upper())
+
+    def _grade(self, student_id, answers):
+        session_id = self.agent.quiz_sessions.open(student_id, 'math', (0, 1, 2))
+        self.agent.evaluate_quiz(student_id, 'math', answers, session_id)
+
+    def test_incremental_report_matches_a_fresh_one(self):
+        analytics = CohortAnalytics(self.agent)
+        analytics.report(self.student_ids)
+        # Thirds, two thirds and whole scores give averages that do not add up exactly in floating point
+        answer_sets = ([12, 0, 0], [12, 7, 0], [12, 7, 60], [0, 0, 0])
+        for round_number in range(20):
+            for index, student_id in enumerate(self.student_ids):
+                self._grade(student_id, answer_sets[index * (round_number + 1) % len(answer_sets)])
+        incremental = analytics.report(self.student_ids)
+        self.assertEqual(analytics.stats()['misses'], 1)
+        self.assertEqual(incremental, CohortAnalytics(self.agent).report(self.student_ids))
+
+    def test_subjects_without_scores_are_left_out(self):
+        self._grade('s0', [12, 7, 60])
+        report = CohortAnalytics(self.agent).report(['s0', 's1'])
+        self.assertEqual(report['average_scores'], {'math': 100.0})
+        self.assertEqual(report['students'], 2)
+        with self.assertRaises(KeyError):
+            CohortAnalytics(self.agent).report(['s0', 'nobody'])
+
+
+if __name__ == '__main__':
+    unittest.main()
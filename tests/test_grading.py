@@ -0,0 +1,66 @@
+import unittest
+
+from educational_ai_agent import AgentInstrumentation, Clock, EducationalAIAgent
+from educational_ai_agent.agent import BATCH_SLICE
+
+# (student_id, subject, answers, issued question ids); s1 appears twice and moves up a level in between
+SUBMISSIONS = [
+    ('s0', 'math', [12, 7], (0, 1)),
+    ('s1', 'math', ['12', 7.0], (0, 1)),
+    ('s2', 'physics', ['newton', 'no idea'], (6, 7)),
+    ('s1', 'math', [60, [9]], (2, 3)),
+    ('s0', 'math', [True, 1], (0, 1)),
+    ('s2', 'chemistry', ['h2o', 8, 7], (12, 13, 14)),
+]
+
+
+class BatchGradingTest(unittest.TestCase):
+
+    def _agent(self):
+        agent = EducationalAIAgent(clock=Clock(wall=lambda: 1700000000.0, monotonic=lambda: 0.0))
+        for student_id in ('s0', 's1', 's2'):
+            agent.create_student_profile(student_id, student_id.upper())
+        return agent
+
+    def _submissions(self, agent):
+        return [(student_id, subject, answers, agent.quiz_sessions.open(student_id, subject, question_ids))
+                for student_id, subject, answers, question_ids in SUBMISSIONS]
+
+    def test_batch_matches_one_call_at_a_time(self):
+        one_at_a_time = self._agent()
+        expected = [one_at_a_time.evaluate_quiz(*submission) for submission in self._submissions(one_at_a_time)]
+
+        for pause_gc in (False, True):
+            batched = self._agent()
+            self.assertEqual(batched.evaluate_quiz_batch(self._submissions(batched), pause_gc=pause_gc), expected)
+            for student_id in ('s0', 's1', 's2'):
+                self.assertEqual(batched.track_progress(student_id), one_at_a_time.track_progress(student_id))
+                self.assertEqual(list(batched.attempt_history(student_id)),
+                                 list(one_at_a_time.attempt_history(student_id)))
+
+    def test_rounds_larger_than_a_slice_match(self):
+        student_ids = [f'p{index}' for index in range(BATCH_SLICE + 3)]
+        agents = []
+        for _ in range(2):
+            agent = self._agent()
+            for index, student_id in enumerate(student_ids):
+                agent.create_student_profile(student_id, student_id)
+            agents.append(agent)
+        # Alternate right and wrong answers so neighbouring students end on different levels
+        submissions = [[(student_id, 'math', [12 + index % 2, 7], agent.quiz_sessions.open(student_id, 'math', (0, 1)))
+                        for index, student_id in enumerate(student_ids)] for agent in agents]
+        expected = [agents[0].evaluate_quiz(*submission) for submission in submissions[0]]
+        self.assertEqual(agents[1].evaluate_quiz_batch(submissions[1]), expected)
+
+    def test_batch_answers_are_counted(self):
+        agent = self._agent()
+        instrumentation = AgentInstrumentation(agent).enable()
+        agent.evaluate_quiz_batch(self._submissions(agent))
+        self.assertEqual(instrumentation.counters(), {
+            'attempts_recorded': len(SUBMISSIONS),
+            'answers_graded': sum(len(answers) for _, _, answers, _ in SUBMISSIONS),
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
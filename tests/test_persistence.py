@@ -0,0 +1,98 @@
+import os
+import unittest
+
+from educational_ai_agent import EducationalAIAgent, FileStorage, SQLiteStorage
+
+from support import temporary_directory
+
+
+def _segment(directory):
+    return sorted(name for name in os.listdir(directory) if name.startswith('log-'))[-1]
+
+
+class FileStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = temporary_directory(self)
+
+    def test_replays_events_after_restart(self):
+        agent = EducationalAIAgent(storage=FileStorage(self.directory))
+        agent.create_student_profile('s0', 'S0')
+        agent.generate_quiz('s0', 'math')
+        agent.evaluate_quiz('s0', 'math', [12, 7])
+        expected = agent.student_profiles['s0'].to_record()
+        agent.close()
+
+        restored = EducationalAIAgent(storage=FileStorage(self.directory))
+        self.assertEqual(restored.student_profiles['s0'].to_record(), expected)
+        restored.close()
+
+    def test_replays_snapshot_and_tail(self):
+        agent = EducationalAIAgent(storage=FileStorage(self.directory), snapshot_every=5)
+        for i in range(12):
+            agent.create_student_profile(f's{i}', f'S{i}')
+        agent.close()
+
+        restored = EducationalAIAgent(storage=FileStorage(self.directory))
+        self.assertEqual(sorted(restored.student_profiles), sorted(f's{i}' for i in range(12)))
+        restored.close()
+
+    def test_events_after_torn_line_survive_restart(self):
+        agent = EducationalAIAgent(storage=FileStorage(self.directory))
+        for i in range(5):
+            agent.create_student_profile(f's{i}', f'S{i}')
+        agent.close()
+        # A crash in the middle of writing an event leaves a partial line
+        with open(os.path.join(self.directory, _segment(self.directory)), 'a', encoding='utf-8') as segment:
+            segment.write('{"seq":6,"type":"prof')
+
+        agent = EducationalAIAgent(storage=FileStorage(self.directory))
+        for i in range(5, 10):
+            agent.create_student_profile(f's{i}', f'S{i}')
+        agent.close()
+
+        restored = EducationalAIAgent(storage=FileStorage(self.directory))
+        self.assertEqual(sorted(restored.student_profiles), sorted(f's{i}' for i in range(10)))
+        restored.close()
+
+
+class SQLiteStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(temporary_directory(self), 'agent.db')
+
+    def test_replays_snapshot_and_tail(self):
+        agent = EducationalAIAgent(storage=SQLiteStorage(self.path), snapshot_every=5)
+        for i in range(12):
+            agent.create_student_profile(f's{i}', f'S{i}')
+        agent.generate_quiz('s3', 'math')
+        agent.evaluate_quiz('s3', 'math', [12, 7])
+        expected = agent.student_profiles['s3'].to_record()
+        agent.close()
+
+        restored = EducationalAIAgent(storage=SQLiteStorage(self.path))
+        self.assertEqual(len(restored.student_profiles), 12)
+        self.assertEqual(restored.student_profiles['s3'].to_record(), expected)
+        restored.close()
+
+    def test_snapshot_again_without_new_events(self):
+        agent = EducationalAIAgent(storage=SQLiteStorage(self.path))
+        agent.create_student_profile('s0', 'S0')
+        agent.snapshot()
+        agent.generate_quiz('s0', 'math')
+        # Only last_activity changed, which is not logged until the next flush
+        agent.snapshot()
+        expected = agent.student_profiles['s0'].to_record()
+        agent.close()
+
+        restored = EducationalAIAgent(storage=SQLiteStorage(self.path))
+        restored.snapshot()
+        self.assertEqual(restored.student_profiles['s0'].to_record(), expected)
+        restored.close()
+        restored = EducationalAIAgent(storage=SQLiteStorage(self.path))
+        self.assertEqual(restored.student_profiles['s0'].to_record(), expected)
+        restored.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from educational_ai_agent import EducationalAIAgent, QuizAttempt
+from educational_ai_agent.records import MAX_ANSWERS, AttemptLog
+
+
+class AttemptLogTest(unittest.TestCase):
+
+    def test_append_that_overflows_changes_no_column(self):
+        attempts = AttemptLog()
+        attempts.append(QuizAttempt(1, 0, 0, 100.0, (0, 1), (12, 7), 0b11))
+        with self.assertRaises(OverflowError):
+            attempts.append(QuizAttempt(2, 0, 0, 100.0, tuple(range(65)), (12,) * 65, (1 << 65) - 1))
+        self.assertEqual(len(attempts), 1)
+        self.assertEqual(attempts.summarized, 0)
+        self.assertEqual(list(attempts), [QuizAttempt(1, 0, 0, 100.0, (0, 1), (12, 7), 0b11)])
+
+
+class AnswerLimitTest(unittest.TestCase):
+
+    def test_more_answers_than_the_mask_holds_are_rejected(self):
+        agent = EducationalAIAgent()
+        agent.create_student_profile('s0', 'S0')
+        question_ids = tuple(agent.question_store.question_ids('math', 'easy')) * 33
+        answers = [12, 7] * 33
+        session_id = agent.quiz_sessions.open('s0', 'math', question_ids)
+        with self.assertRaises(ValueError):
+            agent.evaluate_quiz('s0', 'math', answers, session_id)
+        with self.assertRaises(ValueError):
+            agent.evaluate_quiz_batch([('s0', 'math', answers, session_id)])
+        profile = agent.student_profiles['s0']
+        self.assertEqual((len(profile.attempts), profile.current_level['math']), (0, 'easy'))
+
+        result = agent.evaluate_quiz('s0', 'math', answers[:MAX_ANSWERS], session_id)
+        self.assertEqual(result['score'], 100.0)
+        self.assertEqual(agent.student_profiles['s0'].attempts[0].correct, (1 << MAX_ANSWERS) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
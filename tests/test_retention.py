@@ -0,0 +1,45 @@
+import os
+import unittest
+
+from educational_ai_agent import AttemptArchive, EducationalAIAgent, FileStorage, RetentionPolicy
+
+from support import temporary_directory
+
+
+class RetentionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = temporary_directory(self)
+
+    def _agent(self):
+        archive = AttemptArchive(os.path.join(self.directory, 'attempts.db'), commit_batch=1000)
+        return EducationalAIAgent(storage=FileStorage(os.path.join(self.directory, 'log')),
+                                  retention=RetentionPolicy(keep_detailed=4, keep_summaries=0, archive=archive))
+
+    def test_history_is_complete_after_compaction(self):
+        agent = self._agent()
+        agent.create_student_profile('s0', 'S0')
+        for _ in range(100):
+            agent.generate_quiz('s0', 'math')
+            agent.evaluate_quiz('s0', 'math', [12, 7])
+        self.assertEqual(len(list(agent.attempt_history('s0'))), 100)
+        self.assertEqual(agent.track_progress('s0')['total_quizzes_taken'], 100)
+        agent.close()
+
+    def test_snapshot_makes_archived_attempts_durable(self):
+        agent = self._agent()
+        agent.create_student_profile('s0', 'S0')
+        for _ in range(100):
+            agent.generate_quiz('s0', 'math')
+            agent.evaluate_quiz('s0', 'math', [12, 7])
+        agent.snapshot()
+        # Crash: the archive's uncommitted rows are rolled back and nothing else is flushed
+        agent.retention.archive._conn.close()
+
+        restored = self._agent()
+        self.assertEqual(len(list(restored.attempt_history('s0'))), 100)
+        restored.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import random
+import unittest
+from collections import Counter
+
+from educational_ai_agent import EducationalAIAgent, FileStorage, QuestionStore, bulk
+from educational_ai_agent.question_store import LEVELS
+from educational_ai_agent.records import QuizAttempt, StudentProfile
+from educational_ai_agent.selection import MASTERED_WEIGHT, AdaptiveSelector, WeightTree
+
+from support import temporary_directory
+
+SUBJECTS = ['math']
+# Ten questions per level; the easy pool holds ids 0 to 9
+BANK = {'math': {level: [{'question': f'{level} {index}', 'answer': index, 'explanation': f'It is {index}'}
+                         for index in range(10)]
+                 for level in LEVELS}}
+
+
+class WeightTreeTest(unittest.TestCase):
+
+    def test_find_follows_the_cumulative_weights(self):
+        tree = WeightTree(10)
+        weights = [1.0] * 10
+        for position, weight in ((0, 0.5), (3, MASTERED_WEIGHT), (7, 0.0), (9, 2.0)):
+            tree.set(position, weight)
+            weights[position] = weight
+        self.assertAlmostEqual(tree.total, sum(weights))
+        start = 0.0
+        for position, weight in enumerate(weights):
+            if weight:
+                self.assertEqual(tree.find(start + weight / 2), position)
+            start += weight
+
+
+class AdaptiveSelectorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = QuestionStore.from_dict(BANK)
+        self.profile = StudentProfile.new('S0', SUBJECTS, 0)
+
+    def _selector(self, seed):
+        return AdaptiveSelector(self.store, random.Random(seed))
+
+    def _record(self, selector, question_ids, correct):
+        mask = (1 << len(question_ids)) - 1 if correct else 0
+        selector.record('s0', self.profile.subjects, QuizAttempt(
+            1, 0, 0, 100.0 if correct else 0.0, tuple(question_ids), tuple(question_ids), mask))
+
+    def test_picks_are_distinct(self):
+        for seed in range(50):
+            selector = self._selector(seed)
+            selector.select('s0', self.profile, 'math', 'easy', 3)
+            self._record(selector, [0, 1, 2], correct=True)
+            self._record(selector, [3, 4], correct=False)
+            for k in (3, 10, 15):
+                picks = selector.select('s0', self.profile, 'math', 'easy', k)
+                self.assertEqual(len(picks), min(k, 10))
+                self.assertEqual(len(set(picks)), len(picks))
+                self.assertTrue(set(picks) <= set(range(10)))
+
+    def test_missed_and_unseen_questions_are_favoured(self):
+        selector = self._selector(0)
+        selector.select('s0', self.profile, 'math', 'easy', 3)
+        for _ in range(5):
+            self._record(selector, [0, 1, 2], correct=True)
+        self._record(selector, [3, 4, 5], correct=False)
+        drawn = Counter(question_id for _ in range(2000)
+                        for question_id in selector.select('s0', self.profile, 'math', 'easy', 1))
+        mastered = max(drawn[question_id] for question_id in (0, 1, 2))
+        for question_id in range(3, 10):
+            self.assertGreater(drawn[question_id], 5 * mastered)
+
+    def test_stats_count_every_answered_question(self):
+        selector = self._selector(0)
+        self._record(selector, [0, 1], correct=True)
+        self._record(selector, [1], correct=False)
+        self.assertEqual(selector.question_stats(1), {'times_seen': 2, 'correct_rate': 0.5, 'last_seen': 1})
+        self.assertEqual(selector.question_stats(5), {'times_seen': 0, 'correct_rate': None, 'last_seen': None})
+
+
+class StatsRebuildTest(unittest.TestCase):
+
+    def _agent(self, **kwargs):
+        agent = EducationalAIAgent(question_store=QuestionStore.from_dict(BANK), **kwargs)
+        agent.create_student_profile('s0', 'S0')
+        return agent
+
+    def _grade(self, agent, question_ids, answers):
+        session_id = agent.quiz_sessions.open('s0', 'math', tuple(question_ids))
+        agent.evaluate_quiz('s0', 'math', answers, session_id)
+
+    def _student_stats(self, agent, question_id):
+        return agent.selector.student_question_stats('s0', agent.student_profiles['s0'], question_id)
+
+    def test_stats_are_rebuilt_after_restore(self):
+        directory = temporary_directory(self)
+        agent = self._agent(storage=FileStorage(directory))
+        agent.generate_quiz('s0', 'math')
+        self._grade(agent, [0, 1], [0, 0])
+        self._grade(agent, [1, 2], [1, 0])
+        expected = [(agent.selector.question_stats(question_id), self._student_stats(agent, question_id))
+                    for question_id in range(4)]
+        agent.close()
+
+        restored = EducationalAIAgent(question_store=QuestionStore.from_dict(BANK), storage=FileStorage(directory))
+        self.assertEqual([(restored.selector.question_stats(question_id), self._student_stats(restored, question_id))
+                          for question_id in range(4)], expected)
+        self.assertEqual(self._student_stats(restored, 1)['times_seen'], 2)
+        restored.close()
+
+    def test_import_replaces_stats_already_built(self):
+        source = self._agent()
+        self._grade(source, [0, 1], [0, 1])
+        target = self._agent()
+        target.generate_quiz('s0', 'math')
+        self._grade(target, [2, 3], [0, 0])
+        self.assertEqual(self._student_stats(target, 2)['times_seen'], 1)
+
+        bulk.import_profiles(target, [('s0', source.student_profiles['s0'].to_record())])
+        self.assertEqual(self._student_stats(target, 0), self._student_stats(source, 0))
+        self.assertEqual(self._student_stats(target, 2)['times_seen'], 0)
+        # Question statistics across students keep the replaced history and add the imported one
+        self.assertEqual(target.selector.question_stats(0)['times_seen'], 1)
+        self.assertEqual(target.selector.question_stats(2)['times_seen'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
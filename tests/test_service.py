@@ -0,0 +1,62 @@
+import asyncio
+import json
+import unittest
+
+from educational_ai_agent import AgentService, EducationalAIAgent
+
+
+class AgentServiceTest(unittest.TestCase):
+
+    def test_oversized_lines_do_not_leak_slots(self):
+        async def scenario():
+            service = AgentService(EducationalAIAgent(), max_in_flight=2, workers=2)
+            server = await service.start('127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                for _ in range(3):
+                    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                    writer.write(b'x' * (1 << 17) + b'\n')
+                    await writer.drain()
+                    reply = json.loads(await asyncio.wait_for(reader.readline(), 5))
+                    self.assertEqual(reply['error'], 'Request line too long')
+                    writer.close()
+
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(json.dumps({'id': 1, 'method': 'stats'}).encode() + b'\n')
+                await writer.drain()
+                reply = json.loads(await asyncio.wait_for(reader.readline(), 5))
+                self.assertEqual(reply['id'], 1)
+                self.assertEqual(reply['result']['rejected'], 3)
+                writer.close()
+            finally:
+                await service.close()
+
+        asyncio.run(scenario())
+
+    def test_requests_that_are_not_objects_are_rejected(self):
+        async def scenario():
+            service = AgentService(EducationalAIAgent(), max_in_flight=2, workers=2)
+            server = await service.start('127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                for line in (b'[1, 2]', b'5', b'"stats"', b'{"id": 7, "method": "track_progress", "params": [1]}'):
+                    writer.write(line + b'\n')
+                    await writer.drain()
+                    reply = json.loads(await asyncio.wait_for(reader.readline(), 5))
+                    self.assertIn('error', reply)
+                self.assertEqual(reply['id'], 7)
+
+                writer.write(json.dumps({'id': 8, 'method': 'stats'}).encode() + b'\n')
+                await writer.drain()
+                reply = json.loads(await asyncio.wait_for(reader.readline(), 5))
+                self.assertEqual(reply['result']['rejected'], 4)
+                writer.close()
+            finally:
+                await service.close()
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from educational_ai_agent import EducationalAIAgent
+from educational_ai_agent.sessions import QuizSessionCache
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class QuizSessionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sessions = QuizSessionCache(max_sessions=3, ttl=60.0, clock=self.clock)
+
+    def test_take_counts_hits_and_misses(self):
+        session_id = self.sessions.open('s0', 'math', (0, 1))
+        self.assertEqual(self.sessions.take(session_id).question_ids, (0, 1))
+        self.assertIsNone(self.sessions.take(session_id))
+        self.assertIsNone(self.sessions.take_latest('s0', 'math'))
+        self.assertEqual(self.sessions.stats(),
+                         {'open': 0, 'hits': 1, 'misses': 2, 'evictions': 0, 'expirations': 0})
+
+    def test_sessions_expire_after_ttl(self):
+        expiring = self.sessions.open('s0', 'math', (0, 1))
+        self.clock.now = 30.0
+        fresh = self.sessions.open('s1', 'math', (0, 1))
+        self.clock.now = 60.0
+        self.assertIsNone(self.sessions.take(expiring))
+        self.assertIsNotNone(self.sessions.take(fresh))
+        self.sessions.open('s2', 'math', (0, 1))
+        self.clock.now = 200.0
+        # Opening a session sweeps out the expired ones
+        self.sessions.open('s3', 'math', (0, 1))
+        self.assertEqual(len(self.sessions), 1)
+        self.assertEqual(self.sessions.stats()['expirations'], 2)
+
+    def test_oldest_session_is_evicted_at_capacity(self):
+        session_ids = [self.sessions.open(f's{index}', 'math', (0, 1)) for index in range(4)]
+        self.assertEqual(len(self.sessions), 3)
+        self.assertEqual(self.sessions.stats()['evictions'], 1)
+        self.assertIsNone(self.sessions.take(session_ids[0]))
+        self.assertIsNone(self.sessions.take_latest('s0', 'math'))
+        self.assertIsNotNone(self.sessions.take_latest('s1', 'math'))
+
+    def test_someone_elses_session_stays_open(self):
+        session_id = self.sessions.open('s0', 'math', (0, 1))
+        with self.assertRaises(ValueError):
+            self.sessions.take(session_id, 's1', 'math')
+        with self.assertRaises(ValueError):
+            self.sessions.take(session_id, 's0', 'physics')
+        self.assertEqual(self.sessions.take(session_id, 's0', 'math').question_ids, (0, 1))
+
+    def test_take_many_is_all_or_none(self):
+        first = self.sessions.open('s0', 'math', (0, 1))
+        self.sessions.open('s1', 'math', (2, 3))
+        with self.assertRaises(KeyError):
+            self.sessions.take_many([('s0', 'math', first), ('s1', 'math', None), ('s2', 'math', None)])
+        with self.assertRaises(KeyError):
+            self.sessions.take_many([('s0', 'math', first), ('s0', 'math', first)])
+        self.assertEqual(len(self.sessions), 2)
+        taken = self.sessions.take_many([('s0', 'math', first), ('s1', 'math', None)])
+        self.assertEqual([session.question_ids for session in taken], [(0, 1), (2, 3)])
+        self.assertEqual(len(self.sessions), 0)
+
+
+class EvaluateQuizSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = EducationalAIAgent()
+        self.agent.create_student_profile('s0', 'S0')
+        self.agent.create_student_profile('s1', 'S1')
+
+    def test_grading_without_an_issued_quiz_raises(self):
+        with self.assertRaises(KeyError):
+            self.agent.evaluate_quiz('s0', 'math', [12, 7])
+        with self.assertRaises(KeyError):
+            self.agent.evaluate_quiz_batch([('s0', 'math', [12, 7])])
+        self.assertEqual(self.agent.track_progress('s0')['total_quizzes_taken'], 0)
+
+    def test_grades_the_issued_questions(self):
+        quiz = self.agent.generate_quiz('s0', 'math')
+        result = self.agent.evaluate_quiz('s0', 'math', [question['answer'] for question in quiz])
+        self.assertEqual(result['score'], 100.0)
+        self.assertEqual([response['question'] for response in result['detailed_responses']],
+                         [question['question'] for question in quiz])
+
+    def test_mismatched_call_keeps_the_owners_session(self):
+        quiz = self.agent.generate_quiz('s0', 'math')
+        with self.assertRaises(ValueError):
+            self.agent.evaluate_quiz('s1', 'math', [12, 7], quiz.session_id)
+        answers = [question['answer'] for question in quiz]
+        self.assertEqual(self.agent.evaluate_quiz('s0', 'math', answers, quiz.session_id)['score'], 100.0)
+
+    def test_batch_grades_nothing_when_a_session_is_missing(self):
+        quiz = self.agent.generate_quiz('s0', 'math')
+        with self.assertRaises(KeyError):
+            self.agent.evaluate_quiz_batch([('s0', 'math', [12, 7], quiz.session_id), ('s1', 'math', [12, 7])])
+        self.assertEqual(self.agent.track_progress('s0')['total_quizzes_taken'], 0)
+        self.assertIsNotNone(self.agent.quiz_sessions.take(quiz.session_id))
+
+
+if __name__ == '__main__':
+    unittest.main()